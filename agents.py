@@ -9,6 +9,7 @@ from tools.file_operations_tool import (
    read_file_tool,
    create_directory_tool,
    list_directory_contents_tool,
+   search_files_tool,
    delete_file_tool,
    delete_directory_tool,
    move_path_tool,
@@ -44,7 +45,10 @@ from tools.text_summarization_tool import text_summarization_tool
 from tools.team_voting_tool import (
    trigger_democratic_decision_tool,
    submit_proposal_tool,
-   get_decision_status_tool
+   get_decision_status_tool,
+   submit_vote_tool,
+   bulk_submit_proposals_tool,
+   bulk_submit_votes_tool
 )
 
 # Import synthesis tools
@@ -54,6 +58,9 @@ from tools.synthesis_tools import (
    facilitate_reflection_tool
 )
 
+# Import keyword matcher for democracy trigger detection
+from tools.keyword_matcher import _keyword_matcher
+
 # Load environment variables
 load_dotenv()
 
@@ -146,6 +153,7 @@ project_manager_agent = Agent(
        read_file_tool,
        create_directory_tool,
        list_directory_contents_tool,
+       search_files_tool,
        delete_file_tool,
        delete_directory_tool,
        move_path_tool,
@@ -158,6 +166,8 @@ project_manager_agent = Agent(
        # Democratic decision-making
        trigger_democratic_decision_tool,
        get_decision_status_tool,
+       bulk_submit_proposals_tool,
+       bulk_submit_votes_tool,
        # Synthesis tools for PM-Grok tandem
        analyze_proposals_tool,
        facilitate_reflection_tool
@@ -195,6 +205,7 @@ developer_agent = Agent(
        read_file_tool,
        create_directory_tool,
        list_directory_contents_tool,
+       search_files_tool,
        delete_file_tool,
        delete_directory_tool,
        move_path_tool,
@@ -204,6 +215,7 @@ developer_agent = Agent(
        CodeInterpreterTool(),
        # Democratic participation
        submit_proposal_tool,
+       submit_vote_tool,
        get_decision_status_tool
    ],
    llm=claude_sonnet_llm # Verwendet das aktualisierte claude_sonnet_llm
@@ -241,6 +253,7 @@ researcher_agent = Agent(
        text_summarization_tool,
        # Democratic participation
        submit_proposal_tool,
+       submit_vote_tool,
        get_decision_status_tool
    ],
    llm=gemini_flash_llm
@@ -274,6 +287,7 @@ tester_agent = Agent(
        read_file_tool,
        write_file_tool,
        list_directory_contents_tool,
+       search_files_tool,
        secure_command_executor_tool,
        CodeInterpreterTool(),
        # Browser testing
@@ -287,6 +301,7 @@ tester_agent = Agent(
        stop_local_http_server_tool,
        # Democratic participation
        submit_proposal_tool,
+       submit_vote_tool,
        get_decision_status_tool
    ],
    llm=mistral_medium_llm
@@ -321,6 +336,7 @@ debug_agent = Agent(
        read_file_tool,
        write_file_tool,
        list_directory_contents_tool,
+       search_files_tool,
        secure_command_executor_tool,
        CodeInterpreterTool(),
        # Browser debugging
@@ -331,6 +347,7 @@ debug_agent = Agent(
        close_browser_tool,
        # Democratic participation
        submit_proposal_tool,
+       submit_vote_tool,
        get_decision_status_tool
    ],
    llm=codestral_llm
@@ -398,23 +415,23 @@ def should_trigger_democracy(context: str) -> tuple[bool, str, str]:
    Analyzes context to determine if a democratic decision should be triggered.
    Returns: (should_trigger, conflict_type, reason)
    """
-   context_lower = context.lower()
+   # Ein Durchlauf über den Kontext, Schlüsselwörter in der Taxonomie-Gruppe "democracy_triggers"
+   matches = _keyword_matcher.scan(context)
 
    # Architecture decisions
-   if any(keyword in context_lower for keyword in ['framework', 'library', 'architecture', 'database', 'api design']):
+   if matches.has("democracy_triggers", "architecture_decision"):
        return True, "architecture_decision", "Framework or architecture choice detected"
 
    # Performance vs features
-   if any(keyword in context_lower for keyword in ['performance', 'optimization', 'speed', 'memory']) and \
-      any(keyword in context_lower for keyword in ['feature', 'functionality', 'requirement']):
+   if matches.has("democracy_triggers", "performance") and matches.has("democracy_triggers", "features"):
        return True, "performance_tradeoff", "Performance vs features trade-off detected"
 
    # UX/UI decisions
-   if any(keyword in context_lower for keyword in ['ui', 'ux', 'design', 'interface', 'user experience', 'layout']):
+   if matches.has("democracy_triggers", "ux_ui_direction"):
        return True, "ux_ui_direction", "UX/UI design decision detected"
 
    # Agent disagreements (when multiple suggestions are present)
-   if context_lower.count('suggest') > 1 or context_lower.count('recommend') > 1:
+   if matches.count("democracy_triggers", "suggestion") > 1 or matches.count("democracy_triggers", "recommendation") > 1:
        return True, "agent_disagreement", "Multiple conflicting suggestions detected"
 
    return False, "", ""
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+IMAP Democracy Engine - Load Test & Benchmark
+=============================================
+
+Erzeugt synthetische Entscheidungen mit konfigurierbarer Zahl von Agents, Optionen
+und Stimmverteilungen (uniform, polarized, mallows) und treibt sie über die
+öffentliche API der Engine durch alle Phasen:
+
+    trigger -> proposals -> synthesis -> votes -> tally -> finalize
+
+Gemessen werden Durchsatz (ops/s) und p50/p99-Latenz pro API-Aufruf sowie der
+Speicherbedarf (tracemalloc, separater Durchlauf). Das Ergebnis wird als JSON
+ausgegeben, damit Releases mit `--baseline` gegeneinander verglichen werden können.
+
+Run with: python benchmark_democracy_engine.py --agents 5 50 --decisions 200 --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from tools.decision_store import DecisionStore, InMemoryDecisionStore, SQLiteDecisionStore, TieredDecisionStore
+from tools.ranked_choice_tally import TALLY_METHODS
+from tools.team_voting_tool import ConflictType, DemocraticVotingLogic, VotingPhase
+
+DISTRIBUTIONS = ("uniform", "polarized", "mallows")
+STORES = ("memory", "sqlite", "tiered")
+
+# === SYNTHETISCHE WÄHLERSCHAFT ===
+
+
+def _mallows_ranking(reference: np.ndarray, phi: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    Eine Rangliste aus dem Mallows-Modell (Repeated Insertion). `phi` = 0 liefert genau
+    die Referenz, `phi` = 1 eine gleichverteilte Permutation.
+    """
+    ranking: List[int] = []
+    for i, item in enumerate(reference):
+        # Einfügen an Position j mit Wahrscheinlichkeit ~ phi^(i - j)
+        weights = phi ** np.arange(i, -1, -1, dtype=float) if phi > 0 else np.eye(i + 1)[-1]
+        ranking.insert(int(rng.choice(i + 1, p=weights / weights.sum())), int(item))
+    return np.array(ranking)
+
+
+def generate_ballots(
+    distribution: str,
+    num_agents: int,
+    num_options: int,
+    rng: np.random.Generator,
+    phi: float = 0.5
+) -> np.ndarray:
+    """Liefert (Agents x Optionen) Ranglisten als Options-Indizes."""
+    if distribution == "uniform":
+        return np.array([rng.permutation(num_options) for _ in range(num_agents)])
+
+    reference = rng.permutation(num_options)
+    if distribution == "mallows":
+        return np.array([_mallows_ranking(reference, phi, rng) for _ in range(num_agents)])
+
+    if distribution == "polarized":
+        # Zwei Lager mit entgegengesetzter Referenz, innerhalb des Lagers wenig Streuung
+        camps = (reference, reference[::-1])
+        return np.array([
+            _mallows_ranking(camps[rng.integers(2)], phi * 0.5, rng) for _ in range(num_agents)
+        ])
+
+    raise ValueError(f"Unknown distribution '{distribution}'. Valid distributions: {list(DISTRIBUTIONS)}")
+
+
+# === MESSUNG ===
+
+
+class LatencyRecorder:
+    """Sammelt Laufzeiten pro API-Aufruf."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def call(self, operation: str, function: Callable[..., Any], *args: Any) -> Any:
+        start = time.perf_counter()
+        result = function(*args)
+        self.samples[operation].append(time.perf_counter() - start)
+        return result
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        report = {}
+        for operation, samples in self.samples.items():
+            ordered = sorted(samples)
+            total = sum(ordered)
+            report[operation] = {
+                "count": len(ordered),
+                "total_s": round(total, 6),
+                "ops_per_s": round(len(ordered) / total, 1) if total else None,
+                "mean_us": round(total / len(ordered) * 1e6, 2),
+                "p50_us": round(statistics.median(ordered) * 1e6, 2),
+                "p99_us": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6, 2),
+            }
+        return report
+
+
+class _NullRecorder(LatencyRecorder):
+    """Ruft nur auf, ohne zu messen (für den Speicher-Durchlauf)."""
+
+    def call(self, operation: str, function: Callable[..., Any], *args: Any) -> Any:
+        return function(*args)
+
+
+def _create_store(backend: str, directory: str) -> DecisionStore:
+    if backend == "sqlite":
+        return SQLiteDecisionStore(os.path.join(directory, "benchmark.sqlite3"))
+    if backend == "tiered":
+        return TieredDecisionStore(os.path.join(directory, "archive"))
+    return InMemoryDecisionStore()
+
+
+def run_decisions(
+    engine: DemocraticVotingLogic,
+    recorder: LatencyRecorder,
+    distribution: str,
+    electorate: List[np.ndarray],
+    bulk: bool
+) -> Dict[str, int]:
+    """Treibt eine Entscheidung pro Stimmzettel-Matrix durch alle Phasen und zählt die Gewinner."""
+    num_agents, num_options = electorate[0].shape
+    agents = [f"Agent_{i}" for i in range(num_agents)]
+    # synthesize_options vergibt die IDs option_1..option_n in Eingabereihenfolge
+    option_ids = np.array([f"option_{i + 1}" for i in range(num_options)])
+    winners: Dict[str, int] = defaultdict(int)
+
+    for n, ballots in enumerate(electorate):
+        decision_id = recorder.call(
+            "trigger_democratic_decision", engine.trigger_democratic_decision,
+            ConflictType.MANUAL_TRIGGER, f"Benchmark {n}", "Synthetic electorate", agents, f"benchmark_{distribution}"
+        )
+        recorder.call("advance_phase", engine.advance_phase, decision_id, VotingPhase.IDEA_COLLECTION)
+
+        if bulk:
+            recorder.call("add_agent_proposals_bulk", engine.add_agent_proposals_bulk, decision_id, [
+                {"agent_name": agent, "proposal": f"Proposal of {agent}", "reasoning": "Synthetic"}
+                for agent in agents
+            ])
+        else:
+            for agent in agents:
+                recorder.call("add_agent_proposal", engine.add_agent_proposal,
+                              decision_id, agent, f"Proposal of {agent}", "Synthetic")
+
+        recorder.call("advance_phase", engine.advance_phase, decision_id, VotingPhase.SYNTHESIS)
+        recorder.call("synthesize_options", engine.synthesize_options, decision_id, [
+            {"title": f"Option {i + 1}", "description": "Synthetic option",
+             "source_proposals": agents[i::num_options]}
+            for i in range(num_options)
+        ])
+        recorder.call("advance_phase", engine.advance_phase, decision_id, VotingPhase.RANKED_VOTING)
+
+        if bulk:
+            recorder.call("submit_agent_votes_bulk", engine.submit_agent_votes_bulk, decision_id, [
+                {"agent_name": agent, "ranked_option_ids": option_ids[ballot].tolist(), "reasoning": "Synthetic"}
+                for agent, ballot in zip(agents, ballots)
+            ])
+        else:
+            for agent, ballot in zip(agents, ballots):
+                recorder.call("submit_agent_vote", engine.submit_agent_vote,
+                              decision_id, agent, option_ids[ballot].tolist(), "Synthetic")
+
+        winner = recorder.call("calculate_ranked_choice_winner", engine.calculate_ranked_choice_winner, decision_id)
+        winners[winner] += 1
+        recorder.call("advance_phase", engine.advance_phase, decision_id, VotingPhase.COMMITMENT)
+        recorder.call("finalize_decision", engine.finalize_decision, decision_id, f"Adopt {winner}")
+
+    return dict(sorted(winners.items()))
+
+
+def run_scenario(args: argparse.Namespace, distribution: str, num_agents: int, num_options: int,
+                 method: str) -> Dict[str, Any]:
+    name = f"{distribution}-a{num_agents}-o{num_options}-{method}{'-bulk' if args.bulk else ''}-{args.store}"
+    print(f"--- Benchmark: {name} ({args.decisions} decisions) ---", file=sys.stderr)
+
+    # Stimmzettel vorab erzeugen, damit nur die Engine gemessen wird
+    rng = np.random.default_rng(args.seed)
+    electorate = [generate_ballots(distribution, num_agents, num_options, rng) for _ in range(args.decisions)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = DemocraticVotingLogic(store=_create_store(args.store, directory), verbose=False, tally_method=method)
+        recorder = LatencyRecorder()
+        start = time.perf_counter()
+        winners = run_decisions(engine, recorder, distribution, electorate, args.bulk)
+        elapsed = time.perf_counter() - start
+
+    scenario = {
+        "name": name,
+        "distribution": distribution,
+        "agents": num_agents,
+        "options": num_options,
+        "tally_method": method,
+        "decisions": args.decisions,
+        "elapsed_s": round(elapsed, 4),
+        "decisions_per_s": round(args.decisions / elapsed, 2),
+        "winner_counts": winners,
+        "operations": recorder.summary(),
+    }
+
+    if not args.skip_memory:
+        # Eigener Durchlauf, weil tracemalloc die Latenzen verfälschen würde
+        with tempfile.TemporaryDirectory() as directory:
+            tracemalloc.start()
+            engine = DemocraticVotingLogic(store=_create_store(args.store, directory), verbose=False,
+                                           tally_method=method)
+            run_decisions(engine, _NullRecorder(), distribution, electorate, args.bulk)
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        scenario["memory"] = {
+            "retained_bytes": current,
+            "peak_bytes": peak,
+            "retained_bytes_per_decision": round(current / args.decisions, 1),
+        }
+    return scenario
+
+
+# === REGRESSIONSVERGLEICH ===
+
+
+def compare_with_baseline(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """Vergleicht p50-Latenzen gleichnamiger Szenarien und meldet Verschlechterungen über `tolerance`."""
+    baseline_scenarios = {scenario["name"]: scenario for scenario in baseline.get("scenarios", [])}
+    regressions = []
+    for scenario in results["scenarios"]:
+        previous = baseline_scenarios.get(scenario["name"])
+        if previous is None:
+            continue
+        for operation, stats in scenario["operations"].items():
+            before = previous["operations"].get(operation)
+            if before is None or not before["p50_us"]:
+                continue
+            ratio = stats["p50_us"] / before["p50_us"]
+            if ratio > 1 + tolerance:
+                regressions.append({
+                    "scenario": scenario["name"],
+                    "operation": operation,
+                    "baseline_p50_us": before["p50_us"],
+                    "p50_us": stats["p50_us"],
+                    "ratio": round(ratio, 3),
+                })
+    return regressions
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test and benchmark for the Democracy Engine")
+    parser.add_argument("--agents", type=int, nargs="+", default=[5, 50], help="Agents per decision")
+    parser.add_argument("--options", type=int, nargs="+", default=[4], help="Voting options per decision")
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--methods", nargs="+", choices=TALLY_METHODS, default=["borda"])
+    parser.add_argument("--decisions", type=int, default=100, help="Decisions per scenario")
+    parser.add_argument("--store", choices=STORES, default="memory", help="Decision store backend")
+    parser.add_argument("--bulk", action="store_true", help="Use the bulk proposal and ballot APIs")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON report of a previous run to compare p50 latencies against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p50 slowdown before failing")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "benchmark": "democracy_engine",
+        "timestamp": datetime.now().isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "scenarios": [
+            run_scenario(args, distribution, num_agents, num_options, method)
+            for distribution in args.distributions
+            for num_agents in args.agents
+            for num_options in args.options
+            for method in args.methods
+        ],
+    }
+    # ru_maxrss ist unter Linux in KiB
+    results["max_rss_bytes"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_with_baseline(results, json.load(f), args.tolerance)
+        results["regressions"] = regressions
+        for regression in regressions:
+            print(f"--- Benchmark: REGRESSION {regression['scenario']} {regression['operation']}: "
+                  f"{regression['baseline_p50_us']} -> {regression['p50_us']} us ---", file=sys.stderr)
+        exit_code = 1 if regressions else 0
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+        print(f"--- Benchmark: Report written to {args.output} ---", file=sys.stderr)
+    else:
+        print(report)
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
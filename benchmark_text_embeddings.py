@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+IMAP Democracy Engine - Embedding Benchmark
+===========================================
+
+Misst die Offline-Embeddings aus `tools/text_embeddings.py`:
+
+    cold   -> alle Texte neu einbetten (Durchsatz in Texten/s und MB/s)
+    warm   -> dieselben Texte erneut, nur Cache-Treffer
+    mixed  -> Zipf-verteilte Wiederholungen wie bei wiederholten Tool-Aufrufen (Trefferquote)
+    reopen -> persistenten memmap-Cache neu öffnen und vollständig aus ihm lesen
+
+Das Ergebnis wird als JSON ausgegeben.
+
+Run with: python benchmark_text_embeddings.py --texts 5000 --lengths 80 1500 --output embeddings.json
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from tools.text_embeddings import EmbeddingEngine, HashedNgramEmbedder
+
+WORDS = ("cache api database schema test deploy react vue layout audit metrics queue worker retry "
+         "proposal vote agent decision consensus latency throughput memory index segment").split()
+
+
+def generate_texts(count: int, length: int, rng: np.random.Generator) -> List[str]:
+    """Zufällige Wortfolgen von etwa `length` Zeichen, jede durch ihre Nummer eindeutig."""
+    words_per_text = max(1, length // 7)
+    return [f"{i} " + " ".join(rng.choice(WORDS, size=words_per_text)) for i in range(count)]
+
+
+def _timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def run_length(args: argparse.Namespace, length: int, rng: np.random.Generator) -> Dict[str, Any]:
+    texts = generate_texts(args.texts, length, rng)
+    megabytes = sum(len(text.encode("utf-8")) for text in texts) / 1e6
+    embedder = HashedNgramEmbedder(dim=args.dim)
+    embedder.projection  # Zufallsmatrix vorab erzeugen, nicht in der Messung
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = EmbeddingEngine(embedder, directory)
+        batches = [texts[i:i + args.batch] for i in range(0, len(texts), args.batch)]
+
+        cold = _timed(lambda: [engine.embed(batch) for batch in batches])
+        warm = _timed(lambda: [engine.embed(batch) for batch in batches])
+
+        # Zipf-verteilte Anfragen über bekannte und ebenso viele neue Texte: wenige sehr oft, viele selten
+        fresh = generate_texts(args.texts, length, rng)
+        pool = list(rng.permutation(texts + [f"new {text}" for text in fresh]))
+        ranks = np.minimum(rng.zipf(1.3, size=args.texts), len(pool)) - 1
+        requests = [pool[rank] for rank in rng.permutation(ranks)]
+        before = engine.stats
+        mixed = _timed(lambda: [engine.embed(requests[i:i + args.batch]) for i in range(0, len(requests), args.batch)])
+        after = engine.stats
+        mixed_hits = after["hits"] - before["hits"]
+        engine.close()
+
+        reopen_start = time.perf_counter()
+        reopened = EmbeddingEngine(embedder, directory)
+        for batch in batches:
+            reopened.embed(batch)
+        reopen = time.perf_counter() - reopen_start
+        reopen_stats = reopened.stats
+        reopened.close()
+
+    return {
+        "length": length,
+        "texts": len(texts),
+        "cold_texts_per_s": round(len(texts) / cold),
+        "cold_mb_per_s": round(megabytes / cold, 2),
+        "warm_texts_per_s": round(len(texts) / warm),
+        "warm_speedup": round(cold / warm, 1),
+        "mixed_hit_rate": round(mixed_hits / len(requests), 4),
+        "mixed_texts_per_s": round(len(requests) / mixed),
+        "reopen_s": round(reopen, 3),
+        "reopen_hit_rate": reopen_stats["hit_rate"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark for the offline embedding engine and its vector cache")
+    parser.add_argument("--texts", type=int, default=5000, help="Texts per length")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[80, 1500], help="Approximate characters per text")
+    parser.add_argument("--batch", type=int, default=256, help="Texts per embed() call")
+    parser.add_argument("--dim", type=int, default=256, help="Embedding dimensions")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    results = {"config": vars(args), "results": [run_length(args, length, rng) for length in args.lengths]}
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report)
+        for row in results["results"]:
+            print(f"{row['length']:>5} chars: cold {row['cold_texts_per_s']:>7} texts/s ({row['cold_mb_per_s']} MB/s), "
+                  f"warm {row['warm_speedup']}x faster, mixed hit rate {row['mixed_hit_rate']:.1%}, "
+                  f"reopen {row['reopen_s']} s ({row['reopen_hit_rate']:.0%} hits)")
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -112,6 +112,7 @@ task_developer_proposal = Task(
         f"focusing on developer experience and technical implementation."
     ),
     agent=developer_agent,
+    async_execution=True,  # Proposals laufen parallel; die Democracy Engine ist threadsicher
 )
 
 task_researcher_proposal = Task(
@@ -133,6 +134,7 @@ task_researcher_proposal = Task(
         f"supporting your framework recommendation."
     ),
     agent=researcher_agent,
+    async_execution=True,
 )
 
 task_tester_proposal = Task(
@@ -154,6 +156,7 @@ task_tester_proposal = Task(
         f"and end-user experience considerations."
     ),
     agent=tester_agent,
+    async_execution=True,
 )
 
 task_reflector_synthesis = Task(
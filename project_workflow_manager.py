@@ -24,6 +24,7 @@ from agents import (
 )
 
 from tools.team_voting_tool import ConflictType, VotingPhase
+import tools.phase_scheduler  # noqa: F401 - startet bei DEMOCRACY_AUTO_ADVANCE=true den Scheduler
 from tools.file_operations_tool import write_file_tool, read_file_tool, create_directory_tool
 
 class ProjectWorkflowManager:
@@ -0,0 +1,119 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from tools.decision_events import DECISION_FINALIZED, PROPOSAL_ADDED, DecisionNotification
+
+# Obergrenze für gleichzeitig gecachte Entscheidungen (LRU)
+MAX_CACHED_DECISIONS = 256
+
+
+def _proposal_fields(proposal: Any) -> Tuple[str, str, str]:
+    if isinstance(proposal, dict):
+        return proposal["agent_name"], proposal["proposal"], proposal.get("reasoning", "")
+    return proposal.agent_name, proposal.proposal, proposal.reasoning
+
+
+def proposals_fingerprint(proposals: List[Any]) -> str:
+    """Hash über Agent, Vorschlag und Begründung aller Vorschläge (AgentProposal oder Dict)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for proposal in proposals:
+        for value in _proposal_fields(proposal):
+            digest.update(value.encode("utf-8"))
+            digest.update(b"\x1f")
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
+class DecisionView:
+    """Lesesicht auf eine Entscheidung für die Synthese-Tools, ohne vollständiges `to_dict()`."""
+    decision_id: str
+    context: str
+    current_phase: str
+    proposals: List[Any]
+
+    def proposal_dicts(self) -> List[Dict[str, Any]]:
+        return [proposal if isinstance(proposal, dict) else proposal.to_dict() for proposal in self.proposals]
+
+
+def load_decision_view(engine, decision_id: str) -> Optional[DecisionView]:
+    """
+    Liest laufende Entscheidungen direkt aus den Engine-Objekten; abgeschlossene
+    Entscheidungen und entfernte Engines (Client) fallen auf `get_decision_status` zurück.
+    """
+    get_active_decision = getattr(engine, "get_active_decision", None)
+    decision = get_active_decision(decision_id) if get_active_decision else None
+    if decision is not None:
+        return DecisionView(decision_id, decision.context, decision.current_phase.value, list(decision.proposals))
+
+    status = engine.get_decision_status(decision_id)
+    if not status:
+        return None
+    return DecisionView(decision_id, status.get("context", ""), status.get("current_phase", ""),
+                        status.get("proposals", []))
+
+
+class ProposalAnalysisCache:
+    """
+    Memoisiert Analyse-Ergebnisse pro (decision_id, Fingerprint der Vorschläge).
+
+    Ein neuer Vorschlag (`PROPOSAL_ADDED`) oder der Abschluss einer Entscheidung
+    verwirft deren Einträge sofort; der Fingerprint sichert zusätzlich ab, dass nie
+    ein Ergebnis zu einem anderen Vorschlagsstand geliefert wird (z.B. bei entfernten
+    Engines ohne Benachrichtigungen). Pro Entscheidung können mehrere Ergebnisarten
+    (`kind`) abgelegt werden.
+    """
+
+    def __init__(self, engine=None, max_decisions: int = MAX_CACHED_DECISIONS):
+        self.max_decisions = max_decisions
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # decision_id -> (Fingerprint, {kind: Ergebnis})
+        self._entries: "OrderedDict[str, Tuple[str, Dict[Hashable, Any]]]" = OrderedDict()
+        self._subscription_id: Optional[int] = None
+
+        # Nur die lokale Engine abonnieren; ein Client würde dafür eine Socket-Verbindung öffnen
+        if engine is not None and hasattr(engine, "get_active_decision"):
+            self._subscription_id = engine.events.subscribe(
+                self._on_notification, topics=(PROPOSAL_ADDED, DECISION_FINALIZED)
+            )
+
+    def get_or_compute(self, view: DecisionView, kind: Hashable, compute: Callable[[], Any]) -> Any:
+        fingerprint = proposals_fingerprint(view.proposals)
+        with self._lock:
+            entry = self._entries.get(view.decision_id)
+            if entry is not None and entry[0] == fingerprint and kind in entry[1]:
+                self._entries.move_to_end(view.decision_id)
+                self.hits += 1
+                return entry[1][kind]
+            self.misses += 1
+
+        # Außerhalb des Locks rechnen; parallele Fehlschläge rechnen schlimmstenfalls doppelt
+        result = compute()
+
+        with self._lock:
+            entry = self._entries.get(view.decision_id)
+            if entry is None or entry[0] != fingerprint:
+                entry = (fingerprint, {})
+                self._entries[view.decision_id] = entry
+            entry[1][kind] = result
+            self._entries.move_to_end(view.decision_id)
+            while len(self._entries) > self.max_decisions:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, decision_id: str) -> None:
+        with self._lock:
+            self._entries.pop(decision_id, None)
+
+    def _on_notification(self, notification: DecisionNotification) -> None:
+        self.invalidate(notification.decision_id)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "decisions": len(self._entries)}
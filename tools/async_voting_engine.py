@@ -0,0 +1,129 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from tools.decision_events import DECISION_FINALIZED, PHASE_CHANGED
+from tools.team_voting_tool import (
+    _PHASE_ORDER,
+    ConflictType,
+    DemocraticVotingLogic,
+    VotingPhase,
+    _democracy_engine,
+)
+
+
+class AsyncDemocraticVotingLogic:
+    """
+    asyncio-Fassade für die Democracy Engine.
+
+    Die Engine selbst ist über Locks pro Entscheidung threadsicher; diese Klasse
+    führt jeden Aufruf in einem Worker-Thread aus, damit Coroutinen mehrerer
+    Agents gleichzeitig Vorschläge und Stimmen abgeben können, ohne den Event-Loop
+    zu blockieren (z.B. wenn das Event-Log oder SQLite auf die Platte schreibt).
+    """
+
+    def __init__(self, engine: Optional[DemocraticVotingLogic] = None):
+        self.engine = engine if engine is not None else _democracy_engine
+
+    async def trigger_democratic_decision(
+        self,
+        conflict_type: ConflictType,
+        trigger_reason: str,
+        context: str,
+        participating_agents: List[str],
+        project_id: str = ""
+    ) -> str:
+        return await asyncio.to_thread(
+            self.engine.trigger_democratic_decision,
+            conflict_type, trigger_reason, context, participating_agents, project_id
+        )
+
+    async def add_agent_proposal(self, decision_id: str, agent_name: str, proposal: str, reasoning: str) -> bool:
+        return await asyncio.to_thread(
+            self.engine.add_agent_proposal, decision_id, agent_name, proposal, reasoning
+        )
+
+    async def add_agent_proposals_bulk(self, decision_id: str, proposals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.engine.add_agent_proposals_bulk, decision_id, proposals)
+
+    async def synthesize_options(self, decision_id: str, synthesized_options: List[Dict[str, Any]]) -> bool:
+        return await asyncio.to_thread(self.engine.synthesize_options, decision_id, synthesized_options)
+
+    async def submit_agent_vote(
+        self,
+        decision_id: str,
+        agent_name: str,
+        ranked_option_ids: List[str],
+        reasoning: str
+    ) -> bool:
+        return await asyncio.to_thread(
+            self.engine.submit_agent_vote, decision_id, agent_name, ranked_option_ids, reasoning
+        )
+
+    async def submit_agent_votes_bulk(self, decision_id: str, ballots: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.engine.submit_agent_votes_bulk, decision_id, ballots)
+
+    async def calculate_ranked_choice_winner(self, decision_id: str, method: Optional[str] = None) -> Optional[str]:
+        return await asyncio.to_thread(self.engine.calculate_ranked_choice_winner, decision_id, method)
+
+    async def finalize_decision(self, decision_id: str, final_decision_text: str) -> bool:
+        return await asyncio.to_thread(self.engine.finalize_decision, decision_id, final_decision_text)
+
+    async def get_decision_status(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self.engine.get_decision_status, decision_id)
+
+    async def advance_phase(self, decision_id: str, new_phase: VotingPhase, from_phase: Optional[VotingPhase] = None) -> bool:
+        return await asyncio.to_thread(self.engine.advance_phase, decision_id, new_phase, from_phase)
+
+    async def wait_for_phase(self, decision_id: str, phase: VotingPhase, timeout: Optional[float] = None) -> bool:
+        """Wartet über eine Event-Queue (ohne Polling), bis die Entscheidung `phase` erreicht hat."""
+        subscription_id, queue = self.engine.events.subscribe_queue(
+            topics=(PHASE_CHANGED, DECISION_FINALIZED), decision_id=decision_id
+        )
+        try:
+            if self.engine.has_reached_phase(decision_id, phase):
+                return True
+
+            async def _next_matching() -> bool:
+                while True:
+                    notification = await queue.get()
+                    if notification.topic == DECISION_FINALIZED or _PHASE_ORDER[notification.phase] >= _PHASE_ORDER[phase.value]:
+                        return True
+
+            return await asyncio.wait_for(_next_matching(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.engine.events.unsubscribe(subscription_id)
+
+
+if __name__ == '__main__':
+    print("=== Testing Async Democracy Engine ===")
+
+    async def _demo() -> None:
+        engine = AsyncDemocraticVotingLogic(DemocraticVotingLogic(verbose=False))
+        agents = [f"Agent_{i}" for i in range(50)]
+
+        decision_id = await engine.trigger_democratic_decision(
+            ConflictType.MANUAL_TRIGGER, "Async test", "Concurrent proposals via asyncio", agents
+        )
+        await engine.advance_phase(decision_id, VotingPhase.IDEA_COLLECTION)
+
+        # Jeder Agent reicht zweimal gleichzeitig ein - genau ein Vorschlag darf gewinnen
+        results = await asyncio.gather(*[
+            engine.add_agent_proposal(decision_id, agent, f"Proposal {attempt}", "Async reasoning")
+            for agent in agents for attempt in range(2)
+        ])
+        status = await engine.get_decision_status(decision_id)
+
+        print(f"Accepted submissions: {sum(results)} (expected {len(agents)})")
+        print(f"Stored proposals: {len(status['proposals'])} (expected {len(agents)})")
+
+        # Ein Orchestrator wartet auf RANKED_VOTING, während die Phase aus einem anderen Thread wechselt
+        waiter = asyncio.create_task(engine.wait_for_phase(decision_id, VotingPhase.RANKED_VOTING, timeout=5))
+        await engine.advance_phase(decision_id, VotingPhase.SYNTHESIS)
+        await engine.synthesize_options(decision_id, [{"title": "A"}, {"title": "B"}])
+        await engine.advance_phase(decision_id, VotingPhase.RANKED_VOTING)
+        print(f"Notified about RANKED_VOTING without polling: {await waiter}")
+
+    asyncio.run(_demo())
+    print("\n=== Async Democracy Engine Testing Complete ===")
@@ -0,0 +1,133 @@
+import math
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+# Grobe Token-Schätzung ohne Tokenizer: etwa 4 Zeichen je Token bei englischem/deutschem Fließtext
+CHARS_PER_TOKEN = 4
+# Wörter je Token, um Token-Budgets in die Längenangabe (Wörter) der Prompts umzurechnen
+WORDS_PER_TOKEN = 0.75
+
+DEFAULT_CHUNK_TOKENS = int(os.getenv("SUMMARIZER_CHUNK_TOKENS", "6000"))
+DEFAULT_MAX_WORKERS = int(os.getenv("SUMMARIZER_MAX_WORKERS", "8"))
+# Obergrenze für Teilzusammenfassungen (Wörter): jede Ausgabe kostet Decode-Zeit, und die
+# Endfassung braucht je Abschnitt nur die Kernaussagen
+MAP_SUMMARY_WORDS = 100
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# (text, max_length in Wörtern oder None, summary_focus oder None) -> Zusammenfassung
+Summarize = Callable[[str, Optional[int], Optional[str]], str]
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _pieces(text: str, max_tokens: int) -> List[str]:
+    """Absätze; zu lange Absätze in Sätze, zu lange Sätze notfalls nach Wörtern geteilt."""
+    pieces = []
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) <= max_tokens:
+            pieces.append(paragraph)
+            continue
+        for sentence in _SENTENCE_END.split(paragraph):
+            if estimate_tokens(sentence) <= max_tokens:
+                pieces.append(sentence)
+                continue
+            words, current = sentence.split(), []
+            for word in words:
+                if current and estimate_tokens(" ".join(current + [word])) > max_tokens:
+                    pieces.append(" ".join(current))
+                    current = []
+                current.append(word)
+            if current:
+                pieces.append(" ".join(current))
+    return pieces
+
+
+def split_into_chunks(text: str, max_tokens: int = DEFAULT_CHUNK_TOKENS) -> List[str]:
+    """Teilt `text` an Absatz- bzw. Satzgrenzen in Abschnitte von höchstens `max_tokens` (geschätzt)."""
+    chunks, current, current_tokens = [], [], 0
+    for piece in _pieces(text, max_tokens):
+        tokens = estimate_tokens(piece) + 1
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+class MapReduceSummarizer:
+    """
+    Fasst lange Texte in zwei Stufen zusammen: Map fasst jeden Abschnitt (höchstens
+    `chunk_tokens`) parallel in einem begrenzten Thread-Pool zusammen, Reduce fasst die
+    Teilzusammenfassungen zur Endfassung zusammen. Passen die Teilzusammenfassungen
+    nicht in einen Aufruf, werden sie stufenweise weiter verdichtet. `summary_focus`
+    gilt für alle Aufrufe, `max_length` für die Endfassung. Texte, die in einen
+    Abschnitt passen, gehen direkt in einen einzigen Aufruf.
+    """
+
+    def __init__(self, summarize: Summarize, chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
+        self.summarize_text = summarize
+        self.chunk_tokens = chunk_tokens
+        self.max_workers = max(1, max_workers)
+        self.calls = 0
+
+    def _map(self, chunks: List[str], length: int, focus: Optional[str]) -> List[str]:
+        self.calls += len(chunks)
+        if len(chunks) == 1 or self.max_workers == 1:
+            return [self.summarize_text(chunk, length, focus) for chunk in chunks]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            # executor.map hält die Reihenfolge der Abschnitte ein; Fehler werden beim Lesen geworfen
+            return list(executor.map(lambda chunk: self.summarize_text(chunk, length, focus), chunks))
+
+    def summarize(self, text: str, max_length: Optional[int] = None, summary_focus: Optional[str] = None) -> str:
+        chunks = split_into_chunks(text, self.chunk_tokens)
+        while len(chunks) > 1:
+            # Jede Teilzusammenfassung bekommt ihren Anteil am Budget des nächsten Aufrufs,
+            # damit die Stufe darüber wieder in einen Abschnitt passt
+            share = int(self.chunk_tokens * WORDS_PER_TOKEN / len(chunks))
+            length = max(30, min(share, MAP_SUMMARY_WORDS))
+            partials = self._map(chunks, length, summary_focus)
+            text = "\n\n".join(partials)
+            reduced = split_into_chunks(text, self.chunk_tokens)
+            # Absicherung gegen Teilzusammenfassungen, die die Länge nicht verringern
+            chunks = reduced if len(reduced) < len(chunks) else [text]
+
+        self.calls += 1
+        return self.summarize_text(chunks[0] if chunks else text, max_length, summary_focus)
+
+
+if __name__ == '__main__':
+    import time
+
+    print("=== Testing Map-Reduce Summarization ===")
+
+    def first_sentences(text: str, max_length: Optional[int], focus: Optional[str]) -> str:
+        time.sleep(0.05)
+        words = " ".join(sentence.split(".")[0] for sentence in _PARAGRAPH_BREAK.split(text)).split()
+        return " ".join(words[:max_length or 60]) + "."
+
+    paragraphs = [f"Paragraph {i} explains topic {i % 7}. It adds detail number {i} about the system." * 20
+                  for i in range(60)]
+    document = "\n\n".join(paragraphs)
+    print(f"\n1. {estimate_tokens(document)} tokens -> {len(split_into_chunks(document))} chunks")
+
+    for workers in (1, 4):
+        summarizer = MapReduceSummarizer(first_sentences, max_workers=workers)
+        start = time.perf_counter()
+        summary = summarizer.summarize(document, max_length=40, summary_focus="topics")
+        print(f"2. workers={workers}: {summarizer.calls} calls in {time.perf_counter() - start:.2f} s, "
+              f"{len(summary.split())} words")
+
+    print("\n=== Map-Reduce Summarization Testing Complete ===")
@@ -0,0 +1,279 @@
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Zeitstempel werden als Mikrosekunden seit der (naiven) Epoche gespeichert;
+# zeitzonenbehaftete Werte bleiben als ISO-String erhalten, damit nichts verloren geht
+Timestamp = Union[int, str]
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Schlüssel von DemocraticDecision.to_dict() in Ausgabereihenfolge
+_DECISION_KEYS = (
+    "decision_id", "conflict_type", "trigger_reason", "context", "proposals", "voting_options",
+    "votes", "winning_option_id", "winning_option", "final_decision", "start_time", "end_time",
+    "current_phase", "participating_agents", "tally_result", "outcome_locked", "locked_option_id",
+    "project_id", "version",
+)
+
+
+def _pack_time(iso_timestamp: Optional[str]) -> Optional[Timestamp]:
+    if iso_timestamp is None:
+        return None
+    moment = datetime.fromisoformat(iso_timestamp)
+    if moment.tzinfo is not None or moment.isoformat() != iso_timestamp:
+        return iso_timestamp
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def _unpack_time(value: Optional[Timestamp]) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return (_EPOCH + value * _MICROSECOND).isoformat()
+
+
+def _intern_all(names: List[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(name) for name in names)
+
+
+def _option_id(index: int) -> str:
+    return f"option_{index + 1}"
+
+
+@dataclass(slots=True)
+class CompactProposal:
+    agent_name: str
+    proposal: str
+    reasoning: str
+    timestamp: Timestamp
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactProposal":
+        return cls(sys.intern(data["agent_name"]), data["proposal"], data["reasoning"], _pack_time(data["timestamp"]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "agent_name": self.agent_name,
+            "proposal": self.proposal,
+            "reasoning": self.reasoning,
+            "timestamp": _unpack_time(self.timestamp)
+        }
+
+
+@dataclass(slots=True)
+class CompactOption:
+    title: str
+    description: str
+    source_proposals: Tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactOption":
+        return cls(data["title"], data["description"], _intern_all(data.get("source_proposals", [])))
+
+    def to_dict(self, index: int) -> Dict[str, Any]:
+        return {
+            "option_id": _option_id(index),
+            "title": self.title,
+            "description": self.description,
+            "source_proposals": list(self.source_proposals)
+        }
+
+
+@dataclass(slots=True)
+class CompactVote:
+    agent_name: str
+    ranked_options: Tuple[int, ...]  # Indizes in voting_options
+    reasoning_for_top_choice: str
+    timestamp: Timestamp
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "agent_name": self.agent_name,
+            "ranked_options": [_option_id(index) for index in self.ranked_options],
+            "reasoning_for_top_choice": self.reasoning_for_top_choice,
+            "timestamp": _unpack_time(self.timestamp)
+        }
+
+
+@dataclass(slots=True)
+class CompactDecision:
+    """
+    Speichersparende Archiv-Repräsentation einer abgeschlossenen Entscheidung.
+
+    Agent-Namen, Phase und Konflikttyp sind internierte Strings, Options-IDs werden
+    als Indizes gespeichert, Zeitstempel als Epoch-Mikrosekunden. `to_dict()` liefert
+    exakt dieselbe Struktur wie `DemocraticDecision.to_dict()`; Werte, die sich nicht
+    kompakt darstellen lassen, landen unverändert in `extras`.
+    """
+    decision_id: str
+    conflict_type: str
+    trigger_reason: str
+    context: str
+    proposals: Tuple[CompactProposal, ...]
+    voting_options: Tuple[CompactOption, ...]
+    votes: Tuple[CompactVote, ...]
+    winning_index: int
+    final_decision: str
+    start_time: Timestamp
+    end_time: Optional[Timestamp]
+    current_phase: str
+    participating_agents: Tuple[str, ...]
+    tally_result: Optional[Dict[str, Any]]
+    locked_index: int
+    project_id: str
+    version: int
+    extras: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactDecision":
+        extras = {key: value for key, value in data.items() if key not in _DECISION_KEYS}
+
+        options = data.get("voting_options", [])
+        option_index = {option["option_id"]: i for i, option in enumerate(options)}
+        if any(option["option_id"] != _option_id(i) for i, option in enumerate(options)):
+            extras["voting_options"] = options
+            options = []
+            option_index = {}
+
+        compact_votes = []
+        for vote in data.get("votes", []):
+            ranked = [option_index.get(option_id) for option_id in vote["ranked_options"]]
+            if None in ranked:
+                extras["votes"] = data["votes"]
+                compact_votes = []
+                break
+            compact_votes.append(CompactVote(
+                sys.intern(vote["agent_name"]), tuple(ranked),
+                vote["reasoning_for_top_choice"], _pack_time(vote["timestamp"])
+            ))
+
+        winning_index = option_index.get(data.get("winning_option_id", ""), -1)
+        if data.get("winning_option_id") and (
+            winning_index < 0 or data.get("winning_option") != options[winning_index]
+        ):
+            extras["winning_option_id"] = data["winning_option_id"]
+            extras["winning_option"] = data.get("winning_option")
+            winning_index = -1
+
+        locked_index = option_index.get(data.get("locked_option_id", ""), -1)
+        if data.get("locked_option_id") and locked_index < 0:
+            extras["locked_option_id"] = data["locked_option_id"]
+
+        return cls(
+            decision_id=data["decision_id"],
+            conflict_type=sys.intern(data["conflict_type"]),
+            trigger_reason=data["trigger_reason"],
+            context=data["context"],
+            proposals=tuple(CompactProposal.from_dict(p) for p in data.get("proposals", [])),
+            voting_options=tuple(CompactOption.from_dict(option) for option in options),
+            votes=tuple(compact_votes),
+            winning_index=winning_index,
+            final_decision=data.get("final_decision", ""),
+            start_time=_pack_time(data["start_time"]),
+            end_time=_pack_time(data.get("end_time")),
+            current_phase=sys.intern(data["current_phase"]),
+            participating_agents=_intern_all(data.get("participating_agents", [])),
+            tally_result=data.get("tally_result"),
+            locked_index=locked_index,
+            project_id=sys.intern(data.get("project_id", "")),
+            version=data.get("version", 0),
+            extras=extras or None
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        options = [option.to_dict(i) for i, option in enumerate(self.voting_options)]
+        extras = self.extras or {}
+        locked_option_id = _option_id(self.locked_index) if self.locked_index >= 0 else ""
+
+        data = {
+            "decision_id": self.decision_id,
+            "conflict_type": self.conflict_type,
+            "trigger_reason": self.trigger_reason,
+            "context": self.context,
+            "proposals": [p.to_dict() for p in self.proposals],
+            "voting_options": extras.get("voting_options", options),
+            "votes": extras.get("votes", [v.to_dict() for v in self.votes]),
+            "winning_option_id": _option_id(self.winning_index) if self.winning_index >= 0 else "",
+            "winning_option": options[self.winning_index] if self.winning_index >= 0 else None,
+            "final_decision": self.final_decision,
+            "start_time": _unpack_time(self.start_time),
+            "end_time": _unpack_time(self.end_time),
+            "current_phase": self.current_phase,
+            "participating_agents": list(self.participating_agents),
+            "tally_result": self.tally_result,
+            "outcome_locked": bool(extras.get("locked_option_id", locked_option_id)),
+            "locked_option_id": extras.get("locked_option_id", locked_option_id),
+            "project_id": self.project_id,
+            "version": self.version
+        }
+        for key, value in extras.items():
+            data[key] = value
+        return data
+
+
+if __name__ == '__main__':
+    import gc
+    import tracemalloc
+
+    print("=== Testing Compact Decision Records ===")
+
+    from tools.team_voting_tool import DemocraticDecision
+
+    agents = ["Project Manager", "Developer", "Researcher", "Tester"]
+    now = datetime.now()
+
+    def make_decision_dict(n: int) -> Dict[str, Any]:
+        options = [
+            {"option_id": f"option_{i + 1}", "title": f"Option {i + 1}",
+             "description": f"Approach {i + 1} for decision {n}", "source_proposals": agents[i:i + 2]}
+            for i in range(3)
+        ]
+        return {
+            "decision_id": f"decision_{n:08d}_architecture_decision",
+            "conflict_type": "architecture_decision",
+            "trigger_reason": "Framework choice",
+            "context": f"Context for decision {n}",
+            "proposals": [
+                {"agent_name": agent, "proposal": f"{agent} proposal {n}", "reasoning": "Because it fits",
+                 "timestamp": (now + timedelta(seconds=n, microseconds=i)).isoformat()}
+                for i, agent in enumerate(agents)
+            ],
+            "voting_options": options,
+            "votes": [
+                {"agent_name": agent, "ranked_options": ["option_2", "option_1", "option_3"],
+                 "reasoning_for_top_choice": "Best fit", "timestamp": (now + timedelta(seconds=n)).isoformat()}
+                for agent in agents
+            ],
+            "winning_option_id": "option_2",
+            "winning_option": options[1],
+            "final_decision": "Go with option 2",
+            "start_time": now.isoformat(),
+            "end_time": (now + timedelta(minutes=5)).isoformat(),
+            "current_phase": "commitment",
+            "participating_agents": list(agents),
+            "tally_result": None,
+            "outcome_locked": False,
+            "locked_option_id": "",
+            "project_id": "imap_project",
+            "version": 14
+        }
+
+    sample = make_decision_dict(1)
+    print(f"Lossless round trip: {CompactDecision.from_dict(sample).to_dict() == sample}")
+
+    def measure(label: str, build) -> None:
+        gc.collect()
+        tracemalloc.start()
+        records = [build(make_decision_dict(n)) for n in range(10_000)]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:>22}: {current / 1024 / 1024:7.1f} MiB per 10k decisions")
+        del records
+
+    measure("to_dict() dicts", lambda data: data)
+    measure("DemocraticDecision", DemocraticDecision.from_dict)
+    measure("CompactDecision", CompactDecision.from_dict)
+
+    print("\n=== Compact Decision Records Testing Complete ===")
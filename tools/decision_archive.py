@@ -0,0 +1,428 @@
+import bisect
+import gzip
+import json
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Index-Eintrag versiegelter Segmente: Schlüssel (decision_id, auf 64 Bytes gekürzt/aufgefüllt),
+# Offset und Länge des gzip-Members im Segment
+_INDEX_RECORD = struct.Struct("<64sQI")
+_KEY_SIZE = 64
+
+
+# Filterbare Attribute; der Attribut-Index eines Segments ordnet jedem Wert die Positionen
+# im sortierten Offset-Index zu
+_ATTRIBUTES = ("conflict_type", "project_id", "participant")
+
+
+def _index_key(decision_id: str) -> bytes:
+    return decision_id.encode("utf-8")[:_KEY_SIZE].ljust(_KEY_SIZE, b"\0")
+
+
+def _attribute_values(decision_data: Dict[str, Any]) -> Tuple[str, str, Tuple[str, ...]]:
+    """(Konflikttyp, Projekt, Teilnehmer) in der Reihenfolge von `_ATTRIBUTES`."""
+    return (
+        decision_data["conflict_type"],
+        decision_data.get("project_id", ""),
+        tuple(dict.fromkeys(decision_data.get("participating_agents", []))),
+    )
+
+
+def _matches(values: Tuple[str, str, Tuple[str, ...]], filters: List[Tuple[str, str]]) -> bool:
+    conflict_type, project_id, participants = values
+    for name, value in filters:
+        if name == "participant":
+            if value not in participants:
+                return False
+        elif (conflict_type if name == "conflict_type" else project_id) != value:
+            return False
+    return True
+
+
+class _SealedSegment:
+    """Abgeschlossenes Segment mit sortiertem, per mmap durchsuchtem Offset-Index."""
+
+    def __init__(self, data_path: Path, index_path: Path, attrs_path: Path):
+        self.data_path = data_path
+        self.attrs_path = attrs_path
+        self._index_file = open(index_path, "rb")
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.count = len(self._index) // _INDEX_RECORD.size
+        self.min_key = self._key_at(0)
+        self.max_key = self._key_at(self.count - 1)
+
+    def _key_at(self, position: int) -> bytes:
+        start = position * _INDEX_RECORD.size
+        return self._index[start:start + _KEY_SIZE]
+
+    def position(self, key: bytes) -> int:
+        return bisect.bisect_left(range(self.count), key, key=self._key_at)
+
+    def entry(self, position: int) -> Tuple[bytes, int, int]:
+        return _INDEX_RECORD.unpack_from(self._index, position * _INDEX_RECORD.size)
+
+    def decision_id(self, position: int) -> str:
+        key, offset, length = self.entry(position)
+        if key[-1]:
+            # Auf 64 Bytes gekürzte ID: vollständige ID steht nur im Datensatz
+            return json.loads(DecisionArchive._read(self.data_path, offset, length))["decision_id"]
+        return key.rstrip(b"\0").decode("utf-8")
+
+    def find(self, filters: List[Tuple[str, str]]) -> Set[str]:
+        """IDs aller Einträge, die allen (Attribut, Wert)-Filtern entsprechen."""
+        if not filters:
+            return {self.decision_id(position) for position in range(self.count)}
+        with open(self.attrs_path, "r", encoding="utf-8") as f:
+            attributes = json.load(f)
+        candidate_sets = sorted((attributes[name].get(value, []) for name, value in filters), key=len)
+        positions = set(candidate_sets[0])
+        for candidates in candidate_sets[1:]:
+            positions.intersection_update(candidates)
+        return {self.decision_id(position) for position in positions}
+
+    def locate(self, key: bytes) -> Iterator[Tuple[int, int]]:
+        """Liefert (offset, length) aller Einträge mit diesem Schlüssel (binäre Suche)."""
+        if not (self.min_key <= key <= self.max_key):
+            return
+        position = self.position(key)
+        while position < self.count and self._key_at(position) == key:
+            _, offset, length = self.entry(position)
+            yield offset, length
+            position += 1
+
+    def close(self) -> None:
+        self._index.close()
+        self._index_file.close()
+
+
+class DecisionArchive:
+    """
+    Komprimiertes, append-only Archiv abgeschlossener Entscheidungen.
+
+    Jede Entscheidung wird als eigenes gzip-Member (eine JSON-Zeile) an das offene
+    Segment `segment_NNNNNN.jsonl.gz` angehängt; die Datei bleibt damit ein gültiges
+    gzip-JSONL. Das offene Segment führt ein Text-Journal `.open.idx`. Nach
+    `segment_records` Einträgen wird es versiegelt und der Index sortiert als
+    `.idx` mit festen Satzlängen geschrieben. Ein Lookup ist damit eine binäre
+    Suche im mmap-Index, ein Seek und ein Dekomprimieren. Daneben liegt je Segment
+    ein kleiner Attribut-Index `.attrs.json` (Konflikttyp, Projekt, Teilnehmer ->
+    Positionen im `.idx`), sodass `find` das Archiv nicht dekomprimieren muss. Im
+    Speicher liegen nur die Metadaten der Segmente und die Indizes des offenen Segments.
+    """
+
+    SEGMENT_PATTERN = "segment_{:06d}"
+
+    def __init__(self, directory: str, segment_records: int = 10_000, compresslevel: int = 6):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_records = max(1, segment_records)
+        self.compresslevel = compresslevel
+
+        self._lock = threading.Lock()
+        self._sealed: List[_SealedSegment] = []
+        self._open_number = 0
+        self._open_index: Dict[str, Tuple[int, int]] = {}
+        self._open_attributes: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
+        self._open_data = None
+        self._open_journal = None
+        self._load()
+
+    def _paths(self, number: int) -> Tuple[Path, Path, Path]:
+        stem = self.SEGMENT_PATTERN.format(number)
+        return (
+            self.directory / f"{stem}.jsonl.gz",
+            self.directory / f"{stem}.idx",
+            self.directory / f"{stem}.open.idx",
+        )
+
+    def _attrs_path(self, number: int) -> Path:
+        return self.directory / f"{self.SEGMENT_PATTERN.format(number)}.attrs.json"
+
+    def _load(self) -> None:
+        numbers = sorted(int(path.name[8:14]) for path in self.directory.glob("segment_*.jsonl.gz"))
+        self._open_number = max(numbers, default=0) + 1
+        for number in numbers:
+            data_path, index_path, journal_path = self._paths(number)
+            if index_path.exists():
+                segment = _SealedSegment(data_path, index_path, self._attrs_path(number))
+                if not segment.attrs_path.exists():
+                    # Archiv aus einer Version ohne Attribut-Index: einmalig nachziehen
+                    self._write_attributes(segment, self._iter_segment(data_path, None))
+                self._sealed.append(segment)
+            else:
+                # Nur das letzte Segment kann offen sein
+                self._open_number = number
+                if journal_path.exists():
+                    self._open_index = self._read_journal(journal_path)
+        if self._open_index:
+            end = max(offset + length for offset, length in self._open_index.values())
+            for data in self._iter_segment(self._paths(self._open_number)[0], end):
+                if data["decision_id"] in self._open_index:
+                    self._open_attributes[data["decision_id"]] = _attribute_values(data)
+        self._open_segment()
+
+    @staticmethod
+    def _write_attributes(segment: _SealedSegment, records: Iterable[Dict[str, Any]]) -> None:
+        attributes: Dict[str, Dict[str, List[int]]] = {name: {} for name in _ATTRIBUTES}
+        for data in records:
+            position = segment.position(_index_key(data["decision_id"]))
+            conflict_type, project_id, participants = _attribute_values(data)
+            attributes["conflict_type"].setdefault(conflict_type, []).append(position)
+            attributes["project_id"].setdefault(project_id, []).append(position)
+            for participant in participants:
+                attributes["participant"].setdefault(participant, []).append(position)
+
+        tmp_path = segment.attrs_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(attributes, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, segment.attrs_path)
+
+    @staticmethod
+    def _read_journal(journal_path: Path) -> Dict[str, Tuple[int, int]]:
+        entries = {}
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) != 3:
+                    # Abgeschnittene letzte Zeile nach einem Absturz ignorieren
+                    break
+                entries[parts[0]] = (int(parts[1]), int(parts[2]))
+        return entries
+
+    def _open_segment(self) -> None:
+        data_path, _, journal_path = self._paths(self._open_number)
+        self._open_data = open(data_path, "ab")
+        # Unvollständig geschriebene Members hinter dem letzten Journal-Eintrag verwerfen
+        end = max((offset + length for offset, length in self._open_index.values()), default=0)
+        self._open_data.truncate(end)
+        self._open_data.seek(end)
+        self._open_journal = open(journal_path, "a", encoding="utf-8")
+
+    def _seal_open_segment(self) -> None:
+        data_path, index_path, journal_path = self._paths(self._open_number)
+        self._open_data.close()
+        self._open_journal.close()
+
+        tmp_path = index_path.with_suffix(".idx.tmp")
+        entries = sorted((_index_key(decision_id), offset, length)
+                         for decision_id, (offset, length) in self._open_index.items())
+        with open(tmp_path, "wb") as f:
+            for key, offset, length in entries:
+                f.write(_INDEX_RECORD.pack(key, offset, length))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, index_path)
+
+        segment = _SealedSegment(data_path, index_path, self._attrs_path(self._open_number))
+        self._write_attributes(segment, (
+            {"decision_id": decision_id, "conflict_type": conflict_type, "project_id": project_id,
+             "participating_agents": participants}
+            for decision_id, (conflict_type, project_id, participants) in self._open_attributes.items()
+        ))
+        journal_path.unlink()
+
+        self._sealed.append(segment)
+        self._open_number += 1
+        self._open_index = {}
+        self._open_attributes = {}
+        self._open_segment()
+
+    def append(self, decision_data: Dict[str, Any]) -> None:
+        """Archiviert eine abgeschlossene Entscheidung (bereits archivierte werden ignoriert)."""
+        decision_id = decision_data["decision_id"]
+        line = json.dumps(decision_data, ensure_ascii=False, separators=(",", ":")) + "\n"
+        member = gzip.compress(line.encode("utf-8"), compresslevel=self.compresslevel, mtime=0)
+
+        with self._lock:
+            if self._locate(decision_id) is not None:
+                return
+            offset = self._open_data.tell()
+            self._open_data.write(member)
+            self._open_data.flush()
+            self._open_journal.write(f"{decision_id}\t{offset}\t{len(member)}\n")
+            self._open_journal.flush()
+            self._open_index[decision_id] = (offset, len(member))
+            self._open_attributes[decision_id] = _attribute_values(decision_data)
+
+            if len(self._open_index) >= self.segment_records:
+                self._seal_open_segment()
+
+    def _locate(self, decision_id: str) -> Optional[Tuple[Path, int, int]]:
+        entry = self._open_index.get(decision_id)
+        if entry is not None:
+            return self._paths(self._open_number)[0], entry[0], entry[1]
+
+        key = _index_key(decision_id)
+        # Längere IDs teilen sich ggf. einen gekürzten Schlüssel und werden am Datensatz geprüft
+        exact = len(decision_id.encode("utf-8")) <= _KEY_SIZE
+        for segment in reversed(self._sealed):
+            for offset, length in segment.locate(key):
+                if exact or json.loads(self._read(segment.data_path, offset, length))["decision_id"] == decision_id:
+                    return segment.data_path, offset, length
+        return None
+
+    @staticmethod
+    def _read(data_path: Path, offset: int, length: int) -> str:
+        with open(data_path, "rb") as f:
+            f.seek(offset)
+            return gzip.decompress(f.read(length)).decode("utf-8")
+
+    def get_json_line(self, decision_id: str) -> Optional[str]:
+        """Kompakte JSON-Zeile einer archivierten Entscheidung (ein Seek, ein Dekomprimieren)."""
+        with self._lock:
+            location = self._locate(decision_id)
+        if location is None:
+            return None
+        return self._read(*location)
+
+    def get(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        line = self.get_json_line(decision_id)
+        return json.loads(line) if line is not None else None
+
+    def __contains__(self, decision_id: str) -> bool:
+        with self._lock:
+            return self._locate(decision_id) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(segment.count for segment in self._sealed) + len(self._open_index)
+
+    def find(
+        self,
+        conflict_type: Optional[str] = None,
+        project_id: Optional[str] = None,
+        participant: Optional[str] = None
+    ) -> Set[str]:
+        """IDs archivierter Entscheidungen, die allen angegebenen Filtern entsprechen (ohne Dekomprimieren)."""
+        filters = [(name, value) for name, value in zip(_ATTRIBUTES, (conflict_type, project_id, participant))
+                   if value is not None]
+        with self._lock:
+            sealed = list(self._sealed)
+            result = {decision_id for decision_id, values in self._open_attributes.items() if _matches(values, filters)}
+        for segment in sealed:
+            result |= segment.find(filters)
+        return result
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Alle archivierten Entscheidungen in Archivierungs-Reihenfolge (streamend)."""
+        with self._lock:
+            segments = [(segment.data_path, None) for segment in self._sealed]
+            open_path = self._paths(self._open_number)[0]
+            segments.append((open_path, max((o + l for o, l in self._open_index.values()), default=0)))
+
+        for data_path, end in segments:
+            yield from self._iter_segment(data_path, end)
+
+    @staticmethod
+    def _iter_segment(data_path: Path, end: Optional[int]) -> Iterator[Dict[str, Any]]:
+        with open(data_path, "rb") as raw:
+            source = raw if end is None else _BoundedReader(raw, end)
+            with gzip.GzipFile(fileobj=source, mode="rb") as f:
+                for line in f:
+                    yield json.loads(line)
+
+    def close(self) -> None:
+        with self._lock:
+            for segment in self._sealed:
+                segment.close()
+            self._open_data.close()
+            self._open_journal.close()
+
+
+class _BoundedReader:
+    """Liest eine Datei nur bis `end`, damit ein gerade geschriebenes Member nicht halb gelesen wird."""
+
+    def __init__(self, raw, end: int):
+        self._raw = raw
+        self._end = end
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self._end - self._raw.tell()
+        if remaining <= 0:
+            return b""
+        if size < 0 or size > remaining:
+            size = remaining
+        return self._raw.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._raw.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._raw.tell()
+
+
+if __name__ == '__main__':
+    import tempfile
+    import time
+    import tracemalloc
+
+    from tools.decision_store import TieredDecisionStore
+    from tools.team_voting_tool import ConflictType, DemocraticVotingLogic, VotingPhase
+
+    print("=== Testing Tiered Decision Archive ===")
+
+    agents = ["Project Manager", "Developer", "Researcher", "Tester"]
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        engine = DemocraticVotingLogic(
+            store=TieredDecisionStore(archive_dir, hot_size=1000, segment_records=5_000), verbose=False
+        )
+
+        def run_decision(n: int) -> str:
+            decision_id = engine.trigger_democratic_decision(
+                ConflictType.ARCHITECTURE_DECISION, "Archive benchmark", f"Context {n} " * 20, agents
+            )
+            engine.advance_phase(decision_id, VotingPhase.IDEA_COLLECTION)
+            engine.add_agent_proposals_bulk(decision_id, [
+                {"agent_name": agent, "proposal": f"{agent} proposal {n}", "reasoning": "Reasoning " * 10}
+                for agent in agents
+            ])
+            engine.finalize_decision(decision_id, f"Final decision {n}")
+            return decision_id
+
+        print("\n1. Memory while completing decisions (hot set 1000, segments of 5k)...")
+        first_id = run_decision(0)
+        tracemalloc.start()
+        for n in range(1, 20_001):
+            run_decision(n)
+            if n % 5_000 == 0:
+                current, _ = tracemalloc.get_traced_memory()
+                print(f"  {n:>6} completed: {current / 1024 / 1024:6.2f} MiB traced")
+        tracemalloc.stop()
+
+        archive_bytes = sum(path.stat().st_size for path in Path(archive_dir).iterdir())
+        print(f"  Archive on disk: {archive_bytes / 1024 / 1024:.1f} MiB "
+              f"({archive_bytes / engine.store.count_completed():,.0f} B/decision)")
+
+        print("\n2. Looking up the oldest decision (archived, not in the hot set)...")
+        status = engine.get_decision_status(first_id)
+        print(f"  Found: {status['decision_id'] == first_id}, proposals {len(status['proposals'])}")
+        lookups = 2000
+        start = time.perf_counter()
+        for _ in range(lookups):
+            engine.get_decision_status(first_id)
+        elapsed = time.perf_counter() - start
+        print(f"  Cold lookup: {elapsed / lookups * 1e6:,.0f} us per get_decision_status")
+
+        print("\n3. Reopening the archive...")
+        engine.store.close()
+        reopened = TieredDecisionStore(archive_dir)
+        print(f"  Completed decisions: {reopened.count_completed()} (expected 20001), "
+              f"oldest found: {reopened.get(first_id) == status}")
+
+        print("\n4. Filtering archived decisions via the attribute index...")
+        start = time.perf_counter()
+        found = reopened.find(phase="commitment", conflict_type=ConflictType.ARCHITECTURE_DECISION.value,
+                              participant="Tester")
+        elapsed = time.perf_counter() - start
+        print(f"  Found {len(found)} (expected 20001) in {elapsed * 1000:.1f} ms, "
+              f"other participant: {len(reopened.find(participant='Designer'))} (expected 0)")
+        reopened.close()
+
+    print("\n=== Tiered Decision Archive Testing Complete ===")
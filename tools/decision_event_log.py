@@ -0,0 +1,165 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class DecisionEventLog:
+    """
+    Append-only Event-Log mit periodischen Snapshots für die Democracy Engine.
+
+    Jede Zustandsänderung der Engine wird als eine JSON-Zeile in `events.jsonl`
+    geschrieben. Nach `snapshot_interval` Events wird der komplette Zustand in
+    `snapshot.json` geschrieben und das Log geleert, sodass ein Neustart nur die
+    Events seit dem letzten Snapshot erneut anwenden muss.
+    """
+
+    EVENTS_FILE = "events.jsonl"
+    SNAPSHOT_FILE = "snapshot.json"
+
+    def __init__(self, directory: str, snapshot_interval: int = 500, fsync: bool = False):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.events_path = self.directory / self.EVENTS_FILE
+        self.snapshot_path = self.directory / self.SNAPSHOT_FILE
+        self.snapshot_interval = max(1, snapshot_interval)
+        self.fsync = fsync
+
+        self.last_seq = 0
+        self.snapshot_seq = 0
+        self.events_since_snapshot = 0
+        self._events_file = None
+
+    def load(self) -> Tuple[Optional[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+        """
+        Lädt den letzten Snapshot und liefert die danach geschriebenen Events.
+        Muss vor dem ersten `append` aufgerufen werden.
+        """
+        snapshot_state = None
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            self.snapshot_seq = snapshot.get("seq", 0)
+            self.last_seq = self.snapshot_seq
+            snapshot_state = snapshot.get("state")
+
+        return snapshot_state, self._iter_events()
+
+    def _iter_events(self) -> Iterator[Dict[str, Any]]:
+        if not self.events_path.exists():
+            return
+
+        # Ende des letzten vollständigen Records; alles danach wird vor dem nächsten
+        # `append` abgeschnitten, damit neue Events nicht an eine kaputte Zeile anschließen
+        good_end = 0
+        with open(self.events_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Zeile ohne Zeilenende: der Schreibvorgang wurde unterbrochen
+                    print(f"--- Democracy Event Log: Dropping torn record in {self.events_path} ---")
+                    break
+                if not line.strip():
+                    good_end += len(line)
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"--- Democracy Event Log: Dropping torn record in {self.events_path} ---")
+                    break
+                good_end += len(line)
+
+                # Events, die bereits im Snapshot enthalten sind, überspringen
+                if event["seq"] <= self.snapshot_seq:
+                    continue
+
+                self.last_seq = event["seq"]
+                self.events_since_snapshot += 1
+                yield event
+
+        if self.events_path.stat().st_size > good_end:
+            os.truncate(self.events_path, good_end)
+
+    def append(self, event_type: str, data: Dict[str, Any]) -> int:
+        """Schreibt ein Event ans Ende des Logs und gibt seine Sequenznummer zurück."""
+        if self._events_file is None:
+            self._events_file = open(self.events_path, "a", encoding="utf-8")
+
+        self.last_seq += 1
+        record = {"seq": self.last_seq, "type": event_type, "data": data}
+        self._events_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._events_file.flush()
+        if self.fsync:
+            os.fsync(self._events_file.fileno())
+
+        self.events_since_snapshot += 1
+        return self.last_seq
+
+    def should_snapshot(self) -> bool:
+        return self.events_since_snapshot >= self.snapshot_interval
+
+    def write_snapshot(self, state: Dict[str, Any]) -> None:
+        """
+        Schreibt den kompletten Zustand atomar als Snapshot und kompaktiert das Log.
+        Stürzt der Prozess zwischen Snapshot und Kompaktierung ab, werden die
+        doppelten Events beim Laden anhand der Sequenznummer übersprungen.
+        """
+        tmp_path = self.snapshot_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"seq": self.last_seq, "state": state}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self.snapshot_seq = self.last_seq
+
+        if self._events_file is not None:
+            self._events_file.close()
+        self._events_file = open(self.events_path, "w", encoding="utf-8")
+        self.events_since_snapshot = 0
+
+        print(f"--- Democracy Event Log: Snapshot written at seq {self.snapshot_seq} ---")
+
+    def close(self) -> None:
+        if self._events_file is not None:
+            self._events_file.close()
+            self._events_file = None
+
+
+def create_event_log_from_env() -> Optional[DecisionEventLog]:
+    """
+    Erstellt ein Event-Log, falls `DEMOCRACY_EVENT_LOG_DIR` gesetzt ist.
+    Optional: `DEMOCRACY_SNAPSHOT_INTERVAL` und `DEMOCRACY_EVENT_LOG_FSYNC`.
+    """
+    log_dir = os.getenv("DEMOCRACY_EVENT_LOG_DIR")
+    if not log_dir:
+        return None
+
+    snapshot_interval = int(os.getenv("DEMOCRACY_SNAPSHOT_INTERVAL", "500"))
+    fsync = os.getenv("DEMOCRACY_EVENT_LOG_FSYNC", "false").lower() in ("1", "true", "yes")
+    return DecisionEventLog(log_dir, snapshot_interval=snapshot_interval, fsync=fsync)
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    print("=== Testing Decision Event Log ===")
+    with tempfile.TemporaryDirectory() as log_dir:
+        log = DecisionEventLog(log_dir)
+        list(log.load()[1])
+        log.append("proposal_added", {"agent": "Developer"})
+        log.close()
+        # Absturz mitten im Schreiben simulieren
+        with open(log.events_path, "a", encoding="utf-8") as f:
+            f.write('{"seq": 2, "type": "proposal_ad')
+
+        restarted = DecisionEventLog(log_dir)
+        print(f"\n1. Replay after torn write: {len(list(restarted.load()[1]))} event(s)")
+        restarted.append("proposal_added", {"agent": "Tester"})
+        restarted.append("proposal_added", {"agent": "Architect"})
+        restarted.close()
+
+        reopened = DecisionEventLog(log_dir)
+        agents = [event["data"]["agent"] for event in reopened.load()[1]]
+        print(f"2. Restart -> append 2 -> restart: {agents} (expected 3, last seq {reopened.last_seq})")
+        reopened.close()
+
+    print("\n=== Decision Event Log Testing Complete ===")
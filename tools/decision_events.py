@@ -0,0 +1,132 @@
+import asyncio
+import itertools
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+# Themen, die die Democracy Engine veröffentlicht
+DECISION_TRIGGERED = "decision_triggered"
+PROPOSAL_ADDED = "proposal_added"
+OPTIONS_SYNTHESIZED = "options_synthesized"
+VOTE_SUBMITTED = "vote_submitted"
+WINNER_CALCULATED = "winner_calculated"
+PHASE_CHANGED = "phase_changed"
+DECISION_FINALIZED = "decision_finalized"
+
+ALL_TOPICS = frozenset({
+    DECISION_TRIGGERED, PROPOSAL_ADDED, OPTIONS_SYNTHESIZED, VOTE_SUBMITTED,
+    WINNER_CALCULATED, PHASE_CHANGED, DECISION_FINALIZED,
+})
+
+
+@dataclass(slots=True)
+class DecisionNotification:
+    """Benachrichtigung über ein Event einer Entscheidung (Zustand direkt nach dem Event)."""
+    topic: str
+    decision_id: str
+    project_id: str
+    phase: str
+    version: int
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _Subscription:
+    deliver: Callable[[DecisionNotification], None]
+    topics: Optional[FrozenSet[str]]
+    decision_id: Optional[str]
+    project_id: Optional[str]
+
+    def matches(self, notification: DecisionNotification) -> bool:
+        return (
+            (self.topics is None or notification.topic in self.topics)
+            and (self.decision_id is None or notification.decision_id == self.decision_id)
+            and (self.project_id is None or notification.project_id == self.project_id)
+        )
+
+
+class DecisionEventBus:
+    """
+    Pub/Sub für Zustandsänderungen der Democracy Engine.
+
+    Orchestratoren abonnieren Themen (z.B. `PHASE_CHANGED`) optional gefiltert nach
+    Entscheidung oder Projekt, statt den Status wiederholt abzufragen. Callbacks
+    laufen synchron im Thread, der das Event ausgelöst hat, und sollten daher kurz
+    sein; für asyncio gibt es `subscribe_queue`, das Benachrichtigungen threadsicher
+    in eine `asyncio.Queue` des Event-Loops legt.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[int, _Subscription] = {}
+        self._ids = itertools.count(1)
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscriptions)
+
+    def subscribe(
+        self,
+        callback: Callable[[DecisionNotification], None],
+        topics: Optional[Iterable[str]] = None,
+        decision_id: Optional[str] = None,
+        project_id: Optional[str] = None
+    ) -> int:
+        """Registriert einen Callback und gibt die ID für `unsubscribe` zurück."""
+        topic_set = frozenset(topics) if topics is not None else None
+        if topic_set is not None and not topic_set <= ALL_TOPICS:
+            raise ValueError(f"Unknown topics {sorted(topic_set - ALL_TOPICS)}. Valid topics: {sorted(ALL_TOPICS)}")
+
+        with self._lock:
+            subscription_id = next(self._ids)
+            self._subscriptions[subscription_id] = _Subscription(callback, topic_set, decision_id, project_id)
+        return subscription_id
+
+    def subscribe_queue(
+        self,
+        topics: Optional[Iterable[str]] = None,
+        decision_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        maxsize: int = 0
+    ) -> Tuple[int, "asyncio.Queue[DecisionNotification]"]:
+        """
+        Abonniert in eine `asyncio.Queue`. Ohne `loop` muss aus einer laufenden
+        Coroutine aufgerufen werden. Ist die Queue voll, wird die Benachrichtigung verworfen.
+        """
+        loop = loop or asyncio.get_running_loop()
+        queue: "asyncio.Queue[DecisionNotification]" = asyncio.Queue(maxsize=maxsize)
+
+        def put(notification: DecisionNotification) -> None:
+            if not queue.full():
+                queue.put_nowait(notification)
+
+        subscription_id = None
+
+        def deliver(notification: DecisionNotification) -> None:
+            try:
+                loop.call_soon_threadsafe(put, notification)
+            except RuntimeError:
+                # Event-Loop wurde geschlossen
+                self.unsubscribe(subscription_id)
+
+        subscription_id = self.subscribe(deliver, topics, decision_id, project_id)
+        return subscription_id, queue
+
+    def unsubscribe(self, subscription_id: int) -> bool:
+        with self._lock:
+            return self._subscriptions.pop(subscription_id, None) is not None
+
+    def publish(self, notification: DecisionNotification) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.values())
+
+        for subscription in subscriptions:
+            if not subscription.matches(notification):
+                continue
+            try:
+                subscription.deliver(notification)
+            except Exception as e:
+                # Ein fehlerhafter Abonnent darf die Engine nicht blockieren
+                print(f"--- Democracy Engine: Subscriber error on {notification.topic} "
+                      f"for {notification.decision_id}: {e} ---")
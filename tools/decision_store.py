@@ -0,0 +1,443 @@
+import json
+import os
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+
+from tools.compact_records import CompactDecision
+from tools.decision_archive import DecisionArchive
+
+
+def _status_json(decision_data: Dict[str, Any]) -> str:
+    """Serialisiert den Status genau so, wie ihn der Get Decision Status Tool ausgibt."""
+    return json.dumps(decision_data, indent=2, ensure_ascii=False)
+
+
+class DecisionStore(ABC):
+    """
+    Schnittstelle für austauschbare Speicher-Backends der Democracy Engine.
+
+    Gespeichert werden Entscheidungen als `to_dict()`-Repräsentation. Die Engine
+    schreibt bei jedem Phasenwechsel und bei der Finalisierung; abgeschlossene
+    Entscheidungen sind danach unveränderlich, daher wird ihr Status einmalig
+    serialisiert und bei jeder Abfrage wiederverwendet.
+    """
+
+    # True, wenn abgeschlossene Entscheidungen einen Neustart überleben und daher
+    # nicht in Event-Log-Snapshots aufgenommen werden müssen
+    persistent = False
+
+    @abstractmethod
+    def save(self, decision_data: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    def get(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def get_json(self, decision_id: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    def find(
+        self,
+        phase: Optional[str] = None,
+        conflict_type: Optional[str] = None,
+        participant: Optional[str] = None,
+        project_id: Optional[str] = None
+    ) -> List[str]:
+        """Gibt die IDs aller Entscheidungen zurück, die allen angegebenen Filtern entsprechen."""
+
+    @abstractmethod
+    def iter_completed(self) -> Iterator[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def count_completed(self) -> int:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class _DecisionIndex:
+    """Hash-Indizes (Phase, Konflikttyp, Teilnehmer, Projekt) über Entscheidungs-IDs."""
+
+    def __init__(self):
+        self._by_phase: Dict[str, Set[str]] = {}
+        self._by_conflict_type: Dict[str, Set[str]] = {}
+        self._by_participant: Dict[str, Set[str]] = {}
+        self._by_project: Dict[str, Set[str]] = {}
+
+    @staticmethod
+    def _keys(record: Union[Dict[str, Any], CompactDecision]):
+        if isinstance(record, CompactDecision):
+            return record.current_phase, record.conflict_type, record.participating_agents, record.project_id
+        return (record["current_phase"], record["conflict_type"], record.get("participating_agents", []),
+                record.get("project_id", ""))
+
+    def add(self, decision_id: str, record: Union[Dict[str, Any], CompactDecision]) -> None:
+        phase, conflict_type, participants, project_id = self._keys(record)
+        self._by_phase.setdefault(phase, set()).add(decision_id)
+        self._by_conflict_type.setdefault(conflict_type, set()).add(decision_id)
+        self._by_project.setdefault(project_id, set()).add(decision_id)
+        for participant in participants:
+            self._by_participant.setdefault(participant, set()).add(decision_id)
+
+    def remove(self, decision_id: str, record: Union[Dict[str, Any], CompactDecision]) -> None:
+        phase, conflict_type, participants, project_id = self._keys(record)
+        self._by_phase.get(phase, set()).discard(decision_id)
+        self._by_conflict_type.get(conflict_type, set()).discard(decision_id)
+        self._by_project.get(project_id, set()).discard(decision_id)
+        for participant in participants:
+            self._by_participant.get(participant, set()).discard(decision_id)
+
+    def find(
+        self,
+        phase: Optional[str] = None,
+        conflict_type: Optional[str] = None,
+        participant: Optional[str] = None,
+        project_id: Optional[str] = None
+    ) -> Optional[Set[str]]:
+        """Schnittmenge der angegebenen Filter; None, wenn kein Filter gesetzt ist."""
+        candidate_sets = []
+        if phase is not None:
+            candidate_sets.append(self._by_phase.get(phase, set()))
+        if conflict_type is not None:
+            candidate_sets.append(self._by_conflict_type.get(conflict_type, set()))
+        if participant is not None:
+            candidate_sets.append(self._by_participant.get(participant, set()))
+        if project_id is not None:
+            candidate_sets.append(self._by_project.get(project_id, set()))
+
+        if not candidate_sets:
+            return None
+
+        # Mit der kleinsten Menge beginnen, damit die Schnittmenge billig bleibt
+        candidate_sets.sort(key=len)
+        result = set(candidate_sets[0])
+        for candidates in candidate_sets[1:]:
+            result &= candidates
+        return result
+
+
+class InMemoryDecisionStore(DecisionStore):
+    """
+    Speichert Entscheidungen im Prozess (bisheriges Verhalten) mit Hash-Indizes.
+    Abgeschlossene Entscheidungen werden als `CompactDecision` archiviert.
+    """
+
+    # Anzahl serialisierter Status-Antworten, die im Speicher gehalten werden
+    JSON_CACHE_SIZE = 1024
+
+    def __init__(self):
+        self._decisions: Dict[str, Union[Dict[str, Any], CompactDecision]] = {}
+        self._json_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._completed_ids: List[str] = []
+        self._index = _DecisionIndex()
+
+    def save(self, decision_data: Dict[str, Any]) -> None:
+        decision_id = decision_data["decision_id"]
+        previous = self._decisions.pop(decision_id, None)
+        if previous is not None:
+            self._index.remove(decision_id, previous)
+        self._json_cache.pop(decision_id, None)
+
+        if decision_data.get("end_time"):
+            if previous is None or isinstance(previous, dict):
+                self._completed_ids.append(decision_id)
+            record = CompactDecision.from_dict(decision_data)
+        else:
+            record = decision_data
+
+        self._decisions[decision_id] = record
+        self._index.add(decision_id, record)
+
+    def get(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        record = self._decisions.get(decision_id)
+        if isinstance(record, CompactDecision):
+            return record.to_dict()
+        return record
+
+    def get_json(self, decision_id: str) -> Optional[str]:
+        cached = self._json_cache.get(decision_id)
+        if cached is not None:
+            self._json_cache.move_to_end(decision_id)
+            return cached
+
+        decision_data = self.get(decision_id)
+        if decision_data is None:
+            return None
+
+        status_json = _status_json(decision_data)
+        self._json_cache[decision_id] = status_json
+        if len(self._json_cache) > self.JSON_CACHE_SIZE:
+            self._json_cache.popitem(last=False)
+        return status_json
+
+    def find(
+        self,
+        phase: Optional[str] = None,
+        conflict_type: Optional[str] = None,
+        participant: Optional[str] = None,
+        project_id: Optional[str] = None
+    ) -> List[str]:
+        result = self._index.find(phase, conflict_type, participant, project_id)
+        if result is None:
+            # Wie mit Filtern nach ID sortiert (bei ULIDs Auslöse-Reihenfolge)
+            return sorted(self._decisions)
+        return sorted(result)
+
+    def iter_completed(self) -> Iterator[Dict[str, Any]]:
+        for decision_id in self._completed_ids:
+            yield self._decisions[decision_id].to_dict()
+
+    def count_completed(self) -> int:
+        return len(self._completed_ids)
+
+
+class TieredDecisionStore(DecisionStore):
+    """
+    Gestaffelter Store für lang laufende Orchestratoren.
+
+    Laufende Entscheidungen liegen im Speicher. Abgeschlossene werden sofort in ein
+    komprimiertes `DecisionArchive` auf der Platte geschrieben; im Speicher bleiben
+    davon nur die `hot_size` zuletzt benutzten als `CompactDecision` (LRU). Ältere
+    Entscheidungen kosten damit keinen Speicher mehr, ein Lookup ist ein Seek plus
+    ein Dekomprimieren.
+    """
+
+    persistent = True
+
+    def __init__(self, directory: str, hot_size: int = 1000, segment_records: int = 10_000):
+        self.hot_size = max(1, hot_size)
+        self._lock = threading.RLock()
+        self._active: Dict[str, Dict[str, Any]] = {}
+        self._hot: "OrderedDict[str, CompactDecision]" = OrderedDict()
+        self._index = _DecisionIndex()
+        self._archive = DecisionArchive(directory, segment_records=segment_records)
+
+    def save(self, decision_data: Dict[str, Any]) -> None:
+        decision_id = decision_data["decision_id"]
+        with self._lock:
+            previous = self._active.pop(decision_id, None)
+            if previous is not None:
+                self._index.remove(decision_id, previous)
+
+            if not decision_data.get("end_time"):
+                self._active[decision_id] = decision_data
+                self._index.add(decision_id, decision_data)
+                return
+
+            # Abgeschlossene Entscheidungen sind unveränderlich; erneutes Speichern (Replay)
+            # ignoriert auch das Archiv selbst
+            if decision_id in self._hot:
+                return
+            self._archive.append(decision_data)
+            self._remember(decision_id, CompactDecision.from_dict(decision_data))
+
+    def _remember(self, decision_id: str, record: CompactDecision) -> None:
+        self._hot[decision_id] = record
+        self._index.add(decision_id, record)
+        while len(self._hot) > self.hot_size:
+            evicted_id, evicted = self._hot.popitem(last=False)
+            self._index.remove(evicted_id, evicted)
+
+    def get(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if decision_id in self._active:
+                return self._active[decision_id]
+            record = self._hot.get(decision_id)
+            if record is not None:
+                self._hot.move_to_end(decision_id)
+                return record.to_dict()
+        return self._archive.get(decision_id)
+
+    def get_json(self, decision_id: str) -> Optional[str]:
+        decision_data = self.get(decision_id)
+        return _status_json(decision_data) if decision_data is not None else None
+
+    def find(
+        self,
+        phase: Optional[str] = None,
+        conflict_type: Optional[str] = None,
+        participant: Optional[str] = None,
+        project_id: Optional[str] = None
+    ) -> List[str]:
+        with self._lock:
+            result = self._index.find(phase, conflict_type, participant, project_id)
+            if result is None:
+                result = set(self._active) | set(self._hot)
+
+        # Archivierte Entscheidungen sind alle abgeschlossen; nur dann den Attribut-Index
+        # des Archivs befragen (kein Dekomprimieren)
+        if phase is None or phase == "commitment":
+            result |= self._archive.find(conflict_type=conflict_type, project_id=project_id, participant=participant)
+        return sorted(result)
+
+    def iter_completed(self) -> Iterator[Dict[str, Any]]:
+        # Das Archiv enthält alle abgeschlossenen Entscheidungen in Abschluss-Reihenfolge
+        return self._archive.iter_records()
+
+    def count_completed(self) -> int:
+        return len(self._archive)
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+class SQLiteDecisionStore(DecisionStore):
+    """
+    Persistenter Store auf Basis von SQLite im WAL-Modus.
+    Indizes auf decision_id, phase, conflict_type, project_id und Teilnehmer.
+    """
+
+    persistent = True
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS decisions (
+            decision_id   TEXT PRIMARY KEY,
+            phase         TEXT NOT NULL,
+            conflict_type TEXT NOT NULL,
+            start_time    TEXT NOT NULL,
+            end_time      TEXT,
+            status_json   TEXT NOT NULL,
+            project_id    TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS idx_decisions_phase ON decisions (phase);
+        CREATE INDEX IF NOT EXISTS idx_decisions_conflict_type ON decisions (conflict_type);
+        CREATE INDEX IF NOT EXISTS idx_decisions_completed ON decisions (end_time) WHERE end_time IS NOT NULL;
+
+        CREATE TABLE IF NOT EXISTS decision_participants (
+            participant TEXT NOT NULL,
+            decision_id TEXT NOT NULL,
+            PRIMARY KEY (participant, decision_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_participants_decision ON decision_participants (decision_id);
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(decisions)")}
+        if "project_id" not in columns:
+            # Datenbank aus einer Version ohne Projektspalte: Spalte anlegen und aus dem Status füllen
+            self._conn.execute("ALTER TABLE decisions ADD COLUMN project_id TEXT NOT NULL DEFAULT ''")
+            self._conn.execute("UPDATE decisions SET project_id = COALESCE(json_extract(status_json, '$.project_id'), '')")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_decisions_project ON decisions (project_id, conflict_type)")
+        self._conn.commit()
+
+    def save(self, decision_data: Dict[str, Any]) -> None:
+        decision_id = decision_data["decision_id"]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO decisions "
+                "(decision_id, phase, conflict_type, start_time, end_time, status_json, project_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    decision_id,
+                    decision_data["current_phase"],
+                    decision_data["conflict_type"],
+                    decision_data["start_time"],
+                    decision_data.get("end_time"),
+                    _status_json(decision_data),
+                    decision_data.get("project_id", ""),
+                )
+            )
+            self._conn.execute("DELETE FROM decision_participants WHERE decision_id = ?", (decision_id,))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO decision_participants (participant, decision_id) VALUES (?, ?)",
+                [(participant, decision_id) for participant in decision_data.get("participating_agents", [])]
+            )
+
+    def get(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        status_json = self.get_json(decision_id)
+        return json.loads(status_json) if status_json is not None else None
+
+    def get_json(self, decision_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_json FROM decisions WHERE decision_id = ?", (decision_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def find(
+        self,
+        phase: Optional[str] = None,
+        conflict_type: Optional[str] = None,
+        participant: Optional[str] = None,
+        project_id: Optional[str] = None
+    ) -> List[str]:
+        query = "SELECT d.decision_id FROM decisions d"
+        clauses = []
+        params: List[Any] = []
+
+        if participant is not None:
+            query += " JOIN decision_participants p ON p.decision_id = d.decision_id"
+            clauses.append("p.participant = ?")
+            params.append(participant)
+        if phase is not None:
+            clauses.append("d.phase = ?")
+            params.append(phase)
+        if conflict_type is not None:
+            clauses.append("d.conflict_type = ?")
+            params.append(conflict_type)
+        if project_id is not None:
+            clauses.append("d.project_id = ?")
+            params.append(project_id)
+
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY d.decision_id"
+
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query, params)]
+
+    def iter_completed(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status_json FROM decisions WHERE end_time IS NOT NULL ORDER BY end_time"
+            ).fetchall()
+        for row in rows:
+            yield json.loads(row[0])
+
+    def count_completed(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM decisions WHERE end_time IS NOT NULL").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_decision_store_from_env() -> DecisionStore:
+    """
+    Wählt das Speicher-Backend über `DEMOCRACY_STORE_BACKEND` ('memory', 'sqlite' oder 'tiered').
+    Für SQLite wird der Pfad aus `DEMOCRACY_STORE_PATH` gelesen, für das gestaffelte
+    Archiv das Verzeichnis aus `DEMOCRACY_ARCHIVE_DIR`, die Größe des Hot-Sets aus
+    `DEMOCRACY_ARCHIVE_HOT_SIZE` und die Einträge pro Segment aus
+    `DEMOCRACY_ARCHIVE_SEGMENT_RECORDS`.
+    """
+    backend = os.getenv("DEMOCRACY_STORE_BACKEND", "memory").lower()
+    if backend == "sqlite":
+        db_path = os.getenv("DEMOCRACY_STORE_PATH", "democracy_engine.sqlite3")
+        return SQLiteDecisionStore(db_path)
+    if backend == "tiered":
+        return TieredDecisionStore(
+            os.getenv("DEMOCRACY_ARCHIVE_DIR", "democracy_archive"),
+            hot_size=int(os.getenv("DEMOCRACY_ARCHIVE_HOT_SIZE", "1000")),
+            segment_records=int(os.getenv("DEMOCRACY_ARCHIVE_SEGMENT_RECORDS", "10000"))
+        )
+    if backend != "memory":
+        print(f"WARNUNG (DecisionStore): Unknown backend '{backend}', falling back to in-memory store.")
+    return InMemoryDecisionStore()
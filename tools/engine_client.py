@@ -0,0 +1,254 @@
+import json
+import socket
+import struct
+import threading
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.decision_events import DecisionEventBus, DecisionNotification
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Rahmen: 4 Byte Länge (Big Endian) + 1 Byte Codec, danach der Payload
+_FRAME_HEADER = struct.Struct(">IB")
+CODEC_JSON = 0
+CODEC_MSGPACK = 1
+
+
+def encode_frame(message: Dict[str, Any], codec: int) -> bytes:
+    if codec == CODEC_MSGPACK:
+        body = msgpack.packb(message, use_bin_type=True)
+    else:
+        body = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _FRAME_HEADER.pack(len(body), codec) + body
+
+
+def decode_frames(buffer: bytearray) -> List[Tuple[Dict[str, Any], int]]:
+    """Entnimmt alle vollständigen Rahmen aus `buffer` (der Rest bleibt für den nächsten recv)."""
+    messages = []
+    position = 0
+    while len(buffer) - position >= _FRAME_HEADER.size:
+        length, codec = _FRAME_HEADER.unpack_from(buffer, position)
+        start = position + _FRAME_HEADER.size
+        if len(buffer) - start < length:
+            break
+        body = bytes(buffer[start:start + length])
+        if codec == CODEC_MSGPACK:
+            messages.append((msgpack.unpackb(body, raw=False), codec))
+        else:
+            messages.append((json.loads(body), codec))
+        position = start + length
+    del buffer[:position]
+    return messages
+
+
+def _wire_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+class RemoteEngineError(RuntimeError):
+    """Fehler, den der Engine-Server bei der Ausführung einer Anfrage gemeldet hat."""
+
+
+class RemoteDemocraticVotingLogic:
+    """
+    Dünner Client für einen `DemocracyEngineServer` über einen Unix Domain Socket.
+
+    Bietet dieselben Methoden wie `DemocraticVotingLogic`, sodass die CrewAI-Tools
+    über `DEMOCRACY_ENGINE_SOCKET` ohne Codeänderung auf eine gemeinsame Engine
+    mehrerer Prozesse umgestellt werden können. Jeder Thread nutzt eine eigene
+    Verbindung; `call_many` schickt mehrere Anfragen gepipelined in einem Schreibvorgang.
+    Benachrichtigungen (`events`) kommen über eine eigene Verbindung vom Server.
+    """
+
+    def __init__(self, socket_path: str, codec: Optional[int] = None, timeout: Optional[float] = 30.0):
+        self.socket_path = socket_path
+        self.codec = codec if codec is not None else (CODEC_MSGPACK if msgpack is not None else CODEC_JSON)
+        self.timeout = timeout
+        self.verbose = False
+        self._local = threading.local()
+        self._events: Optional[DecisionEventBus] = None
+        self._events_lock = threading.Lock()
+
+    # === TRANSPORT ===
+
+    def _connection(self) -> Tuple[socket.socket, bytearray]:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            connection = (sock, bytearray())
+            self._local.connection = connection
+            self._local.next_id = 0
+        return connection
+
+    def call_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """Sendet alle Aufrufe (Methode, kwargs) auf einmal und liefert die Ergebnisse in Reihenfolge."""
+        sock, buffer = self._connection()
+        request_ids = []
+        frames = []
+        for method, kwargs in calls:
+            self._local.next_id += 1
+            request_ids.append(self._local.next_id)
+            frames.append(encode_frame({
+                "id": self._local.next_id,
+                "method": method,
+                "kwargs": {name: _wire_value(value) for name, value in kwargs.items()}
+            }, self.codec))
+
+        try:
+            sock.sendall(b"".join(frames))
+            responses: Dict[int, Dict[str, Any]] = {}
+            while len(responses) < len(request_ids):
+                chunk = sock.recv(1 << 16)
+                if not chunk:
+                    raise ConnectionError(f"Democracy engine server at {self.socket_path} closed the connection")
+                buffer.extend(chunk)
+                for response, _ in decode_frames(buffer):
+                    responses[response["id"]] = response
+        except (OSError, ConnectionError):
+            # Verbindung verwerfen, der nächste Aufruf verbindet neu
+            self._local.connection = None
+            sock.close()
+            raise
+
+        results = []
+        for request_id in request_ids:
+            response = responses[request_id]
+            if "error" in response:
+                raise RemoteEngineError(response["error"])
+            results.append(response["result"])
+        return results
+
+    def call(self, method: str, **kwargs: Any) -> Any:
+        return self.call_many([(method, kwargs)])[0]
+
+    @property
+    def events(self) -> DecisionEventBus:
+        """Lokaler Event-Bus, gespeist vom Benachrichtigungs-Stream des Servers."""
+        with self._events_lock:
+            if self._events is None:
+                events = DecisionEventBus()
+                subscribed = threading.Event()
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.connect(self.socket_path)
+                sock.sendall(encode_frame({"id": 0, "method": "subscribe", "kwargs": {}}, self.codec))
+                threading.Thread(target=self._read_notifications, args=(sock, events, subscribed), daemon=True).start()
+                # Erst nach der Bestätigung des Servers ist das Abonnement aktiv (wichtig für wait_for_phase)
+                if not subscribed.wait(self.timeout):
+                    sock.close()
+                    raise ConnectionError(f"Democracy engine server at {self.socket_path} did not confirm the subscription")
+                self._events = events
+            return self._events
+
+    def _read_notifications(self, sock: socket.socket, events: DecisionEventBus, subscribed: threading.Event) -> None:
+        buffer = bytearray()
+        with sock:
+            while True:
+                try:
+                    chunk = sock.recv(1 << 16)
+                except OSError:
+                    break
+                if not chunk:
+                    break
+                buffer.extend(chunk)
+                for message, _ in decode_frames(buffer):
+                    if "notification" in message:
+                        events.publish(DecisionNotification(**message["notification"]))
+                    else:
+                        subscribed.set()
+        print(f"--- Democracy Engine Client: Notification stream from {self.socket_path} closed ---")
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection[0].close()
+            self._local.connection = None
+
+    # === ENGINE-API ===
+
+    def trigger_democratic_decision(self, conflict_type, trigger_reason: str, context: str,
+                                    participating_agents: List[str], project_id: str = "") -> str:
+        return self.call("trigger_democratic_decision", conflict_type=conflict_type, trigger_reason=trigger_reason,
+                         context=context, participating_agents=participating_agents, project_id=project_id)
+
+    def add_agent_proposal(self, decision_id: str, agent_name: str, proposal: str, reasoning: str) -> bool:
+        return self.call("add_agent_proposal", decision_id=decision_id, agent_name=agent_name,
+                         proposal=proposal, reasoning=reasoning)
+
+    def add_agent_proposals_bulk(self, decision_id: str, proposals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.call("add_agent_proposals_bulk", decision_id=decision_id, proposals=proposals)
+
+    def synthesize_options(self, decision_id: str, synthesized_options: List[Dict[str, Any]]) -> bool:
+        return self.call("synthesize_options", decision_id=decision_id, synthesized_options=synthesized_options)
+
+    def submit_agent_vote(self, decision_id: str, agent_name: str, ranked_option_ids: List[str], reasoning: str) -> bool:
+        return self.call("submit_agent_vote", decision_id=decision_id, agent_name=agent_name,
+                         ranked_option_ids=ranked_option_ids, reasoning=reasoning)
+
+    def submit_agent_votes_bulk(self, decision_id: str, ballots: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.call("submit_agent_votes_bulk", decision_id=decision_id, ballots=ballots)
+
+    def is_outcome_locked(self, decision_id: str, method: Optional[str] = None) -> bool:
+        return self.call("is_outcome_locked", decision_id=decision_id, method=method)
+
+    def get_pending_voters(self, decision_id: str) -> List[str]:
+        return self.call("get_pending_voters", decision_id=decision_id)
+
+    def calculate_ranked_choice_winner(self, decision_id: str, method: Optional[str] = None) -> Optional[str]:
+        return self.call("calculate_ranked_choice_winner", decision_id=decision_id, method=method)
+
+    def finalize_decision(self, decision_id: str, final_decision_text: str) -> bool:
+        return self.call("finalize_decision", decision_id=decision_id, final_decision_text=final_decision_text)
+
+    def get_live_standings(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        return self.call("get_live_standings", decision_id=decision_id)
+
+    def get_decision_status(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        return self.call("get_decision_status", decision_id=decision_id)
+
+    def get_decision_status_json(self, decision_id: str) -> Optional[str]:
+        return self.call("get_decision_status_json", decision_id=decision_id)
+
+    def get_decision_delta(self, decision_id: str, since_version: int) -> Optional[Dict[str, Any]]:
+        return self.call("get_decision_delta", decision_id=decision_id, since_version=since_version)
+
+    def find_decisions_by_project(self, project_id: str, conflict_type=None) -> List[str]:
+        return self.call("find_decisions_by_project", project_id=project_id, conflict_type=conflict_type)
+
+    def find_decisions(self, phase=None, conflict_type=None, participant: Optional[str] = None) -> List[str]:
+        return self.call("find_decisions", phase=phase, conflict_type=conflict_type, participant=participant)
+
+    def has_reached_phase(self, decision_id: str, phase) -> bool:
+        return self.call("has_reached_phase", decision_id=decision_id, phase=phase)
+
+    def wait_for_phase(self, decision_id: str, phase, timeout: Optional[float] = None) -> bool:
+        """
+        Wartet über den Benachrichtigungs-Stream statt auf dem Server, damit ein Aufruf
+        keinen Handler-Thread des Servers für die ganze Wartezeit belegt.
+        """
+        from tools.decision_events import DECISION_FINALIZED, PHASE_CHANGED
+        from tools.team_voting_tool import _PHASE_ORDER
+
+        target = _PHASE_ORDER[_wire_value(phase)]
+        reached = threading.Event()
+
+        def on_notification(notification: DecisionNotification) -> None:
+            if notification.topic == DECISION_FINALIZED or _PHASE_ORDER[notification.phase] >= target:
+                reached.set()
+
+        # Erst abonnieren, dann prüfen - sonst ginge ein Wechsel dazwischen verloren
+        subscription_id = self.events.subscribe(
+            on_notification, topics=(PHASE_CHANGED, DECISION_FINALIZED), decision_id=decision_id
+        )
+        try:
+            return self.has_reached_phase(decision_id, phase) or reached.wait(timeout)
+        finally:
+            self.events.unsubscribe(subscription_id)
+
+    def advance_phase(self, decision_id: str, new_phase, from_phase=None) -> bool:
+        return self.call("advance_phase", decision_id=decision_id, new_phase=new_phase, from_phase=from_phase)
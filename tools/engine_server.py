@@ -0,0 +1,274 @@
+import argparse
+import os
+import queue
+import socket
+import socketserver
+import threading
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Optional
+
+from tools.decision_event_log import create_event_log_from_env
+from tools.decision_events import DecisionNotification
+from tools.engine_client import decode_frames, encode_frame
+from tools.phase_scheduler import create_phase_scheduler_from_env
+from tools.team_voting_tool import ConflictType, DemocraticVotingLogic, VotingPhase, _democracy_engine
+
+# Methoden, die Clients aufrufen dürfen. wait_for_phase fehlt bewusst: es würde einen
+# Handler-Thread für die ganze Wartezeit belegen; der Client wartet auf Benachrichtigungen
+REMOTE_METHODS = frozenset({
+    "trigger_democratic_decision", "add_agent_proposal", "add_agent_proposals_bulk", "synthesize_options",
+    "submit_agent_vote", "submit_agent_votes_bulk", "is_outcome_locked", "get_pending_voters",
+    "calculate_ranked_choice_winner", "finalize_decision", "get_live_standings", "get_decision_status",
+    "get_decision_status_json", "get_decision_delta", "find_decisions_by_project", "find_decisions",
+    "has_reached_phase", "advance_phase",
+})
+
+# Maximal gepufferte Benachrichtigungen je Abonnent; wer weiter zurückliegt, wird getrennt
+NOTIFICATION_QUEUE_SIZE = int(os.getenv("DEMOCRACY_NOTIFICATION_QUEUE_SIZE", "1024"))
+
+# Argumente, die auf dem Draht als Enum-Wert übertragen werden
+_ENUM_ARGUMENTS = {
+    "conflict_type": ConflictType,
+    "phase": VotingPhase,
+    "new_phase": VotingPhase,
+    "from_phase": VotingPhase,
+}
+
+
+class _EngineRequestHandler(socketserver.BaseRequestHandler):
+    """
+    Liest Rahmen einer Verbindung, führt sie der Reihe nach aus und schreibt die
+    Antworten aller bereits empfangenen (gepipelineten) Anfragen gesammelt zurück.
+    """
+
+    def handle(self) -> None:
+        engine: DemocraticVotingLogic = self.server.engine
+        buffer = bytearray()
+        while True:
+            try:
+                chunk = self.request.recv(1 << 16)
+            except OSError:
+                return
+            if not chunk:
+                return
+            buffer.extend(chunk)
+
+            responses = []
+            for message, codec in decode_frames(buffer):
+                if message.get("method") == "subscribe":
+                    self._stream_notifications(engine, codec)
+                    return
+                responses.append(encode_frame(self._execute(engine, message), codec))
+            if responses:
+                self.request.sendall(b"".join(responses))
+
+    @staticmethod
+    def _execute(engine: DemocraticVotingLogic, message: Dict[str, Any]) -> Dict[str, Any]:
+        method = message.get("method")
+        if method not in REMOTE_METHODS:
+            return {"id": message.get("id"), "error": f"Unknown method '{method}'"}
+
+        kwargs = dict(message.get("kwargs", {}))
+        try:
+            for name, enum_type in _ENUM_ARGUMENTS.items():
+                if kwargs.get(name) is not None:
+                    kwargs[name] = enum_type(kwargs[name])
+            return {"id": message.get("id"), "result": getattr(engine, method)(**kwargs)}
+        except Exception as e:
+            return {"id": message.get("id"), "error": f"{type(e).__name__}: {e}"}
+
+    def _stream_notifications(self, engine: DemocraticVotingLogic, codec: int) -> None:
+        """
+        Schickt alle Engine-Benachrichtigungen an diese Verbindung, bis der Client trennt.
+        Die Engine veröffentlicht unter dem Entscheidungs-Lock; deshalb landen die Rahmen
+        nur in einer begrenzten Queue, die ein eigener Writer-Thread abarbeitet. Läuft die
+        Queue über, weil der Client nicht mitliest, wird er getrennt statt die Engine zu bremsen.
+        """
+        outbox: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+        closed = threading.Event()
+
+        def disconnect() -> None:
+            closed.set()
+            try:
+                # Weckt recv() und ein blockiertes sendall() auf
+                self.request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+        def forward(notification: DecisionNotification) -> None:
+            if closed.is_set():
+                return
+            try:
+                outbox.put_nowait(encode_frame({"notification": asdict(notification)}, codec))
+            except queue.Full:
+                print(f"--- Democracy Engine: Dropping notification subscriber after {NOTIFICATION_QUEUE_SIZE} "
+                      f"undelivered notifications ---")
+                disconnect()
+
+        def write() -> None:
+            while True:
+                frame = outbox.get()
+                if frame is None or closed.is_set():
+                    return
+                try:
+                    self.request.sendall(frame)
+                except OSError:
+                    disconnect()
+                    return
+
+        writer = threading.Thread(target=write, name="democracy-notification-writer", daemon=True)
+        writer.start()
+        subscription_id = engine.events.subscribe(forward)
+        # Bestätigung erst nach dem Abonnieren: ab hier verpasst der Client keine Benachrichtigung
+        outbox.put_nowait(encode_frame({"id": 0, "result": True}, codec))
+        try:
+            while not closed.is_set():
+                try:
+                    if not self.request.recv(1024):
+                        break
+                except OSError:
+                    break
+        finally:
+            engine.events.unsubscribe(subscription_id)
+            closed.set()
+            try:
+                outbox.put_nowait(None)
+            except queue.Full:
+                # Der Writer prüft `closed` nach jedem Rahmen bzw. wird durch shutdown() geweckt
+                disconnect()
+            writer.join()
+
+
+class DemocracyEngineServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Stellt eine Democracy Engine über einen Unix Domain Socket bereit, damit Crews
+    in mehreren Prozessen an denselben Entscheidungen teilnehmen können.
+    Protokoll: 4 Byte Länge + 1 Byte Codec (JSON oder msgpack) pro Rahmen.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, engine: DemocraticVotingLogic):
+        self.engine = engine
+        self.socket_path = socket_path
+        if os.path.exists(socket_path):
+            # Verwaisten Socket eines beendeten Servers entfernen
+            os.unlink(socket_path)
+        super().__init__(socket_path, _EngineRequestHandler)
+
+    def start_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def _local_engine() -> DemocraticVotingLogic:
+    # Ist DEMOCRACY_ENGINE_SOCKET gesetzt, ist die globale Instanz ein Client - der Server braucht die echte Engine
+    if isinstance(_democracy_engine, DemocraticVotingLogic):
+        return _democracy_engine
+    return DemocraticVotingLogic(event_log=create_event_log_from_env())
+
+
+def _run_benchmark(socket_path: str) -> None:
+    import statistics
+    import subprocess
+    import sys
+    import time
+
+    from tools.engine_client import CODEC_JSON, CODEC_MSGPACK, RemoteDemocraticVotingLogic
+
+    agents = [f"Agent_{i}" for i in range(2000)]
+
+    def prepare(engine) -> str:
+        decision_id = engine.trigger_democratic_decision(
+            ConflictType.MANUAL_TRIGGER, "Socket benchmark", "Latency", agents
+        )
+        engine.advance_phase(decision_id, VotingPhase.IDEA_COLLECTION)
+        return decision_id
+
+    def latency(label: str, engine, call: Callable[[str, int], Any], decision_id: str, count: int = 2000) -> None:
+        samples = []
+        for n in range(count):
+            start = time.perf_counter()
+            call(decision_id, n)
+            samples.append(time.perf_counter() - start)
+        samples.sort()
+        print(f"  {label:<38} p50 {statistics.median(samples) * 1e6:7.1f} us   "
+              f"p99 {samples[int(len(samples) * 0.99)] * 1e6:7.1f} us   {count / sum(samples):>9,.0f} ops/s")
+
+    def propose(engine) -> Callable[[str, int], Any]:
+        return lambda decision_id, n: engine.add_agent_proposal(decision_id, agents[n], f"Proposal {n}", "Reasoning")
+
+    def status(engine) -> Callable[[str, int], Any]:
+        return lambda decision_id, n: engine.get_decision_status(decision_id)
+
+    print("\n1. In-process engine...")
+    local = DemocraticVotingLogic(verbose=False)
+    decision_id = prepare(local)
+    latency("add_agent_proposal", local, propose(local), decision_id)
+    latency("get_decision_status (2000 proposals)", local, status(local), decision_id, 200)
+
+    # Server in eigenem Prozess, damit Client und Server nicht um den GIL konkurrieren
+    server_process = subprocess.Popen(
+        [sys.executable, "-m", "tools.engine_server", "--socket", socket_path, "--quiet"],
+        env={**os.environ, "DEMOCRACY_ENGINE_SOCKET": ""}
+    )
+    try:
+        for _ in range(200):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.05)
+
+        for step, (codec, codec_name) in enumerate(((CODEC_MSGPACK, "msgpack"), (CODEC_JSON, "json")), start=2):
+            print(f"\n{step}. Unix socket ({codec_name})...")
+            remote = RemoteDemocraticVotingLogic(socket_path, codec=codec)
+            decision_id = prepare(remote)
+            latency("add_agent_proposal", remote, propose(remote), decision_id)
+            latency("get_decision_status (2000 proposals)", remote, status(remote), decision_id, 200)
+
+            decision_id = prepare(remote)
+            start = time.perf_counter()
+            for batch_start in range(0, len(agents), 100):
+                remote.call_many([
+                    ("add_agent_proposal", {"decision_id": decision_id, "agent_name": agent,
+                                            "proposal": "Pipelined", "reasoning": "Reasoning"})
+                    for agent in agents[batch_start:batch_start + 100]
+                ])
+            elapsed = time.perf_counter() - start
+            print(f"  {'pipelined add_agent_proposal x100':<38} {len(agents) / elapsed:>38,.0f} ops/s")
+            remote.close()
+    finally:
+        server_process.terminate()
+        server_process.wait()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Democracy Engine Server (Unix Domain Socket)")
+    parser.add_argument("--socket", default=os.getenv("DEMOCRACY_ENGINE_SOCKET") or "/tmp/democracy_engine.sock")
+    parser.add_argument("--quiet", action="store_true", help="Keine Log-Ausgaben der Engine")
+    parser.add_argument("--benchmark", action="store_true", help="In-Process- und Socket-Modus vergleichen")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print("=== Benchmarking Democracy Engine Server ===")
+        _run_benchmark(args.socket)
+        print("\n=== Democracy Engine Server Benchmark Complete ===")
+    else:
+        engine = _local_engine()
+        engine.verbose = not args.quiet
+        if engine is not _democracy_engine:
+            # Für die globale Engine startet tools.phase_scheduler den Scheduler bereits beim Import
+            create_phase_scheduler_from_env(engine)
+        server = DemocracyEngineServer(args.socket, engine)
+        print(f"--- Democracy Engine: Serving on {args.socket} ---")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
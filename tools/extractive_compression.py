@@ -0,0 +1,169 @@
+import os
+import re
+from typing import List, Optional
+
+import numpy as np
+
+from tools.chunked_summarization import estimate_tokens
+from tools.text_embeddings import _embedding_engine
+
+# Satzende oder Zeilenumbruch; gescrapte Seiten bestehen oft aus Zeilen ohne Satzzeichen
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\s*\n\s*")
+_NORMALIZE = re.compile(r"\W+")
+
+METHODS = ("textrank", "centroid")
+# Ab so vielen Sätzen wird statt TextRank (n x n Ähnlichkeitsmatrix) nach Schwerpunkt bewertet
+MAX_TEXTRANK_SENTENCES = 2000
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence for sentence in (s.strip() for s in _SENTENCE_BOUNDARY.split(text)) if sentence]
+
+
+def textrank_scores(vectors: np.ndarray, damping: float = 0.85, iterations: int = 50, tolerance: float = 1e-6) -> np.ndarray:
+    """PageRank über den Graphen der Cosinus-Ähnlichkeiten (nur positive Kanten, ohne Schleifen)."""
+    similarity = np.clip(vectors @ vectors.T, 0.0, None)
+    np.fill_diagonal(similarity, 0.0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    out_weight[out_weight == 0] = 1.0
+    transition = similarity / out_weight
+
+    count = len(vectors)
+    scores = np.full(count, 1.0 / count)
+    for _ in range(iterations):
+        updated = (1.0 - damping) / count + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < tolerance:
+            return updated
+        scores = updated
+    return scores
+
+
+def centroid_scores(vectors: np.ndarray) -> np.ndarray:
+    """Cosinus-Ähnlichkeit jedes Satzes zum normierten Schwerpunkt aller Sätze."""
+    centroid = vectors.sum(axis=0)
+    norm = np.linalg.norm(centroid)
+    return vectors @ (centroid / norm) if norm else np.zeros(len(vectors))
+
+
+class ExtractiveCompressor:
+    """
+    Lokale, extraktive Vorverdichtung vor der LLM-Zusammenfassung: Sätze werden mit
+    den gemeinsamen Offline-Embeddings per TextRank oder Schwerpunkt bewertet, wörtliche
+    Wiederholungen (Navigation, Footer) nur einmal gezählt und die wichtigsten Sätze in
+    Originalreihenfolge behalten, bis `ratio` der Tokens bzw. `token_budget` erreicht
+    ist. Sehr kurze Zeilen werden abgewertet, ein `summary_focus` zieht ähnliche Sätze
+    nach oben. Texte unter `min_tokens` bleiben unverändert.
+    """
+
+    def __init__(self, ratio: float = 0.5, token_budget: Optional[int] = None, method: str = "textrank",
+                 min_tokens: int = 1000, focus_weight: float = 0.5, embeddings=None):
+        if method not in METHODS:
+            raise ValueError(f"Unknown extractive method '{method}', expected one of {METHODS}")
+        self.ratio = ratio
+        self.token_budget = token_budget
+        self.method = method
+        self.min_tokens = min_tokens
+        self.focus_weight = focus_weight
+        self._embeddings = embeddings or _embedding_engine
+
+    @property
+    def signature(self) -> str:
+        """Kennung der Einstellungen, z.B. für Cache-Schlüssel nachgelagerter Zusammenfassungen."""
+        return f"extractive:{self.method}:{self.ratio}:{self.token_budget}:{self.min_tokens}:{self.focus_weight}"
+
+    def _budget(self, tokens: int) -> int:
+        budget = int(tokens * self.ratio)
+        return min(budget, self.token_budget) if self.token_budget else budget
+
+    def scores(self, sentences: List[str], summary_focus: Optional[str] = None) -> np.ndarray:
+        vectors = self._embeddings.embed(sentences)
+        if self.method == "textrank" and len(sentences) <= MAX_TEXTRANK_SENTENCES:
+            scores = textrank_scores(vectors)
+            scores = scores / scores.max()
+        else:
+            scores = centroid_scores(vectors)
+
+        if summary_focus:
+            focus = self._embeddings.embed([summary_focus])[0]
+            scores = (1.0 - self.focus_weight) * scores + self.focus_weight * np.clip(vectors @ focus, 0.0, None)
+
+        # Kurze Zeilen (Menüpunkte, Buttons) tragen kaum Inhalt
+        words = np.array([len(sentence.split()) for sentence in sentences])
+        return scores * np.minimum(1.0, words / 8.0)
+
+    def compress(self, text: str, summary_focus: Optional[str] = None) -> str:
+        tokens = estimate_tokens(text)
+        if tokens < self.min_tokens:
+            return text
+
+        # Wörtlich wiederholte Sätze nur beim ersten Auftreten bewerten
+        sentences, seen = [], set()
+        for sentence in split_sentences(text):
+            normalized = _NORMALIZE.sub(" ", sentence.lower()).strip()
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                sentences.append(sentence)
+        if len(sentences) < 3:
+            return text
+
+        scores = self.scores(sentences, summary_focus)
+        lengths = np.array([estimate_tokens(sentence) + 1 for sentence in sentences])
+        budget = self._budget(tokens)
+
+        keep = np.zeros(len(sentences), dtype=bool)
+        used = 0
+        for index in np.argsort(-scores, kind="stable"):
+            if used + lengths[index] > budget:
+                continue
+            keep[index] = True
+            used += lengths[index]
+        return "\n".join(sentence for sentence, kept in zip(sentences, keep) if kept)
+
+
+def create_extractive_compressor_from_env() -> Optional[ExtractiveCompressor]:
+    """Vorverdichtung nach SUMMARIZER_EXTRACTIVE*-Variablen; ohne SUMMARIZER_EXTRACTIVE=true abgeschaltet."""
+    if os.getenv("SUMMARIZER_EXTRACTIVE", "false").lower() not in ("1", "true", "yes"):
+        return None
+    budget = os.getenv("SUMMARIZER_EXTRACTIVE_TOKEN_BUDGET")
+    return ExtractiveCompressor(
+        ratio=float(os.getenv("SUMMARIZER_EXTRACTIVE_RATIO", "0.5")),
+        token_budget=int(budget) if budget else None,
+        method=os.getenv("SUMMARIZER_EXTRACTIVE_METHOD", "textrank").lower(),
+        min_tokens=int(os.getenv("SUMMARIZER_EXTRACTIVE_MIN_TOKENS", "1000"))
+    )
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    print("=== Testing Extractive Compression ===")
+    rng = random.Random(11)
+    boilerplate = ["Home", "About us", "Pricing", "Login", "Sign up for our newsletter",
+                   "Accept all cookies", "© 2024 Example Corp. All rights reserved.", "Privacy Policy | Terms of Service"]
+    topics = ["ranked-choice voting", "Borda count", "instant runoff", "Condorcet winners", "voter turnout"]
+    article = [
+        f"The study of {rng.choice(topics)} shows that {rng.choice(topics)} changes how agents rank "
+        f"{rng.choice(['options', 'proposals', 'candidates'])} in {rng.choice(['small', 'large', 'polarized'])} electorates."
+        for _ in range(80)
+    ]
+    lines = []
+    for i, sentence in enumerate(article):
+        lines.append(sentence)
+        if i % 4 == 0:
+            lines.extend(rng.sample(boilerplate, 3))
+    page = "\n".join(boilerplate + lines + boilerplate)[:15_000]
+    article_set = set(article)
+
+    for method in METHODS:
+        for ratio in (0.5, 0.3):
+            compressor = ExtractiveCompressor(ratio=ratio, method=method, min_tokens=0)
+            start = time.perf_counter()
+            compressed = compressor.compress(page, summary_focus="Borda count")
+            elapsed = (time.perf_counter() - start) * 1000
+            kept = split_sentences(compressed)
+            print(f"  {method:>8} ratio {ratio}: {estimate_tokens(page)} -> {estimate_tokens(compressed)} tokens "
+                  f"in {elapsed:5.1f} ms, {sum(s in article_set for s in kept)} article / "
+                  f"{sum(s not in article_set for s in kept)} boilerplate sentences kept")
+
+    print("\n=== Extractive Compression Testing Complete ===")
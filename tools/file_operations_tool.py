@@ -3,6 +3,10 @@ import shutil
 from pathlib import Path
 from crewai.tools import tool
 
+import numpy as np
+
+from tools.text_embeddings import _embedding_engine
+
 class FileOperationsLogic:
     """
     Contains the core logic for file system operations.
@@ -132,6 +136,52 @@ class FileOperationsLogic:
         except Exception as e:
             return f"Error copying from '{source_path}' to '{destination_path}': {e}"
 
+    @staticmethod
+    def _chunks(content: str, size: int = 1500):
+        """Absätze, zu Abschnitten von etwa `size` Zeichen zusammengefasst."""
+        chunk = ""
+        for paragraph in content.split("\n\n"):
+            if chunk and len(chunk) + len(paragraph) > size:
+                yield chunk
+                chunk = ""
+            chunk += paragraph + "\n\n"
+        if chunk.strip():
+            yield chunk
+
+    def search_files(self, directory_path: str, query: str, top_k: int = 5, pattern: str = "*") -> str:
+        try:
+            path = Path(directory_path)
+            if not path.exists():
+                return f"Error: Directory '{directory_path}' not found."
+            if not path.is_dir():
+                return f"Error: '{directory_path}' is not a directory."
+
+            # Lange Dateien abschnittsweise einbetten; eine Datei zählt mit ihrem besten Abschnitt
+            files, chunks, owners = [], [], []
+            for item in sorted(path.rglob(pattern)):
+                if not item.is_file():
+                    continue
+                try:
+                    content = item.read_text(encoding="utf-8")
+                except (UnicodeDecodeError, OSError):
+                    continue
+                for chunk in self._chunks(content):
+                    chunks.append(chunk)
+                    owners.append(len(files))
+                files.append(item)
+            if not chunks:
+                return f"No readable text files matching '{pattern}' in '{directory_path}'."
+
+            # Embeddings unveränderter Abschnitte kommen über den Inhalts-Hash aus dem Cache
+            vectors = _embedding_engine.embed([query, *chunks])
+            scores = np.full(len(files), -1.0)
+            np.maximum.at(scores, owners, vectors[1:] @ vectors[0])
+            ranked = np.argsort(-scores, kind="stable")[:top_k]
+            lines = [f"{scores[index]:.3f}  {files[index].relative_to(path)}" for index in ranked]
+            return f"Files in '{directory_path}' most similar to '{query}':\n" + "\n".join(lines)
+        except Exception as e:
+            return f"Error searching '{directory_path}': {e}"
+
 _file_ops_logic = FileOperationsLogic()
 
 @tool("Write File Tool")
@@ -180,6 +230,20 @@ def list_directory_contents_tool(directory_path: str, recursive: bool = False) -
     """
     return _file_ops_logic.list_directory_contents(directory_path, recursive)
 
+@tool("Search Files Tool")
+def search_files_tool(directory_path: str, query: str, top_k: int = 5, pattern: str = "*") -> str:
+    """
+    Finds the text files in a directory (recursively) whose content is most similar to the query,
+    e.g. to locate earlier artifacts on a topic. Returns similarity score and relative path per file.
+
+    Args:
+        directory_path (str): The full path to the directory to search.
+        query (str): Free-text description of the content you are looking for.
+        top_k (int): Maximum number of files to return. Defaults to 5.
+        pattern (str): Glob pattern for file names, e.g. '*.md'. Defaults to all files.
+    """
+    return _file_ops_logic.search_files(directory_path, query, top_k, pattern)
+
 @tool("Delete File Tool")
 def delete_file_tool(file_path: str) -> str:
     """
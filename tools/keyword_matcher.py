@@ -0,0 +1,225 @@
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Wörter und einzelne Satzzeichen; Schlüsselwörter und Texte werden gleich zerlegt,
+# dadurch passen Treffer nur an Wortgrenzen ("ts" trifft nicht "its")
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_VOWELS = frozenset("aeiouy")
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "keyword_taxonomy.json")
+
+
+@lru_cache(maxsize=1 << 16)
+def stem(token: str) -> str:
+    """
+    Leichtes Suffix-Stemming für englische Flexionsformen, damit "designing",
+    "interfaces", "tested" oder "optimizing" dieselben Schlüsselwörter treffen wie
+    "design", "interface", "test" und "optimize". Wörter bis 3 Zeichen bleiben unverändert.
+    """
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    stripped = False
+    if token.endswith("ies"):
+        return token[:-3] + "y"
+    if token.endswith("ing") and _VOWELS.intersection(token[:-3]) and len(token) > 5:
+        token, stripped = token[:-3], True
+    elif token.endswith("ed") and not token.endswith("eed") and len(token) > 4:
+        token, stripped = token[:-2], True
+    elif token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        token = token[:-1]
+    if len(token) > 3 and token.endswith("e"):
+        token = token[:-1]
+    elif stripped and len(token) > 3 and token[-1] == token[-2] and token[-1] not in _VOWELS and token[-1] not in "lsz":
+        # "debugging" -> "debug", aber "install(ed)" bleibt
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    return list(map(stem, _TOKEN_PATTERN.findall(text.lower())))
+
+
+class KeywordMatches:
+    """Treffer eines Texts: Anzahl pro (Gruppe, Thema), Themen in Taxonomie-Reihenfolge."""
+
+    __slots__ = ("_matcher", "_counts")
+
+    def __init__(self, matcher: "KeywordMatcher", counts: Dict[int, int]):
+        self._matcher = matcher
+        self._counts = counts
+
+    def themes(self, group: str) -> List[str]:
+        """Alle getroffenen Themen einer Gruppe in der Reihenfolge der Taxonomie."""
+        return [self._matcher._labels[label][1] for label in self._matcher._group_labels[group] if label in self._counts]
+
+    def first_theme(self, group: str, default: str = "") -> str:
+        """Das erste getroffene Thema einer Gruppe (Priorität = Reihenfolge in der Taxonomie)."""
+        for label in self._matcher._group_labels[group]:
+            if label in self._counts:
+                return self._matcher._labels[label][1]
+        return default
+
+    def count(self, group: str, theme: str) -> int:
+        return self._counts.get(self._matcher._label_ids[(group, theme)], 0)
+
+    def has(self, group: str, theme: str) -> bool:
+        return self._matcher._label_ids[(group, theme)] in self._counts
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        result: Dict[str, Dict[str, int]] = {}
+        for label in sorted(self._counts):
+            group, theme = self._matcher._labels[label]
+            result.setdefault(group, {})[theme] = self._counts[label]
+        return result
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick-Automat über Wort-Tokens für die Themen-Erkennung.
+
+    Die Taxonomie ordnet Gruppen (z.B. "proposal_themes") Themen mit Schlüsselwörtern
+    oder Wortfolgen zu. Alle Schlüsselwörter aller Gruppen werden einmal zu einem
+    Automaten kompiliert; `scan` markiert einen Text dann in einem einzigen linearen
+    Durchlauf mit allen Themen, unabhängig von der Zahl der Schlüsselwörter.
+    """
+
+    def __init__(self, taxonomy: Dict[str, Dict[str, List[str]]]):
+        self.taxonomy = taxonomy
+        self._labels: List[Tuple[str, str]] = []
+        self._label_ids: Dict[Tuple[str, str], int] = {}
+        self._group_labels: Dict[str, List[int]] = {}
+
+        # Zustand 0 ist die Wurzel; pro Zustand Übergänge, Fehlerlink und Ausgaben
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for group, themes in taxonomy.items():
+            self._group_labels[group] = []
+            for theme, keywords in themes.items():
+                label = len(self._labels)
+                self._labels.append((group, theme))
+                self._label_ids[(group, theme)] = label
+                self._group_labels[group].append(label)
+                for keyword in keywords:
+                    state = 0
+                    for token in tokenize(keyword):
+                        next_state = self._goto[state].get(token)
+                        if next_state is None:
+                            next_state = len(self._goto)
+                            self._goto[state][token] = next_state
+                            self._goto.append({})
+                            outputs.append([])
+                        state = next_state
+                    if state and label not in outputs[state]:
+                        outputs[state].append(label)
+
+        # Fehlerlinks in Breitensuche; Ausgaben der Fehlerkette werden übernommen
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for token, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(token, 0) if state else 0
+                outputs[child].extend(
+                    label for label in outputs[self._fail[child]] if label not in outputs[child]
+                )
+                queue.append(child)
+        self._outputs: List[Tuple[int, ...]] = [tuple(labels) for labels in outputs]
+
+    @classmethod
+    def from_file(cls, path: str) -> "KeywordMatcher":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def scan(self, text: str) -> KeywordMatches:
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        root = goto[0]
+        counts: Dict[int, int] = {}
+        state = 0
+        for token in tokenize(text):
+            if state == 0:
+                # Häufigster Fall: Wort kommt in keinem Schlüsselwort vor
+                state = root.get(token, 0)
+            else:
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+            for label in outputs[state]:
+                counts[label] = counts.get(label, 0) + 1
+        return KeywordMatches(self, counts)
+
+    @property
+    def num_keywords(self) -> int:
+        return sum(len(keywords) for themes in self.taxonomy.values() for keywords in themes.values())
+
+
+def load_keyword_matcher(path: Optional[str] = None) -> KeywordMatcher:
+    """Lädt die Taxonomie aus `path`, `DEMOCRACY_KEYWORD_TAXONOMY` oder der mitgelieferten Datei."""
+    return KeywordMatcher.from_file(path or os.getenv("DEMOCRACY_KEYWORD_TAXONOMY") or DEFAULT_TAXONOMY_PATH)
+
+
+# Globale Instanz für Synthese und Trigger-Erkennung
+_keyword_matcher = load_keyword_matcher()
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    print("=== Testing Keyword Matcher ===")
+
+    print("\n1. Word boundaries and phrases...")
+    for text in [
+        "React with TypeScript, its tooling is great",
+        "Vue.js is easier; however a different, alternative approach would be vanilla JS",
+        "We should improve the user experience and the API design",
+        "Builds quickly, contests its rivals",
+        "Designing layouts and interfaces, tested and maintained while optimizing",
+    ]:
+        print(f"  {text!r}\n    -> {_keyword_matcher.scan(text).to_dict()}")
+
+    print("\n2. Benchmark against per-keyword substring scans...")
+    rng = random.Random(42)
+    filler = ("the team should consider our current stack and the long term roadmap for this "
+              "project because users expect a stable product with good results").split()
+    vocabulary = [keyword for themes in _keyword_matcher.taxonomy.values()
+                  for keywords in themes.values() for keyword in keywords]
+    proposals = [
+        " ".join(rng.choice(vocabulary) if rng.random() < 0.08 else rng.choice(filler) for _ in range(60))
+        for _ in range(10_000)
+    ]
+
+    def substring_scan(taxonomy: Dict[str, Dict[str, List[str]]], text: str) -> List[Tuple[str, str]]:
+        text = text.lower()
+        return [(group, theme) for group, themes in taxonomy.items()
+                for theme, keywords in themes.items() if any(keyword in text for keyword in keywords)]
+
+    for scale in (1, 5, 20):
+        # Größere Taxonomien: zusätzliche synthetische Themen je Gruppe
+        taxonomy = {
+            group: {**themes, **{f"{group}_extra_{i}": [f"term{i}x{j}" for j in range(len(vocabulary) // 10)]
+                                 for i in range((scale - 1) * 10)}}
+            for group, themes in _keyword_matcher.taxonomy.items()
+        }
+        matcher = KeywordMatcher(taxonomy)
+
+        start = time.perf_counter()
+        for proposal in proposals:
+            substring_scan(taxonomy, proposal)
+        substring_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for proposal in proposals:
+            matcher.scan(proposal)
+        automaton_time = time.perf_counter() - start
+
+        print(f"  {matcher.num_keywords:>6} keywords, {len(proposals)} proposals: "
+              f"substring {substring_time * 1000:8.1f} ms   automaton {automaton_time * 1000:8.1f} ms   "
+              f"({substring_time / automaton_time:.1f}x)")
+
+    print("\n=== Keyword Matcher Testing Complete ===")
@@ -0,0 +1,219 @@
+import os
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_SHIFT = np.uint64(32)
+_SHINGLE_CHARS = 5
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+# Ab dieser geschätzten Jaccard-Ähnlichkeit (Zeichen-5-Gramme) gelten zwei Texte als Duplikat
+DEFAULT_DUPLICATE_THRESHOLD = float(os.getenv("DEMOCRACY_DUPLICATE_THRESHOLD", "0.7"))
+# Innerhalb eines LSH-Buckets wird jeder Text mit höchstens so vielen Nachfolgern gepaart
+MAX_BUCKET_NEIGHBORS = 64
+# Shingles je Hash-Block; begrenzt die Zwischenmatrix auf num_perm x Block uint64 (8 MiB bei 128)
+_HASH_BLOCK_SHINGLES = 8192
+
+
+def _shingles(text: str) -> np.ndarray:
+    """Eindeutige Zeichen-5-Gramme des normalisierten Texts, je 5 Bytes als Ganzzahl."""
+    normalized = _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", text.lower())).strip()
+    data = np.frombuffer(normalized.encode("utf-8"), dtype=np.uint8).astype(np.uint64)
+    if len(data) < _SHINGLE_CHARS:
+        data = np.pad(data, (0, _SHINGLE_CHARS - len(data)))
+    # 5 Bytes = 40 Bit, also kollisionsfrei in einem uint64 ohne Hashfunktion
+    windows = np.lib.stride_tricks.sliding_window_view(data, _SHINGLE_CHARS)
+    values = (windows << (np.arange(_SHINGLE_CHARS - 1, -1, -1, dtype=np.uint64) * np.uint64(8))).sum(axis=1)
+    return np.unique(values)
+
+
+def _band_layout(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Bänder x Zeilen, deren S-Kurve (1/b)^(1/r) möglichst nah an, aber nicht über der
+    Schwelle liegt: lieber mehr Kandidaten prüfen als echte Duplikate verpassen.
+    """
+    layouts = [(num_perm // rows, rows) for rows in range(1, num_perm + 1) if num_perm % rows == 0]
+    def midpoint(layout: Tuple[int, int]) -> float:
+        return (1.0 / layout[0]) ** (1.0 / layout[1])
+
+    return max((layout for layout in layouts if midpoint(layout) <= threshold + 0.01), key=midpoint)
+
+
+class MinHashLSH:
+    """
+    Erkennung nahezu identischer Texte mit MinHash-Signaturen und Locality Sensitive
+    Hashing. Jede Signatur wird in Bänder zerlegt; nur Texte, die in mindestens einem
+    Band übereinstimmen, werden verglichen. So entfällt der Vergleich aller Paare.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_DUPLICATE_THRESHOLD, num_perm: int = 128, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = _band_layout(threshold, num_perm)
+        # Multiply-Shift-Hashing: (a * x + b) mod 2^64, davon die oberen 32 Bit; a ungerade
+        rng = np.random.default_rng(seed)
+        self._a = (rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1))[:, None]
+        self._b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)[:, None]
+
+    def _hash(self, shingles: np.ndarray) -> np.ndarray:
+        with np.errstate(over="ignore"):
+            hashed = self._a * shingles
+            hashed += self._b
+        hashed >>= _SHIFT
+        return hashed
+
+    def signature(self, text: str) -> np.ndarray:
+        return self.signatures([text])[0]
+
+    def signatures(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Signaturen aller Texte (Texte x num_perm). Die Shingles aller Texte werden in
+        Blöcken von `_HASH_BLOCK_SHINGLES` gehasht und je Text per reduceat minimiert;
+        ein Text, der über eine Blockgrenze reicht, wird blockweise zusammengeführt.
+        """
+        if not texts:
+            return np.empty((0, self.num_perm), dtype=np.uint64)
+        shingles = [_shingles(text) for text in texts]
+        owners = np.repeat(np.arange(len(texts)), [len(values) for values in shingles])
+        values = np.concatenate(shingles)
+
+        result = np.full((len(texts), self.num_perm), np.iinfo(np.uint64).max, dtype=np.uint64)
+        for start in range(0, len(values), _HASH_BLOCK_SHINGLES):
+            block_owners = owners[start:start + _HASH_BLOCK_SHINGLES]
+            starts = np.flatnonzero(np.r_[True, block_owners[1:] != block_owners[:-1]])
+            minima = np.minimum.reduceat(self._hash(values[start:start + _HASH_BLOCK_SHINGLES]), starts, axis=1).T
+            rows = block_owners[starts]
+            result[rows] = np.minimum(result[rows], minima)
+        return result
+
+    def candidate_pairs(self, signatures: np.ndarray) -> np.ndarray:
+        """
+        Paare (i, j), i < j, die sich einen LSH-Bucket teilen. Texte mit identischer
+        Signatur werden nur an ihren ersten Vertreter gehängt (sie sind sicher Duplikate
+        voneinander); die verschiedenen Signaturen eines Buckets werden untereinander
+        gepaart, jede mit höchstens `MAX_BUCKET_NEIGHBORS` Nachfolgern. So bleibt die
+        Zahl der Paare auch bei vielen exakten Kopien linear.
+        """
+        full_keys = [row.tobytes() for row in np.ascontiguousarray(signatures)]
+        representative: Dict[bytes, int] = {}
+        pairs = set()
+        for index, key in enumerate(full_keys):
+            first = representative.setdefault(key, index)
+            if first != index:
+                pairs.add((first, index))
+
+        for band in range(self.bands):
+            buckets: Dict[bytes, List[int]] = defaultdict(list)
+            band_rows = np.ascontiguousarray(signatures[:, band * self.rows:(band + 1) * self.rows])
+            for index, row in enumerate(band_rows):
+                if representative[full_keys[index]] == index:
+                    buckets[row.tobytes()].append(index)
+            for members in buckets.values():
+                for position, first in enumerate(members):
+                    pairs.update((first, other) for other in members[position + 1:position + 1 + MAX_BUCKET_NEIGHBORS])
+        return np.array(sorted(pairs), dtype=np.int64).reshape(-1, 2)
+
+    def duplicate_groups(self, texts: Sequence[str]) -> List[List[int]]:
+        """
+        Gruppiert nahezu identische Texte (transitiv). Jede Gruppe ist nach
+        Eingabereihenfolge sortiert, Gruppen nach ihrem ersten Text.
+        """
+        signatures = self.signatures(texts)
+        pairs = self.candidate_pairs(signatures)
+        # Kandidaten über den Anteil gleicher Signaturwerte bestätigen (Schätzer der Jaccard-Ähnlichkeit)
+        agreement = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        parent = list(range(len(texts)))
+
+        def root(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        for first, second in pairs[agreement >= self.threshold].tolist():
+            first_root, second_root = root(first), root(second)
+            if first_root != second_root:
+                parent[max(first_root, second_root)] = min(first_root, second_root)
+
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for index in range(len(texts)):
+            groups[root(index)].append(index)
+        return list(groups.values())
+
+
+class DuplicateIndex:
+    """
+    Inkrementelle Variante für laufend eintreffende Texte: `add` prüft nur die
+    LSH-Buckets des neuen Texts und nimmt ihn auf, wenn er kein Duplikat ist.
+    """
+
+    def __init__(self, lsh: MinHashLSH):
+        self.lsh = lsh
+        self._signatures: List[np.ndarray] = []
+        self._buckets: List[Dict[bytes, List[int]]] = [defaultdict(list) for _ in range(lsh.bands)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(self, text: str) -> Optional[int]:
+        """Index des frühesten gespeicherten Duplikats oder None (dann wird der Text neu aufgenommen)."""
+        signature = self.lsh.signature(text)
+        keys = [signature[band * self.lsh.rows:(band + 1) * self.lsh.rows].tobytes() for band in range(self.lsh.bands)]
+
+        candidates = sorted({index for band, key in enumerate(keys) for index in self._buckets[band].get(key, ())})
+        for index in candidates:
+            if np.mean(self._signatures[index] == signature) >= self.lsh.threshold:
+                return index
+
+        index = len(self._signatures)
+        self._signatures.append(signature)
+        for band, key in enumerate(keys):
+            self._buckets[band][key].append(index)
+        return None
+
+
+if __name__ == '__main__':
+    import random
+    import time
+    import tracemalloc
+
+    print("=== Testing Near-Duplicate Detection ===")
+    lsh = MinHashLSH()
+    print(f"\n1. Layout for threshold {lsh.threshold}: {lsh.bands} bands x {lsh.rows} rows")
+
+    texts = [
+        "Use React with TypeScript because the team already knows it.",
+        "Use React with TypeScript, because our team already knows it!",
+        "Use Vue.js for its gentle learning curve.",
+        "use react with typescript because the team already knows it",
+    ]
+    print(f"2. Groups: {lsh.duplicate_groups(texts)} (expected [[0, 1, 3], [2]])")
+
+    # A, B und C teilen Band 0; nur B und C stimmen auch sonst überein
+    signatures = np.arange(3 * lsh.num_perm, dtype=np.uint64).reshape(3, lsh.num_perm)
+    signatures[:, :lsh.rows] = 0
+    signatures[2] = signatures[1]
+    signatures[2, -1] += 1000
+    print(f"   Pairs within one bucket: {lsh.candidate_pairs(signatures).tolist()} (expected to include [1, 2])")
+
+    print("\n3. Scaling (each base text submitted about five times with small edits)...")
+    rng = random.Random(3)
+    words = "cache api database schema test deploy react vue layout audit metrics queue worker retry".split()
+    for count in (200, 1000, 5000):
+        bases = [" ".join(rng.choice(words) for _ in range(25)) for _ in range(count // 5)]
+        corpus = [base + rng.choice(["", " please", " soon", "."]) for base in bases for _ in range(5)]
+        start = time.perf_counter()
+        groups = lsh.duplicate_groups(corpus)
+        elapsed = time.perf_counter() - start
+        # Speicherspitze in einem zweiten Lauf, damit tracemalloc die Zeitmessung nicht verfälscht
+        tracemalloc.start()
+        lsh.duplicate_groups(corpus)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {len(corpus):>5} texts -> {len(groups):>4} groups in {elapsed * 1000:7.1f} ms, "
+              f"peak {peak / 1024 / 1024:5.1f} MiB ({len(corpus) * (len(corpus) - 1) // 2:,} pairs without LSH)")
+
+    print("\n=== Near-Duplicate Detection Testing Complete ===")
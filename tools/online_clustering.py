@@ -0,0 +1,272 @@
+import math
+import os
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from tools.decision_events import DECISION_FINALIZED, PHASE_CHANGED, PROPOSAL_ADDED, DecisionNotification
+from tools.keyword_matcher import _keyword_matcher
+from tools.near_duplicates import DuplicateIndex, MinHashLSH
+from tools.text_vectors import DEFAULT_CLUSTER_DISTANCE, PROPOSAL_FIELD_WEIGHTS, hashed_term_frequencies, terms
+
+# Höchstens so viele Entscheidungen werden mitgeclustert; für verdrängte (am längsten ohne
+# neuen Vorschlag) fällt die Synthese auf Batch-Clustering zurück
+MAX_LIVE_DECISIONS = int(os.getenv("DEMOCRACY_ONLINE_CLUSTER_DECISIONS", "256"))
+# Ab diesen Phasen kommen keine Vorschläge mehr hinzu und die Synthese ist gelaufen
+_CLOSED_PHASES = ("ranked_voting", "commitment")
+
+
+def _dot(vector: Dict[int, float], other: Dict[int, float]) -> float:
+    if len(vector) > len(other):
+        vector, other = other, vector
+    return sum(weight * other.get(index, 0.0) for index, weight in vector.items())
+
+
+@dataclass(slots=True)
+class _LiveCluster:
+    """Cluster mit Summenvektor als Schwerpunkt; Mitglieder sind Indizes eindeutiger Vorschläge."""
+    centroid: Dict[int, float] = field(default_factory=dict)
+    squared_norm: float = 0.0
+    members: List[int] = field(default_factory=list)
+    themes: Counter = field(default_factory=Counter)
+    terms: Counter = field(default_factory=Counter)
+
+
+@dataclass(slots=True)
+class _LiveDecision:
+    duplicates: DuplicateIndex
+    proposals: List[Dict[str, Any]] = field(default_factory=list)
+    vectors: List[Dict[int, float]] = field(default_factory=list)
+    merged_agents: List[List[str]] = field(default_factory=list)
+    clusters: List[_LiveCluster] = field(default_factory=list)
+    document_frequency: Counter = field(default_factory=Counter)
+    proposal_count: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class OnlineProposalClusterer:
+    """
+    Leader-Clustering, das mit jedem eingehenden Vorschlag mitläuft.
+
+    Jeder neue Vorschlag wird zuerst gegen die bisherigen auf Beinahe-Duplikate
+    geprüft (MinHash/LSH) und sonst dem ähnlichsten Cluster-Schwerpunkt zugeordnet
+    oder gründet einen neuen Cluster. Cluster, Themen und Überschneidungen sind
+    dadurch jederzeit aktuell, und der Wechsel in die SYNTHESIS-Phase muss nur noch
+    die fertigen Cluster auslesen. Gespeist wird es über `PROPOSAL_ADDED` der Engine.
+
+    Jede Entscheidung hat einen eigenen Lock; der gemeinsame Lock schützt nur die
+    Zuordnung. Der Zustand wird mit dem Ende der Synthese (RANKED_VOTING) bzw. der
+    Finalisierung verworfen und ist auf `max_decisions` Entscheidungen begrenzt.
+    """
+
+    def __init__(self, engine=None, distance_threshold: float = DEFAULT_CLUSTER_DISTANCE,
+                 max_decisions: int = MAX_LIVE_DECISIONS):
+        self.distance_threshold = distance_threshold
+        self.max_decisions = max(1, max_decisions)
+        self._lsh = MinHashLSH()
+        self._lock = threading.Lock()
+        self._decisions: "OrderedDict[str, _LiveDecision]" = OrderedDict()
+
+        # Nur die lokale Engine abonnieren; ein Client würde dafür eine Socket-Verbindung öffnen
+        if engine is not None and hasattr(engine, "get_active_decision"):
+            engine.events.subscribe(self._on_notification, topics=(PROPOSAL_ADDED, PHASE_CHANGED, DECISION_FINALIZED))
+
+    def _on_notification(self, notification: DecisionNotification) -> None:
+        if notification.topic == DECISION_FINALIZED or (
+                notification.topic == PHASE_CHANGED and notification.phase in _CLOSED_PHASES):
+            with self._lock:
+                self._decisions.pop(notification.decision_id, None)
+            return
+        if notification.topic == PROPOSAL_ADDED:
+            self.add_proposal(notification.decision_id, notification.data["proposal"])
+
+    def _state(self, decision_id: str, create: bool = False) -> Optional[_LiveDecision]:
+        with self._lock:
+            state = self._decisions.get(decision_id)
+            if state is not None:
+                self._decisions.move_to_end(decision_id)
+            elif create:
+                state = self._decisions[decision_id] = _LiveDecision(DuplicateIndex(self._lsh))
+                if len(self._decisions) > self.max_decisions:
+                    self._decisions.popitem(last=False)
+            return state
+
+    def add_proposal(self, decision_id: str, proposal: Dict[str, Any]) -> None:
+        text = proposal["proposal"] + " " + proposal["reasoning"]
+        state = self._state(decision_id, create=True)
+        with state.lock:
+            state.proposal_count += 1
+
+            duplicate = state.duplicates.add(text)
+            if duplicate is not None:
+                state.merged_agents[duplicate].append(proposal["agent_name"])
+                return
+
+            vector = hashed_term_frequencies(proposal["proposal"], weight=PROPOSAL_FIELD_WEIGHTS[0])
+            for index, weight in hashed_term_frequencies(proposal["reasoning"], weight=PROPOSAL_FIELD_WEIGHTS[1]).items():
+                vector[index] = vector.get(index, 0.0) + weight
+
+            # IDF aus den bisher eingegangenen Vorschlägen, beim Einfügen eingefroren: Begriffe,
+            # die fast alle verwenden, tragen so auch online kaum zur Ähnlichkeit bei
+            state.document_frequency.update(vector.keys())
+            documents = len(state.proposals) + 1
+            for index in vector:
+                vector[index] *= math.log((1.0 + documents) / (1.0 + state.document_frequency[index])) + 1.0
+            norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+            vector = {index: weight / norm for index, weight in vector.items()}
+
+            index = len(state.proposals)
+            state.proposals.append(proposal)
+            state.vectors.append(vector)
+            state.merged_agents.append([proposal["agent_name"]])
+
+            # Nächster Schwerpunkt nach Cosinus-Ähnlichkeit
+            best_cluster, best_similarity, best_dot = None, -1.0, 0.0
+            for cluster in state.clusters:
+                dot = _dot(vector, cluster.centroid)
+                similarity = dot / math.sqrt(cluster.squared_norm)
+                if similarity > best_similarity:
+                    best_cluster, best_similarity, best_dot = cluster, similarity, dot
+
+            if best_cluster is None or 1.0 - best_similarity > self.distance_threshold:
+                best_cluster, best_dot = _LiveCluster(), 0.0
+                state.clusters.append(best_cluster)
+
+            for feature, weight in vector.items():
+                best_cluster.centroid[feature] = best_cluster.centroid.get(feature, 0.0) + weight
+            best_cluster.squared_norm += 2.0 * best_dot + 1.0
+            best_cluster.members.append(index)
+            best_cluster.themes[_keyword_matcher.scan(text).first_theme("cluster_themes")] += 1
+            best_cluster.terms.update(set(terms(text, (1, 1))))
+
+    def is_current(self, decision_id: str, proposal_count: int) -> bool:
+        """True, wenn alle `proposal_count` Vorschläge der Entscheidung eingeflossen sind."""
+        state = self._state(decision_id)
+        if state is None:
+            return False
+        with state.lock:
+            return state.proposal_count == proposal_count
+
+    def clusters(self, decision_id: str) -> List[Any]:
+        """Aktuelle Cluster als `ProposalCluster` (Eingabe für `generate_voting_options`)."""
+        from tools.synthesis_tools import ProposalCluster
+
+        state = self._state(decision_id)
+        if state is None:
+            return []
+        with state.lock:
+            clusters = []
+            for cluster in state.clusters:
+                # Repräsentativ ist der Vorschlag, der dem Schwerpunkt am nächsten liegt
+                representative = max(cluster.members, key=lambda m: _dot(state.vectors[m], cluster.centroid))
+                ordered = [representative] + [m for m in cluster.members if m != representative]
+
+                result = ProposalCluster(
+                    theme=self._theme(cluster),
+                    description="",
+                    contributing_agents=[agent for m in cluster.members for agent in state.merged_agents[m]],
+                    merged_reasoning=state.proposals[representative]["reasoning"],
+                    representative_proposal=state.proposals[representative]["proposal"]
+                )
+                for m in ordered[1:]:
+                    result.merged_reasoning += f" | {', '.join(state.merged_agents[m])}: {state.proposals[m]['reasoning']}"
+                clusters.append(result)
+            return clusters
+
+    def overlaps(self, decision_id: str) -> List[Dict[str, Any]]:
+        """Gruppen nahezu identischer Vorschläge mehrerer Agents."""
+        state = self._state(decision_id)
+        if state is None:
+            return []
+        with state.lock:
+            return [
+                {"agents": list(agents), "proposal": proposal["proposal"]}
+                for proposal, agents in zip(state.proposals, state.merged_agents)
+                if len(agents) > 1
+            ]
+
+    @staticmethod
+    def _theme(cluster: _LiveCluster) -> str:
+        """Taxonomie-Thema der Mehrheit, sonst die von den meisten Mitgliedern geteilten Begriffe."""
+        theme, count = cluster.themes.most_common(1)[0]
+        if theme and count * 2 > len(cluster.members):
+            return theme
+        ranked = sorted(cluster.terms.items(), key=lambda item: (-item[1], -len(item[0]), item[0]))
+        return " ".join(term for term, _ in ranked[:2]) or "general"
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    from tools.team_voting_tool import ConflictType, DemocraticVotingLogic, VotingPhase
+    from tools.synthesis_tools import _synthesis_logic
+
+    print("=== Testing Online Proposal Clustering ===")
+    engine = DemocraticVotingLogic(verbose=False)
+    clusterer = OnlineProposalClusterer(engine)
+
+    rng = random.Random(7)
+    topics = [
+        ("Add an accessibility audit with screen reader checks", "Keyboard navigation and contrast matter for all users"),
+        ("Cache API responses in Redis", "Repeated queries slow down the backend"),
+        ("Use PostgreSQL with a normalized schema", "Relational data and transactions fit our domain"),
+        ("Write end-to-end tests with Playwright", "Catch regressions in user flows before release"),
+        ("React with TypeScript", "Type safety and a large ecosystem"),
+    ]
+
+    for count in (20, 200, 1000):
+        agents = [f"Agent_{i}" for i in range(count)]
+        decision_id = engine.trigger_democratic_decision(ConflictType.MANUAL_TRIGGER, "Online", "Stack", agents)
+        engine.advance_phase(decision_id, VotingPhase.IDEA_COLLECTION)
+        proposals = []
+        for i, agent in enumerate(agents):
+            proposal, reasoning = topics[i % len(topics)]
+            extra = rng.choice(["quickly", "carefully", "soon", "first", "incrementally"])
+            proposals.append({"agent_name": agent, "proposal": f"{proposal} {extra} for module {i}",
+                              "reasoning": reasoning})
+
+        start = time.perf_counter()
+        engine.add_agent_proposals_bulk(decision_id, proposals)
+        per_proposal = (time.perf_counter() - start) / count
+
+        start = time.perf_counter()
+        online = clusterer.clusters(decision_id)
+        online_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        batch = _synthesis_logic.cluster_similar_proposals(proposals)
+        batch_ms = (time.perf_counter() - start) * 1000
+
+        print(f"  {count:>4} proposals: add incl. online clustering {per_proposal * 1e6:6.0f} us/proposal, "
+              f"read clusters {online_ms:6.2f} ms vs batch {batch_ms:7.1f} ms")
+        print(f"       online {sorted(len(c.contributing_agents) for c in online)} {[c.theme for c in online]}")
+        print(f"       batch  {sorted(len(c.contributing_agents) for c in batch)}")
+
+    print("\n2. State lifetime...")
+    engine.advance_phase(decision_id, VotingPhase.SYNTHESIS)
+    kept = clusterer.is_current(decision_id, count)
+    engine.advance_phase(decision_id, VotingPhase.RANKED_VOTING)
+    print(f"  Kept through SYNTHESIS: {kept}, dropped at RANKED_VOTING: {not clusterer.is_current(decision_id, count)}")
+    bounded = OnlineProposalClusterer(max_decisions=3)
+    for n in range(10):
+        bounded.add_proposal(f"abandoned_{n}", proposals[n])
+    print(f"  Abandoned decisions kept: {len(bounded._decisions)} (max 3)")
+
+    print("\n3. Parallel decisions (one thread per decision)...")
+    import threading
+
+    def fill(decision_id: str) -> None:
+        for proposal in proposals[:200]:
+            bounded.add_proposal(decision_id, proposal)
+
+    bounded = OnlineProposalClusterer()
+    threads = [threading.Thread(target=fill, args=(f"parallel_{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"  All decisions complete: {all(bounded.is_current(f'parallel_{n}', 200) for n in range(4))}")
+
+    print("\n=== Online Proposal Clustering Testing Complete ===")
@@ -0,0 +1,387 @@
+import heapq
+import itertools
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tools.decision_events import (
+    DECISION_FINALIZED,
+    DECISION_TRIGGERED,
+    PHASE_CHANGED,
+    PROPOSAL_ADDED,
+    VOTE_SUBMITTED,
+    DecisionNotification,
+)
+from tools.team_voting_tool import DemocraticVotingLogic, VotingPhase, _democracy_engine
+
+# Gründe für einen Heap-Eintrag
+_DEADLINE = "deadline"
+_QUORUM = "quorum"
+_LOCK_CHECK = "locked outcome"
+_SYNTHESIS_RETRY = "synthesis retry"
+
+# Synthese-Hook: (decision_id, proposals als to_dict()) -> Optionen für synthesize_options
+Synthesizer = Callable[[str, List[Dict[str, Any]]], List[Dict[str, Any]]]
+
+
+@dataclass(slots=True)
+class PhaseRule:
+    """
+    Quorum- und Fristregeln einer Entscheidung.
+
+    `quorum` ist der Anteil der Teilnehmer, der eingereicht haben muss (1.0 = alle).
+    Fristen sind Sekunden ab Eintritt in die Phase; None bedeutet keine Frist.
+    Schlägt die Synthese fehl, wird sie nach `synthesis_retry_s` wiederholt.
+    """
+    quorum: float = 1.0
+    idea_deadline_s: Optional[float] = None
+    voting_deadline_s: Optional[float] = None
+    advance_on_locked_outcome: bool = True
+    synthesis_retry_s: float = 5.0
+
+    def required(self, participants: int) -> int:
+        return max(1, math.ceil(self.quorum * participants))
+
+
+def _default_synthesizer(decision_id: str, proposals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    from tools.synthesis_tools import _synthesis_logic, cluster_decision_proposals
+    return _synthesis_logic.generate_voting_options(cluster_decision_proposals(decision_id, proposals))
+
+
+@dataclass(slots=True)
+class _Progress:
+    """Mitgezählter Fortschritt einer Entscheidung, damit Quorum-Prüfungen keinen Status laden."""
+    phase: str
+    participants: int
+    proposals: int
+    votes: int
+    # Frist der aktuellen Phase abgelaufen, ohne dass gewechselt werden konnte (nichts eingereicht)
+    deadline_passed: bool = False
+
+
+class PhaseScheduler:
+    """
+    Schaltet Entscheidungen automatisch weiter, sobald das Quorum erreicht oder die
+    Frist abgelaufen ist.
+
+    IDEA_COLLECTION -> SYNTHESIS -> RANKED_VOTING (Optionen über den Synthese-Hook),
+    RANKED_VOTING -> COMMITMENT (nach Auszählung). Die Fortschritte werden aus den
+    Benachrichtigungen der Engine mitgezählt; Fristen liegen in einem Heap, den ein
+    einzelner Hintergrund-Thread abarbeitet. Die eigentlichen Phasenwechsel laufen
+    immer in diesem Thread, nie im Thread des einreichenden Agents.
+    """
+
+    def __init__(
+        self,
+        engine,
+        default_rule: Optional[PhaseRule] = None,
+        synthesizer: Optional[Synthesizer] = None
+    ):
+        self.engine = engine
+        self.default_rule = default_rule or PhaseRule()
+        self.synthesizer = synthesizer or _default_synthesizer
+
+        self._rules: Dict[str, PhaseRule] = {}
+        self._progress: Dict[str, _Progress] = {}
+        # (fällig um, Sequenz, decision_id, Phase beim Einplanen, Grund)
+        self._heap: List[Tuple[float, int, str, str, str]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._subscription_id: Optional[int] = None
+
+    def set_rule(self, decision_id: str, rule: PhaseRule) -> None:
+        """Eigene Regel für eine Entscheidung; Fristen zählen ab dem nächsten Phasenwechsel."""
+        with self._condition:
+            self._rules[decision_id] = rule
+            progress = self._progress.get(decision_id)
+            if progress is not None and self._quorum_reached(decision_id, progress):
+                self._schedule(decision_id, progress.phase, 0.0, _QUORUM)
+
+    def start(self) -> "PhaseScheduler":
+        self._running = True
+        self._subscription_id = self.engine.events.subscribe(
+            self._on_notification,
+            topics=(DECISION_TRIGGERED, PHASE_CHANGED, PROPOSAL_ADDED, VOTE_SUBMITTED, DECISION_FINALIZED)
+        )
+        self._thread = threading.Thread(target=self._run, name="democracy-phase-scheduler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._subscription_id is not None:
+            self.engine.events.unsubscribe(self._subscription_id)
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    # === BENACHRICHTIGUNGEN (Thread des Auslösers, nur Buchhaltung) ===
+
+    def _on_notification(self, notification: DecisionNotification) -> None:
+        decision_id = notification.decision_id
+        with self._condition:
+            if notification.topic == DECISION_FINALIZED:
+                self._progress.pop(decision_id, None)
+                self._rules.pop(decision_id, None)
+                return
+
+            progress = self._progress.get(decision_id)
+            if progress is None:
+                progress = self._load_progress(decision_id, notification)
+                if progress is None:
+                    return
+                self._progress[decision_id] = progress
+                self._schedule_phase(decision_id, progress.phase)
+
+            if notification.topic == PROPOSAL_ADDED:
+                progress.proposals += 1
+            elif notification.topic == VOTE_SUBMITTED:
+                progress.votes += 1
+                if self._rules.get(decision_id, self.default_rule).advance_on_locked_outcome:
+                    self._schedule(decision_id, progress.phase, 0.0, _LOCK_CHECK)
+            elif notification.topic == PHASE_CHANGED and notification.phase != progress.phase:
+                progress.phase = notification.phase
+                progress.deadline_passed = False
+                self._schedule_phase(decision_id, progress.phase)
+
+            if self._quorum_reached(decision_id, progress):
+                self._schedule(decision_id, progress.phase, 0.0, _QUORUM)
+            elif progress.deadline_passed and notification.topic in (PROPOSAL_ADDED, VOTE_SUBMITTED):
+                # Nach Fristablauf schaltet die erste Einreichung weiter, auch unterhalb des Quorums
+                self._schedule(decision_id, progress.phase, 0.0, _DEADLINE)
+
+    def _load_progress(self, decision_id: str, notification: DecisionNotification) -> Optional[_Progress]:
+        if notification.topic == DECISION_TRIGGERED:
+            participants = len(set(notification.data["decision"]["participating_agents"]))
+            return _Progress(notification.phase, participants, 0, 0)
+
+        # Vor dem Start des Schedulers ausgelöste Entscheidung: Zustand einmalig nachladen
+        status = self.engine.get_decision_status(decision_id)
+        if status is None or status.get("end_time"):
+            return None
+        # Die auslösende Benachrichtigung ist im Status schon enthalten und wird gleich mitgezählt
+        proposals = len(status["proposals"]) - (notification.topic == PROPOSAL_ADDED)
+        votes = len(status["votes"]) - (notification.topic == VOTE_SUBMITTED)
+        return _Progress(status["current_phase"], len(set(status["participating_agents"])), proposals, votes)
+
+    def _quorum_reached(self, decision_id: str, progress: _Progress) -> bool:
+        rule = self._rules.get(decision_id, self.default_rule)
+        if progress.phase == VotingPhase.IDEA_COLLECTION.value:
+            return progress.proposals >= rule.required(progress.participants)
+        if progress.phase == VotingPhase.RANKED_VOTING.value:
+            return progress.votes >= rule.required(progress.participants)
+        return False
+
+    def _schedule_phase(self, decision_id: str, phase: str) -> None:
+        rule = self._rules.get(decision_id, self.default_rule)
+        deadline = {
+            VotingPhase.IDEA_COLLECTION.value: rule.idea_deadline_s,
+            VotingPhase.RANKED_VOTING.value: rule.voting_deadline_s,
+        }.get(phase)
+        if deadline is not None:
+            self._schedule(decision_id, phase, deadline, _DEADLINE)
+
+    def _schedule(self, decision_id: str, phase: str, delay_s: float, reason: str) -> None:
+        heapq.heappush(self._heap, (time.monotonic() + delay_s, next(self._sequence), decision_id, phase, reason))
+        self._condition.notify()
+
+    # === SCHEDULER-THREAD ===
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._running and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._condition.wait(timeout)
+                if not self._running:
+                    return
+                _, _, decision_id, phase, reason = heapq.heappop(self._heap)
+                progress = self._progress.get(decision_id)
+                # Veraltete Einträge (Phase bereits gewechselt oder abgeschlossen) verwerfen
+                if progress is None or progress.phase != phase:
+                    continue
+                if reason == _DEADLINE:
+                    # Vor dem Wechselversuch setzen, damit keine Einreichung dazwischen verloren geht
+                    progress.deadline_passed = True
+
+            try:
+                if reason == _LOCK_CHECK and not self.engine.is_outcome_locked(decision_id):
+                    continue
+                self._advance(decision_id, phase, reason)
+            except Exception as e:
+                print(f"--- Democracy Engine: Scheduler could not advance {decision_id}: {e} ---")
+
+    def _advance(self, decision_id: str, phase: str, reason: str) -> None:
+        print(f"--- Democracy Engine: Scheduler closing {phase} of {decision_id} ({reason}) ---")
+        # Alle Wechsel per Compare-and-Set (`from_phase`): hat ein Tool die Entscheidung
+        # inzwischen selbst weitergeschaltet, wird sie nicht zurückgesetzt
+        if phase == VotingPhase.IDEA_COLLECTION.value:
+            if not self.engine.get_decision_status(decision_id)["proposals"]:
+                # Ohne Vorschläge gibt es nichts abzustimmen; der erste spätere Vorschlag schaltet weiter
+                print(f"--- Democracy Engine: {decision_id} has no proposals yet; staying in IDEA_COLLECTION ---")
+                return
+            # Erst die Phase schließen, dann die Vorschläge lesen: danach nimmt die Engine
+            # keine Vorschläge mehr an, sodass keiner an den Optionen vorbei gespeichert wird
+            if not self.engine.advance_phase(decision_id, VotingPhase.SYNTHESIS, from_phase=VotingPhase.IDEA_COLLECTION):
+                print(f"--- Democracy Engine: {decision_id} already left IDEA_COLLECTION; scheduler skips it ---")
+                return
+            self._synthesize(decision_id)
+
+        elif phase == VotingPhase.SYNTHESIS.value:
+            self._synthesize(decision_id)
+
+        elif phase == VotingPhase.RANKED_VOTING.value:
+            if not self.engine.has_reached_phase(decision_id, VotingPhase.RANKED_VOTING) or \
+                    self.engine.has_reached_phase(decision_id, VotingPhase.COMMITMENT):
+                return
+            if self.engine.calculate_ranked_choice_winner(decision_id) is None:
+                # Der erste spätere Stimmzettel schaltet weiter
+                print(f"--- Democracy Engine: {decision_id} reached its voting deadline without votes ---")
+                return
+            self.engine.advance_phase(decision_id, VotingPhase.COMMITMENT, from_phase=VotingPhase.RANKED_VOTING)
+
+    def _synthesize(self, decision_id: str) -> None:
+        """Erzeugt die Optionen einer Entscheidung in SYNTHESIS; bei Fehlern später erneut."""
+        proposals = self.engine.get_decision_status(decision_id)["proposals"]
+        try:
+            options = self.synthesizer(decision_id, proposals) or [
+                {"title": p["proposal"][:80], "description": p["proposal"], "source_proposals": [p["agent_name"]]}
+                for p in proposals
+            ]
+            synthesized = self.engine.synthesize_options(decision_id, options)
+        except Exception as e:
+            print(f"--- Democracy Engine: Synthesis of {decision_id} raised {type(e).__name__}: {e} ---")
+            synthesized = False
+
+        if synthesized:
+            self.engine.advance_phase(decision_id, VotingPhase.RANKED_VOTING, from_phase=VotingPhase.SYNTHESIS)
+            return
+        # Sonst bliebe die Entscheidung dauerhaft in SYNTHESIS (die Phase hat keine Frist)
+        delay = self._rules.get(decision_id, self.default_rule).synthesis_retry_s
+        print(f"--- Democracy Engine: Synthesis of {decision_id} failed; retrying in {delay:g} s ---")
+        with self._condition:
+            self._schedule(decision_id, VotingPhase.SYNTHESIS.value, delay, _SYNTHESIS_RETRY)
+
+
+def create_phase_scheduler_from_env(engine) -> Optional[PhaseScheduler]:
+    """
+    Startet einen Scheduler, wenn `DEMOCRACY_AUTO_ADVANCE` gesetzt ist. Regeln aus
+    `DEMOCRACY_QUORUM` (Anteil, Standard 1.0), `DEMOCRACY_IDEA_DEADLINE_S` und
+    `DEMOCRACY_VOTING_DEADLINE_S`.
+    """
+    if os.getenv("DEMOCRACY_AUTO_ADVANCE", "false").lower() not in ("1", "true", "yes"):
+        return None
+
+    def seconds(name: str) -> Optional[float]:
+        value = os.getenv(name)
+        return float(value) if value else None
+
+    rule = PhaseRule(
+        quorum=float(os.getenv("DEMOCRACY_QUORUM", "1.0")),
+        idea_deadline_s=seconds("DEMOCRACY_IDEA_DEADLINE_S"),
+        voting_deadline_s=seconds("DEMOCRACY_VOTING_DEADLINE_S")
+    )
+    return PhaseScheduler(engine, default_rule=rule).start()
+
+
+# Globaler Scheduler für die Engine dieses Prozesses; ein Client (DEMOCRACY_ENGINE_SOCKET)
+# plant nicht selbst, das übernimmt der Server
+_phase_scheduler = (
+    create_phase_scheduler_from_env(_democracy_engine)
+    if isinstance(_democracy_engine, DemocraticVotingLogic) else None
+)
+
+
+if __name__ == '__main__':
+    from tools.team_voting_tool import ConflictType
+
+    print("=== Testing Phase Scheduler ===")
+    engine = DemocraticVotingLogic(verbose=False)
+    scheduler = PhaseScheduler(engine, default_rule=PhaseRule(advance_on_locked_outcome=False)).start()
+    agents = ["Frontend_Specialist", "Backend_Specialist", "QA_Specialist"]
+
+    def run_proposals(decision_id: str, names: List[str]) -> None:
+        for name in names:
+            engine.add_agent_proposal(decision_id, name, f"Use React with a {name} focus", "Reasoning")
+
+    print("\n1. Quorum: every participant submits...")
+    decision_id = engine.trigger_democratic_decision(ConflictType.MANUAL_TRIGGER, "Quorum", "Framework", agents)
+    engine.advance_phase(decision_id, VotingPhase.IDEA_COLLECTION)
+    start = time.perf_counter()
+    run_proposals(decision_id, agents)
+    print(f"  Reached RANKED_VOTING: {engine.wait_for_phase(decision_id, VotingPhase.RANKED_VOTING, timeout=5)} "
+          f"after {(time.perf_counter() - start) * 1000:.1f} ms")
+    options = [opt["option_id"] for opt in engine.get_decision_status(decision_id)["voting_options"]]
+    for name in agents:
+        engine.submit_agent_vote(decision_id, name, options, "Ranking")
+    print(f"  Reached COMMITMENT: {engine.wait_for_phase(decision_id, VotingPhase.COMMITMENT, timeout=5)}, "
+          f"winner {engine.get_decision_status(decision_id)['winning_option_id']}")
+
+    print("\n2. Deadline: QA_Specialist never answers...")
+    decision_id = engine.trigger_democratic_decision(ConflictType.MANUAL_TRIGGER, "Deadline", "Framework", agents)
+    scheduler.set_rule(decision_id, PhaseRule(idea_deadline_s=0.3, voting_deadline_s=0.3,
+                                              advance_on_locked_outcome=False))
+    engine.advance_phase(decision_id, VotingPhase.IDEA_COLLECTION)
+    start = time.perf_counter()
+    run_proposals(decision_id, agents[:2])
+    engine.wait_for_phase(decision_id, VotingPhase.RANKED_VOTING, timeout=5)
+    print(f"  Reached RANKED_VOTING after {time.perf_counter() - start:.2f} s with "
+          f"{len(engine.get_decision_status(decision_id)['proposals'])} of 3 proposals")
+    options = [opt["option_id"] for opt in engine.get_decision_status(decision_id)["voting_options"]]
+    for name in agents[:2]:
+        engine.submit_agent_vote(decision_id, name, options, "Ranking")
+    start = time.perf_counter()
+    engine.wait_for_phase(decision_id, VotingPhase.COMMITMENT, timeout=5)
+    print(f"  Reached COMMITMENT after {time.perf_counter() - start:.2f} s with 2 of 3 votes")
+
+    print("\n3. Locked outcome: the remaining ballot cannot change the winner...")
+    decision_id = engine.trigger_democratic_decision(ConflictType.MANUAL_TRIGGER, "Lock", "Framework", agents)
+    scheduler.set_rule(decision_id, PhaseRule())
+    engine.advance_phase(decision_id, VotingPhase.IDEA_COLLECTION)
+    engine.add_agent_proposal(decision_id, agents[0], "Use React", "Ecosystem")
+    engine.add_agent_proposal(decision_id, agents[1], "Use Vue", "Simplicity")
+    engine.add_agent_proposal(decision_id, agents[2], "Focus on performance", "Speed")
+    engine.wait_for_phase(decision_id, VotingPhase.RANKED_VOTING, timeout=5)
+    options = [opt["option_id"] for opt in engine.get_decision_status(decision_id)["voting_options"]]
+    for name in agents[:2]:
+        engine.submit_agent_vote(decision_id, name, options, "Ranking")
+    print(f"  Reached COMMITMENT without the third vote: "
+          f"{engine.wait_for_phase(decision_id, VotingPhase.COMMITMENT, timeout=5)}")
+
+    print("\n4. Deadline passes without proposals, a late proposal arrives...")
+    decision_id = engine.trigger_democratic_decision(ConflictType.MANUAL_TRIGGER, "Late", "Framework", agents)
+    scheduler.set_rule(decision_id, PhaseRule(idea_deadline_s=0.1, advance_on_locked_outcome=False))
+    engine.advance_phase(decision_id, VotingPhase.IDEA_COLLECTION)
+    time.sleep(0.3)
+    run_proposals(decision_id, agents[:1])
+    print(f"  Reached RANKED_VOTING with 1 of 3 proposals: "
+          f"{engine.wait_for_phase(decision_id, VotingPhase.RANKED_VOTING, timeout=5)}")
+    print(f"  Stale compare-and-set from IDEA_COLLECTION rejected: "
+          f"{not engine.advance_phase(decision_id, VotingPhase.SYNTHESIS, from_phase=VotingPhase.IDEA_COLLECTION)}")
+
+    print("\n5. Synthesis fails once and is retried...")
+    failures = []
+
+    def flaky_synthesizer(decision_id: str, proposals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not failures:
+            failures.append(decision_id)
+            raise RuntimeError("synthesis backend unavailable")
+        return _default_synthesizer(decision_id, proposals)
+
+    scheduler.synthesizer = flaky_synthesizer
+    decision_id = engine.trigger_democratic_decision(ConflictType.MANUAL_TRIGGER, "Retry", "Framework", agents)
+    scheduler.set_rule(decision_id, PhaseRule(synthesis_retry_s=0.1, advance_on_locked_outcome=False))
+    engine.advance_phase(decision_id, VotingPhase.IDEA_COLLECTION)
+    run_proposals(decision_id, agents)
+    print(f"  Reached RANKED_VOTING after a failed synthesis: "
+          f"{engine.wait_for_phase(decision_id, VotingPhase.RANKED_VOTING, timeout=5)}, "
+          f"{len(engine.get_decision_status(decision_id)['voting_options'])} options")
+
+    scheduler.stop()
+    print("\n=== Phase Scheduler Testing Complete ===")
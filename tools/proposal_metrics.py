@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from tools.text_vectors import (
+    DEFAULT_CLUSTER_DISTANCE,
+    PROPOSAL_FIELD_WEIGHTS,
+    HashingTfidfVectorizer,
+    cosine_distance,
+    distance_clusters,
+    weighted_combination,
+)
+
+# Ab dieser Cosinus-Ähnlichkeit zwischen Vorschlag und Begründung wiederholt die Begründung nur den Vorschlag
+RESTATEMENT_SIMILARITY = 0.5
+
+
+@dataclass(slots=True)
+class ProposalMetrics:
+    """Vektorisierte Kennzahlen über alle Vorschläge einer Entscheidung."""
+    agents: List[str]
+    distance: np.ndarray            # paarweise Cosinus-Distanz (Vorschläge x Vorschläge)
+    labels: np.ndarray              # Cluster-Nummer je Vorschlag
+    novelty: np.ndarray             # Distanz zum nächsten Vorschlag eines anderen Agents
+    reasoning_terms: np.ndarray     # verschiedene Begriffe (Wörter und Wortpaare) je Begründung
+    restatement: np.ndarray         # Cosinus-Ähnlichkeit Vorschlag <-> eigene Begründung
+
+    @property
+    def cluster_sizes(self) -> np.ndarray:
+        return np.bincount(self.labels)
+
+    @property
+    def cluster_entropy(self) -> float:
+        """Shannon-Entropie der Cluster-Verteilung (nats); 0 = alle Vorschläge in einem Cluster."""
+        shares = self.cluster_sizes / len(self.labels)
+        return float(-(shares * np.log(shares)).sum())
+
+    @property
+    def effective_clusters(self) -> float:
+        """exp(Entropie): Zahl gleich großer Cluster mit derselben Vielfalt."""
+        return float(np.exp(self.cluster_entropy))
+
+    @property
+    def mean_distance(self) -> float:
+        count = len(self.labels)
+        if count < 2:
+            return 0.0
+        return float(self.distance.sum() / (count * (count - 1)))
+
+    def agent_novelty(self) -> Dict[str, float]:
+        """Höchste Neuheit je Agent (ein Agent kann in Tests mehrere Vorschläge haben)."""
+        result: Dict[str, float] = {}
+        for agent, novelty in zip(self.agents, self.novelty.tolist()):
+            result[agent] = max(result.get(agent, 0.0), round(novelty, 3))
+        return result
+
+    def to_dict(self, top_agents: int = 5) -> Dict[str, Any]:
+        novelty = self.agent_novelty()
+        ranked = sorted(novelty.items(), key=lambda item: -item[1])
+        _, counts = np.unique(self.agents, return_counts=True)
+        return {
+            "proposals": len(self.labels),
+            "clusters": int(self.labels.max()) + 1 if len(self.labels) else 0,
+            "cluster_entropy": round(self.cluster_entropy, 3),
+            "effective_clusters": round(self.effective_clusters, 2),
+            "mean_distance": round(self.mean_distance, 3),
+            "most_novel_agents": dict(ranked[:top_agents]),
+            "least_novel_agents": dict(ranked[-top_agents:][::-1]) if len(ranked) > top_agents else {},
+            "top_agent_share": round(float(counts.max() / len(self.agents)), 3) if len(self.agents) else 0.0,
+            "median_reasoning_terms": float(np.median(self.reasoning_terms)) if len(self.labels) else 0.0,
+            "restating_reasoning_share": round(float((self.restatement >= RESTATEMENT_SIMILARITY).mean()), 3)
+            if len(self.labels) else 0.0,
+        }
+
+
+def compute_proposal_metrics(
+    proposals: List[Dict[str, Any]],
+    distance_threshold: float = DEFAULT_CLUSTER_DISTANCE,
+    vectorizer: Optional[HashingTfidfVectorizer] = None
+) -> ProposalMetrics:
+    """
+    Vektorisiert alle Vorschläge einmal (TF-IDF wie beim Clustering) und leitet
+    daraus Distanzmatrix, Cluster, Neuheit je Vorschlag und Tiefe der Begründungen ab.
+    """
+    vectorizer = vectorizer or HashingTfidfVectorizer()
+    agents = [p["agent_name"] for p in proposals]
+    if not proposals:
+        empty = np.zeros(0)
+        return ProposalMetrics(agents, np.zeros((0, 0)), np.zeros(0, dtype=np.int64), empty, empty, empty)
+
+    proposal_vectors = vectorizer.transform([p["proposal"] for p in proposals])
+    reasoning_vectors = vectorizer.transform([p.get("reasoning", "") for p in proposals])
+    vectors = weighted_combination([proposal_vectors, reasoning_vectors], PROPOSAL_FIELD_WEIGHTS)
+
+    distance = cosine_distance(vectors)
+    labels = distance_clusters(distance, distance_threshold)
+
+    # Neuheit: Abstand zum ähnlichsten Vorschlag eines anderen Agents
+    agent_ids = np.unique(agents, return_inverse=True)[1]
+    others = np.where(agent_ids[:, None] != agent_ids[None, :], distance, np.inf)
+    novelty = others.min(axis=1)
+    novelty[np.isinf(novelty)] = 1.0
+
+    reasoning_terms = np.diff(reasoning_vectors.indptr)
+    restatement = np.asarray(proposal_vectors.multiply(reasoning_vectors).sum(axis=1)).ravel()
+
+    return ProposalMetrics(agents, distance, labels, novelty, reasoning_terms, restatement)
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    print("=== Testing Proposal Metrics ===")
+    proposals = [
+        {"agent_name": "Developer", "proposal": "Use React with TypeScript", "reasoning": "Type safety and ecosystem"},
+        {"agent_name": "Designer", "proposal": "React with TypeScript", "reasoning": "Component libraries and type safety"},
+        {"agent_name": "Tester", "proposal": "Vue.js with Composition API", "reasoning": "Easier testing and gentle learning curve"},
+        {"agent_name": "Ops", "proposal": "Cache API responses in Redis", "reasoning": "Repeated queries slow down the backend"},
+    ]
+    metrics = compute_proposal_metrics(proposals)
+    print(f"\n1. Small decision: {metrics.to_dict()}")
+
+    print("\n2. Scaling...")
+    rng = random.Random(5)
+    words = "cache api database schema test deploy react vue layout audit metrics queue worker retry".split()
+    for count in (100, 500, 2000):
+        synthetic = [
+            {"agent_name": f"Agent_{i}", "proposal": " ".join(rng.choice(words) for _ in range(6)),
+             "reasoning": " ".join(rng.choice(words) for _ in range(12))}
+            for i in range(count)
+        ]
+        start = time.perf_counter()
+        metrics = compute_proposal_metrics(synthetic)
+        summary = metrics.to_dict()
+        elapsed = time.perf_counter() - start
+        print(f"  {count:>5} proposals in {elapsed * 1000:7.1f} ms: entropy {summary['cluster_entropy']}, "
+              f"effective clusters {summary['effective_clusters']}, mean distance {summary['mean_distance']}")
+
+    print("\n=== Proposal Metrics Testing Complete ===")
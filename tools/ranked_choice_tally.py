@@ -0,0 +1,422 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+TALLY_METHODS = ("irv", "schulze", "borda", "copeland")
+
+# Begrenzt den temporären (Ballots x Optionen x Optionen)-Vergleichstensor
+_PAIRWISE_CHUNK_CELLS = 4_000_000
+
+
+@dataclass
+class TallyResult:
+    """Ergebnis einer Auszählung inklusive Runden-Aufschlüsselung."""
+    method: str
+    winner: Optional[str]
+    ranking: List[str]
+    scores: Dict[str, float]
+    rounds: List[Dict[str, Any]] = field(default_factory=list)
+    total_ballots: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "winner": self.winner,
+            "ranking": self.ranking,
+            "scores": self.scores,
+            "rounds": self.rounds,
+            "total_ballots": self.total_ballots
+        }
+
+
+def build_rank_matrix(ballots: Sequence[Sequence[str]], option_ids: Sequence[str]) -> np.ndarray:
+    """
+    Wandelt Ranglisten in eine (Ballots x Optionen)-Matrix von Rängen um.
+    Rang 0 ist die erste Wahl; nicht gerankte Optionen erhalten Rang k (gemeinsam letzter Platz).
+    Doppelt genannte Optionen zählen nur beim ersten Auftreten, unbekannte werden ignoriert.
+    """
+    k = len(option_ids)
+    index = {option_id: i for i, option_id in enumerate(option_ids)}
+    ranks = np.full((len(ballots), k), k, dtype=np.int32)
+
+    for row, ballot in enumerate(ballots):
+        position = 0
+        for option_id in ballot:
+            column = index.get(option_id)
+            if column is None or ranks[row, column] != k:
+                continue
+            ranks[row, column] = position
+            position += 1
+
+    return ranks
+
+
+def pairwise_preferences(ranks: np.ndarray) -> np.ndarray:
+    """
+    Paarweise Präferenzmatrix d[i, j] = Anzahl Ballots, die i strikt vor j ranken.
+    Wird in Blöcken berechnet, damit der Vergleichstensor klein bleibt.
+    """
+    n, k = ranks.shape
+    d = np.zeros((k, k), dtype=np.int64)
+    if n == 0 or k == 0:
+        return d
+
+    chunk = max(1, _PAIRWISE_CHUNK_CELLS // (k * k))
+    for start in range(0, n, chunk):
+        block = ranks[start:start + chunk]
+        d += (block[:, :, None] < block[:, None, :]).sum(axis=0)
+    return d
+
+
+def _ranking_from_scores(scores: np.ndarray) -> List[int]:
+    # Stabile Sortierung: bei Gleichstand gewinnt die früher synthetisierte Option
+    return [int(i) for i in np.argsort(-scores, kind="stable")]
+
+
+def _matrix_to_dict(matrix: np.ndarray, option_ids: Sequence[str]) -> Dict[str, Dict[str, int]]:
+    return {
+        option_ids[i]: {option_ids[j]: int(matrix[i, j]) for j in range(len(option_ids)) if i != j}
+        for i in range(len(option_ids))
+    }
+
+
+def tally_irv(ranks: np.ndarray, option_ids: Sequence[str]) -> TallyResult:
+    """
+    Instant-Runoff: pro Runde werden die Erstpräferenzen unter den verbleibenden Optionen
+    gezählt, bis eine Option die absolute Mehrheit der nicht erschöpften Ballots hat.
+    Gleichstand beim Ausscheiden wird über den Borda-Score entschieden, danach scheidet
+    die später synthetisierte Option aus.
+    """
+    n, k = ranks.shape
+    remaining = np.ones(k, dtype=bool)
+    borda = np.where(ranks < k, k - 1 - ranks, 0).sum(axis=0)
+    rounds: List[Dict[str, Any]] = []
+    eliminated_order: List[int] = []
+    counts = np.zeros(k, dtype=np.int64)
+
+    while remaining.any():
+        masked = np.where(remaining[None, :], ranks, k + 1)
+        top_choice = masked.argmin(axis=1)
+        active = masked.min(axis=1) < k
+        counts = np.bincount(top_choice[active], minlength=k)
+        active_ballots = int(active.sum())
+
+        round_info: Dict[str, Any] = {
+            "round": len(rounds) + 1,
+            "counts": {option_ids[i]: int(counts[i]) for i in np.flatnonzero(remaining)},
+            "exhausted_ballots": n - active_ballots,
+        }
+
+        leader = int(np.flatnonzero(remaining)[np.argmax(counts[remaining])])
+        if remaining.sum() == 1 or counts[leader] * 2 > active_ballots:
+            round_info["winner"] = option_ids[leader]
+            rounds.append(round_info)
+            ranking = [leader] + [
+                i for i in _ranking_from_scores(counts.astype(float)) if remaining[i] and i != leader
+            ] + eliminated_order[::-1]
+            return TallyResult(
+                method="irv",
+                winner=option_ids[leader],
+                ranking=[option_ids[i] for i in ranking],
+                scores={option_ids[i]: float(counts[i]) for i in range(k)},
+                rounds=rounds,
+                total_ballots=n
+            )
+
+        candidates = np.flatnonzero(remaining)
+        lowest = candidates[counts[candidates] == counts[candidates].min()]
+        if len(lowest) > 1:
+            lowest = lowest[borda[lowest] == borda[lowest].min()]
+        loser = int(lowest[-1])
+
+        remaining[loser] = False
+        eliminated_order.append(loser)
+        round_info["eliminated"] = option_ids[loser]
+        rounds.append(round_info)
+
+    return TallyResult(method="irv", winner=None, ranking=[], scores={}, rounds=rounds, total_ballots=n)
+
+
+def tally_borda(ranks: np.ndarray, option_ids: Sequence[str]) -> TallyResult:
+    """Borda-Zählung: Rang r bringt k-1-r Punkte, nicht gerankte Optionen 0 Punkte."""
+    n, k = ranks.shape
+    scores = np.where(ranks < k, k - 1 - ranks, 0).sum(axis=0).astype(float)
+    ranking = _ranking_from_scores(scores)
+    return TallyResult(
+        method="borda",
+        winner=option_ids[ranking[0]],
+        ranking=[option_ids[i] for i in ranking],
+        scores={option_ids[i]: float(scores[i]) for i in range(k)},
+        rounds=[{"round": 1, "points": {option_ids[i]: float(scores[i]) for i in range(k)}}],
+        total_ballots=n
+    )
+
+
+def tally_copeland(ranks: np.ndarray, option_ids: Sequence[str], d: Optional[np.ndarray] = None) -> TallyResult:
+    """Copeland: ein Punkt pro gewonnenem Paarvergleich, ein halber pro Unentschieden."""
+    n, k = ranks.shape
+    if d is None:
+        d = pairwise_preferences(ranks)
+    wins = (d > d.T).sum(axis=1)
+    ties = (d == d.T).sum(axis=1) - 1  # Diagonale nicht mitzählen
+    scores = wins + 0.5 * ties
+    ranking = _ranking_from_scores(scores)
+    return TallyResult(
+        method="copeland",
+        winner=option_ids[ranking[0]],
+        ranking=[option_ids[i] for i in ranking],
+        scores={option_ids[i]: float(scores[i]) for i in range(k)},
+        rounds=[{"round": 1, "pairwise": _matrix_to_dict(d, option_ids)}],
+        total_ballots=n
+    )
+
+
+def schulze_strongest_paths(d: np.ndarray) -> np.ndarray:
+    """Stärkste Pfade nach Schulze (Floyd-Warshall auf der Widest-Path-Variante)."""
+    p = np.where(d > d.T, d, 0)
+    for i in range(d.shape[0]):
+        p = np.maximum(p, np.minimum(p[:, i:i + 1], p[i:i + 1, :]))
+    np.fill_diagonal(p, 0)
+    return p
+
+
+def tally_schulze(ranks: np.ndarray, option_ids: Sequence[str], d: Optional[np.ndarray] = None) -> TallyResult:
+    """Schulze-Methode über die Matrix der stärksten Pfade."""
+    n, k = ranks.shape
+    if d is None:
+        d = pairwise_preferences(ranks)
+    p = schulze_strongest_paths(d)
+    scores = (p > p.T).sum(axis=1).astype(float)
+    ranking = _ranking_from_scores(scores)
+    return TallyResult(
+        method="schulze",
+        winner=option_ids[ranking[0]],
+        ranking=[option_ids[i] for i in ranking],
+        scores={option_ids[i]: float(scores[i]) for i in range(k)},
+        rounds=[
+            {"round": 1, "pairwise": _matrix_to_dict(d, option_ids)},
+            {"round": 2, "strongest_paths": _matrix_to_dict(p, option_ids)}
+        ],
+        total_ballots=n
+    )
+
+
+def tally(ballots: Sequence[Sequence[str]], option_ids: Sequence[str], method: str = "borda") -> TallyResult:
+    """Zählt Ranglisten-Ballots mit der gewählten Methode aus."""
+    if method not in TALLY_METHODS:
+        raise ValueError(f"Unknown tally method '{method}'. Valid methods: {list(TALLY_METHODS)}")
+    if not option_ids:
+        return TallyResult(method=method, winner=None, ranking=[], scores={}, total_ballots=len(ballots))
+
+    ranks = build_rank_matrix(ballots, option_ids)
+    if method == "irv":
+        return tally_irv(ranks, option_ids)
+    if method == "schulze":
+        return tally_schulze(ranks, option_ids)
+    if method == "copeland":
+        return tally_copeland(ranks, option_ids)
+    return tally_borda(ranks, option_ids)
+
+
+class RunningTally:
+    """
+    Laufende Auszählung, die bei jeder Stimmabgabe in O(k²) aktualisiert wird.
+
+    Hält die paarweise Präferenzmatrix, Erstpräferenzen und Borda-Punkte und
+    berechnet daraus nach jedem Ballot die Standings (Führende Option, Margins,
+    Condorcet-Sieger) vor, sodass Abfragen während der Abstimmung keine
+    Neuauszählung auslösen.
+    """
+
+    def __init__(self, option_ids: Sequence[str], method: str = "borda"):
+        self.option_ids = list(option_ids)
+        self.method = method
+        self._index = {option_id: i for i, option_id in enumerate(self.option_ids)}
+        k = len(self.option_ids)
+
+        self.ballot_count = 0
+        self.pairwise = np.zeros((k, k), dtype=np.int64)
+        self.first_preferences = np.zeros(k, dtype=np.int64)
+        self.borda_scores = np.zeros(k, dtype=np.int64)
+        self._standings: Dict[str, Any] = self._compute_standings()
+
+    def add_ballot(self, ranked_option_ids: Sequence[str]) -> None:
+        k = len(self.option_ids)
+        ranks = build_rank_matrix([ranked_option_ids], self.option_ids)[0]
+
+        self.pairwise += ranks[:, None] < ranks[None, :]
+        ranked = ranks < k
+        self.borda_scores += np.where(ranked, k - 1 - ranks, 0)
+        if ranked.any():
+            self.first_preferences[int(np.argmin(ranks))] += 1
+        self.ballot_count += 1
+
+        self._standings = self._compute_standings()
+
+    def _compute_standings(self) -> Dict[str, Any]:
+        k = len(self.option_ids)
+        if k == 0:
+            return {"ballots": self.ballot_count, "leader": None, "condorcet_winner": None}
+
+        margins = self.pairwise - self.pairwise.T
+        beats = margins > 0
+        copeland = beats.sum(axis=1) + 0.5 * ((margins == 0).sum(axis=1) - 1)
+
+        condorcet_winner = None
+        unbeaten = np.flatnonzero(beats.sum(axis=1) == k - 1)
+        if len(unbeaten) == 1:
+            condorcet_winner = self.option_ids[int(unbeaten[0])]
+
+        # Führende Option passend zum Auszählverfahren; IRV und Schulze über ihre
+        # inkrementell verfügbaren Näherungen (Erstpräferenzen bzw. Condorcet/Copeland)
+        if self.method == "irv":
+            leader_scores = self.first_preferences.astype(float)
+        elif self.method == "borda":
+            leader_scores = self.borda_scores.astype(float)
+        else:
+            leader_scores = copeland
+        leader = self.option_ids[_ranking_from_scores(leader_scores)[0]] if self.ballot_count else None
+        if self.method in ("schulze", "copeland") and condorcet_winner:
+            leader = condorcet_winner
+
+        return {
+            "method": self.method,
+            "ballots": self.ballot_count,
+            "leader": leader,
+            "condorcet_winner": condorcet_winner,
+            "first_preferences": {self.option_ids[i]: int(self.first_preferences[i]) for i in range(k)},
+            "borda_scores": {self.option_ids[i]: int(self.borda_scores[i]) for i in range(k)},
+            "copeland_scores": {self.option_ids[i]: float(copeland[i]) for i in range(k)},
+            "margins": _matrix_to_dict(margins, self.option_ids)
+        }
+
+    @property
+    def standings(self) -> Dict[str, Any]:
+        return self._standings
+
+    @property
+    def leader(self) -> Optional[str]:
+        return self._standings["leader"]
+
+    @property
+    def condorcet_winner(self) -> Optional[str]:
+        return self._standings["condorcet_winner"]
+
+    def locked_winner(self, remaining_ballots: int, method: Optional[str] = None) -> Optional[str]:
+        """
+        Gibt den Sieger nach `method` (Standard: Verfahren dieser Auszählung) zurück, falls
+        keine Kombination der ausstehenden Ballots das Ergebnis noch ändern kann, sonst None.
+        Die Prüfung ist konservativ (hinreichend, nicht notwendig): im Zweifel wird weiter
+        abgestimmt.
+        """
+        method = method or self.method
+        k = len(self.option_ids)
+        if k == 0 or self.ballot_count == 0:
+            return None
+        if k == 1:
+            return self.option_ids[0]
+
+        r = max(0, remaining_ballots)
+        others = np.arange(k)
+
+        if method == "irv":
+            # Absolute Mehrheit aller (auch künftiger) Ballots in Runde 1
+            leader = int(np.argmax(self.first_preferences))
+            if 2 * self.first_preferences[leader] > self.ballot_count + r:
+                return self.option_ids[leader]
+            return None
+
+        if method == "borda":
+            # Jeder ausstehende Ballot kann den Abstand um höchstens k-1 Punkte verringern;
+            # bei Punktgleichstand gewinnt die früher synthetisierte Option
+            leader = _ranking_from_scores(self.borda_scores.astype(float))[0]
+            gap = self.borda_scores[leader] - self.borda_scores - r * (k - 1)
+            safe = (gap > 0) | ((gap == 0) & (others > leader))
+            safe[leader] = True
+            return self.option_ids[leader] if safe.all() else None
+
+        # Schulze/Copeland: bleibt der Condorcet-Sieger auch bei r Gegenstimmen
+        # in jedem Paarvergleich vorne, gewinnt er bei beiden Verfahren
+        margins = self.pairwise - self.pairwise.T
+        leader = int(np.argmax((margins > 0).sum(axis=1)))
+        safe = margins[leader] > r
+        safe[leader] = True
+        return self.option_ids[leader] if safe.all() else None
+
+    def margin(self, option_a: str, option_b: str) -> int:
+        """Vorsprung von option_a gegenüber option_b im direkten Vergleich."""
+        i, j = self._index[option_a], self._index[option_b]
+        return int(self.pairwise[i, j] - self.pairwise[j, i])
+
+
+if __name__ == '__main__':
+    import time
+
+    print("=== Testing Ranked Choice Tally Engine ===")
+
+    # Klassisches Beispiel: Borda und IRV können sich unterscheiden
+    example_options = ["option_1", "option_2", "option_3"]
+    example_ballots = (
+        [["option_1", "option_2", "option_3"]] * 4 +
+        [["option_2", "option_3", "option_1"]] * 3 +
+        [["option_3", "option_2", "option_1"]] * 2
+    )
+    for tally_method in TALLY_METHODS:
+        result = tally(example_ballots, example_options, tally_method)
+        print(f"{tally_method:>9}: winner={result.winner}, ranking={result.ranking}, rounds={len(result.rounds)}")
+
+    running = RunningTally(example_options, method="schulze")
+    for ballot in example_ballots:
+        running.add_ballot(ballot)
+    print(f"Running tally: leader={running.leader}, condorcet={running.condorcet_winner}, "
+          f"margin option_2 vs option_1={running.margin('option_2', 'option_1')}")
+
+    # Early-Termination: gesperrte Ergebnisse gegen alle möglichen Rest-Ballots prüfen
+    import itertools
+    rng = np.random.default_rng(7)
+    small_options = ["option_1", "option_2", "option_3"]
+    permutations = [list(p) for p in itertools.permutations(small_options)]
+    locked_checks = violations = 0
+    for _ in range(300):
+        electorate = int(rng.integers(3, 8))
+        cast = [permutations[i] for i in rng.integers(0, len(permutations), int(rng.integers(1, electorate)))]
+        remaining_count = electorate - len(cast)
+        # Eine Auszählung, Sperre je Verfahren (wie bei abweichendem `method` der Engine)
+        running = RunningTally(small_options)
+        for ballot in cast:
+            running.add_ballot(ballot)
+        for tally_method in TALLY_METHODS:
+            locked = running.locked_winner(remaining_count, tally_method)
+            if locked is None:
+                continue
+            locked_checks += 1
+            for rest in itertools.product(permutations, repeat=remaining_count):
+                if tally(cast + list(rest), small_options, tally_method).winner != locked:
+                    violations += 1
+                    break
+    print(f"Early termination: {locked_checks} locked outcomes verified, {violations} violations")
+
+    print("\n=== Benchmark: tally time (ms) vs ballots x options ===")
+    rng = np.random.default_rng(42)
+    print(f"{'ballots':>8} {'options':>8} " + " ".join(f"{m:>9}" for m in TALLY_METHODS))
+    for n_ballots in (100, 1_000, 10_000):
+        for n_options in (4, 12, 32):
+            options = [f"option_{i + 1}" for i in range(n_options)]
+            ballots = [[options[i] for i in rng.permutation(n_options)] for _ in range(n_ballots)]
+            ranks = build_rank_matrix(ballots, options)
+            timings = []
+            for tally_method in TALLY_METHODS:
+                start = time.perf_counter()
+                if tally_method == "irv":
+                    tally_irv(ranks, options)
+                elif tally_method == "schulze":
+                    tally_schulze(ranks, options)
+                elif tally_method == "copeland":
+                    tally_copeland(ranks, options)
+                else:
+                    tally_borda(ranks, options)
+                timings.append((time.perf_counter() - start) * 1000)
+            print(f"{n_ballots:>8} {n_options:>8} " + " ".join(f"{t:>9.2f}" for t in timings))
+
+    print("\n=== Ranked Choice Tally Testing Complete ===")
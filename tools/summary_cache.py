@@ -0,0 +1,228 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Standard-Obergrenze des Caches (UTF-8-Bytes der gespeicherten Zusammenfassungen)
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+# Zugriffszeiten werden gesammelt und erst nach so vielen Treffern in SQLite geschrieben
+_TOUCH_FLUSH_INTERVAL = 256
+
+
+def summary_key(text: str, max_length: Optional[int], summary_focus: Optional[str], model: str) -> str:
+    """Inhaltsadresse einer Zusammenfassung: BLAKE2b über Modell, Länge, Fokus und Text."""
+    digest = hashlib.blake2b(digest_size=20)
+    for value in (model, str(max_length or ""), summary_focus or "", text):
+        digest.update(value.encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """
+    Persistenter, inhaltsadressierter Cache für Zusammenfassungen.
+
+    Die Einträge liegen in SQLite (WAL) und zusätzlich in einem In-Memory-Spiegel
+    (OrderedDict in LRU-Reihenfolge), sodass Treffer ohne Datenbankzugriff in
+    Mikrosekunden beantwortet werden. Einträge, die ein anderer Prozess geschrieben
+    hat, werden bei einem Fehlgriff im Spiegel aus SQLite nachgeladen. Überschreitet
+    die Summe der Zusammenfassungen `max_bytes`, werden die am längsten nicht
+    genutzten Einträge verdrängt; mit `ttl_s` verfallen Einträge nach ihrer
+    Erstellung. Die Zugriffszeiten für die LRU-Reihenfolge nach einem Neustart
+    werden gebündelt geschrieben.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS summaries (
+            cache_key   TEXT PRIMARY KEY,
+            summary     TEXT NOT NULL,
+            size        INTEGER NOT NULL,
+            created     REAL NOT NULL,
+            last_access REAL NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_summaries_last_access ON summaries (last_access);
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = DEFAULT_MAX_BYTES, ttl_s: Optional[float] = None):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        if ttl_s is not None:
+            self._conn.execute("DELETE FROM summaries WHERE created < ?", (time.time() - ttl_s,))
+        self._conn.commit()
+
+        # cache_key -> (summary, size, created), älteste Nutzung zuerst
+        self._entries: "OrderedDict[str, Tuple[str, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._touched: Dict[str, float] = {}
+        for key, summary, size, created in self._conn.execute(
+            "SELECT cache_key, summary, size, created FROM summaries ORDER BY last_access"
+        ):
+            self._entries[key] = (summary, size, created)
+            self._bytes += size
+        with self._lock:
+            self._evict()
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl_s is not None and now - created > self.ttl_s
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            reloaded = False
+            if entry is None:
+                # Evtl. von einem anderen Prozess geschrieben
+                row = self._conn.execute(
+                    "SELECT summary, size, created FROM summaries WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = self._entries[key] = (row[0], row[1], row[2])
+                    self._bytes += row[1]
+                    reloaded = True
+
+            if entry is not None and self._expired(entry[2], now):
+                self._remove([key])
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._touched[key] = now
+            if reloaded:
+                # Nachgeladene Einträge zählen wie neue gegen `max_bytes`
+                self._evict()
+            if len(self._touched) >= _TOUCH_FLUSH_INTERVAL:
+                self._flush_touches()
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, summary: str) -> None:
+        now = time.time()
+        size = len(summary.encode("utf-8"))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (summary, size, now)
+            self._bytes += size
+            self._touched.pop(key, None)
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO summaries (cache_key, summary, size, created, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, summary, size, now, now)
+                )
+            self._evict()
+
+    def _evict(self) -> None:
+        victims: List[str] = []
+        bytes_after = self._bytes
+        for key, (_, size, _) in self._entries.items():
+            if bytes_after <= self.max_bytes:
+                break
+            victims.append(key)
+            bytes_after -= size
+        if victims:
+            self._remove(victims)
+            self.evictions += len(victims)
+
+    def _remove(self, keys: List[str]) -> None:
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+            self._touched.pop(key, None)
+        with self._conn:
+            self._conn.executemany("DELETE FROM summaries WHERE cache_key = ?", [(key,) for key in keys])
+
+    def _flush_touches(self) -> None:
+        if self._touched:
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE summaries SET last_access = ? WHERE cache_key = ?",
+                    [(accessed, key) for key, accessed in self._touched.items()]
+                )
+            self._touched.clear()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.close()
+
+
+def create_summary_cache_from_env() -> Optional[SummaryCache]:
+    """Summary-Cache nach SUMMARIZER_CACHE*-Variablen; SUMMARIZER_CACHE=false schaltet ihn ab."""
+    if os.getenv("SUMMARIZER_CACHE", "true").lower() in ("0", "false", "no"):
+        return None
+    ttl = os.getenv("SUMMARIZER_CACHE_TTL_S")
+    return SummaryCache(
+        os.getenv("SUMMARIZER_CACHE_PATH", "summary_cache.sqlite3"),
+        max_bytes=int(float(os.getenv("SUMMARIZER_CACHE_MAX_MB", "32")) * 1024 * 1024),
+        ttl_s=float(ttl) if ttl else None
+    )
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    print("=== Testing Summary Cache ===")
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "summaries.sqlite3")
+        cache = SummaryCache(db_path, max_bytes=10_000)
+        text = "Long research text about ranked-choice voting. " * 200
+        key = summary_key(text, 100, "tally methods", "gemini/gemini-1.5-flash")
+
+        print(f"\n1. Cold lookup: {cache.get(key)!r}")
+        cache.put(key, "Borda and instant runoff compared.")
+        start = time.perf_counter()
+        for _ in range(10_000):
+            cache.get(summary_key(text, 100, "tally methods", "gemini/gemini-1.5-flash"))
+        print(f"2. Warm lookup incl. hashing {len(text)} chars: "
+              f"{(time.perf_counter() - start) / 10_000 * 1e6:.1f} us")
+        print(f"3. Other focus is a miss: {cache.get(summary_key(text, 100, None, 'gemini/gemini-1.5-flash'))!r}")
+
+        for i in range(50):
+            cache.put(summary_key(f"text {i}", None, None, "m"), "x" * 500)
+        print(f"4. After 50 x 500 bytes into 10 kB: {cache.stats}")
+        cache.close()
+
+        reopened = SummaryCache(db_path, max_bytes=10_000, ttl_s=0.05)
+        print(f"5. Reopened: {reopened.stats['entries']} entries, newest present: "
+              f"{reopened.get(summary_key('text 49', None, None, 'm')) is not None}")
+        time.sleep(0.1)
+        print(f"6. After TTL: {reopened.get(summary_key('text 49', None, None, 'm'))!r}, {reopened.stats}")
+        reopened.close()
+
+    print("\n=== Summary Cache Testing Complete ===")
@@ -3,18 +3,39 @@ from typing import List, Dict, Any, Optional, Type
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import Counter, defaultdict
 import re
 
+import numpy as np
+
+from tools.analysis_cache import ProposalAnalysisCache, load_decision_view
+from tools.keyword_matcher import _keyword_matcher
+from tools.near_duplicates import MinHashLSH
+from tools.online_clustering import OnlineProposalClusterer
+from tools.proposal_metrics import RESTATEMENT_SIMILARITY, ProposalMetrics, compute_proposal_metrics
+from tools.text_embeddings import _embedding_engine
+from tools.text_vectors import (
+    DEFAULT_CLUSTER_DISTANCE,
+    PROPOSAL_FIELD_WEIGHTS,
+    HashingTfidfVectorizer,
+    agglomerative_clusters,
+    cosine_similarity,
+    top_terms,
+    weighted_combination,
+)
+
 # Import the democracy engine from team_voting_tool
 try:
-    from tools.team_voting_tool import _democracy_engine, VotingPhase, VotingOption
+    from tools.team_voting_tool import _democracy_engine, _engine_tool, VotingPhase, VotingOption
 except ImportError:
     print("Warning: Could not import democracy engine. Synthesis tools will not work properly.")
     _democracy_engine = None
     VotingPhase = None
     VotingOption = None
 
+    def _engine_tool(run):
+        return run
+
 @dataclass
 class ProposalCluster:
     """Cluster ähnlicher Vorschläge."""
@@ -27,6 +48,19 @@ class ProposalCluster:
 class ProposalSynthesisLogic:
     """Logik für die Synthese von Agent-Vorschlägen zu Wahloptionen."""
     
+    def __init__(self, embeddings=None):
+        self._vectorizer = HashingTfidfVectorizer()
+        self._duplicate_detector = MinHashLSH()
+        self._embeddings = embeddings or _embedding_engine
+    
+    def related_proposals(self, query: str, proposals: List[Dict[str, Any]], top_k: int = 3) -> List[Dict[str, Any]]:
+        """Die `top_k` Vorschläge, die einer Frage inhaltlich am nächsten sind (gemeinsame Embeddings)."""
+        texts = [p["proposal"] + " " + p.get("reasoning", "") for p in proposals]
+        return [
+            {"agent_name": proposals[index]["agent_name"], "proposal": proposals[index]["proposal"], "similarity": score}
+            for index, score in self._embeddings.most_similar(query, texts, top_k)
+        ]
+    
     def analyze_proposals(self, proposals: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Analysiert alle Vorschläge und identifiziert Themen und Überschneidungen.
@@ -42,24 +76,14 @@ class ProposalSynthesisLogic:
             "unique_aspects": []
         }
         
-        # Einfache Keyword-basierte Themen-Erkennung
-        technology_keywords = {
-            "react": ["react", "jsx", "typescript", "ts"],
-            "vue": ["vue", "vue.js", "composition"],
-            "vanilla": ["vanilla", "plain", "javascript", "js", "native"],
-            "performance": ["speed", "fast", "performance", "optimize", "efficient"],
-            "maintainability": ["maintain", "clean", "readable", "documentation", "structure"],
-            "testing": ["test", "testing", "debug", "quality", "reliable"]
-        }
-        
+        # Keyword-basierte Themen-Erkennung (Taxonomie-Gruppe "proposal_themes")
         proposal_themes = defaultdict(list)
         
         for proposal in proposals:
-            text = (proposal["proposal"] + " " + proposal["reasoning"]).lower()
+            matches = _keyword_matcher.scan(proposal["proposal"] + " " + proposal["reasoning"])
             
-            for theme, keywords in technology_keywords.items():
-                if any(keyword in text for keyword in keywords):
-                    proposal_themes[theme].append(proposal["agent_name"])
+            for theme in matches.themes("proposal_themes"):
+                proposal_themes[theme].append(proposal["agent_name"])
         
         analysis["themes"] = [
             {"theme": theme, "agents": agents} 
@@ -67,55 +91,87 @@ class ProposalSynthesisLogic:
             if agents
         ]
         
+        # Nahezu identische Vorschläge mehrerer Agents
+        analysis["overlaps"] = [
+            {"agents": proposal["merged_agents"], "proposal": proposal["proposal"]}
+            for proposal in self.deduplicate_proposals(proposals)
+            if len(proposal["merged_agents"]) > 1
+        ]
+        
         return analysis
     
-    def cluster_similar_proposals(self, proposals: List[Dict[str, Any]]) -> List[ProposalCluster]:
+    def deduplicate_proposals(self, proposals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Clustert ähnliche Vorschläge basierend auf Technologie und Ansatz.
+        Fasst nahezu identische Vorschläge (Text und Begründung, MinHash/LSH) zusammen.
+        Der früheste Vorschlag einer Gruppe bleibt erhalten; `merged_agents` enthält
+        alle Agents der Gruppe in Einreichungsreihenfolge.
+        """
+        groups = self._duplicate_detector.duplicate_groups(
+            [proposal["proposal"] + " " + proposal["reasoning"] for proposal in proposals]
+        )
+        return [
+            {**proposals[group[0]], "merged_agents": [proposals[m]["agent_name"] for m in group]}
+            for group in groups
+        ]
+    
+    def cluster_similar_proposals(
+        self,
+        proposals: List[Dict[str, Any]],
+        distance_threshold: float = DEFAULT_CLUSTER_DISTANCE
+    ) -> List[ProposalCluster]:
+        """
+        Clustert ähnliche Vorschläge über TF-IDF-Vektoren und Cosinus-Distanz
+        (agglomerativ, Cluster werden bis `distance_threshold` zusammengeführt).
+        Nahezu identische Vorschläge werden vorher zusammengefasst, damit ihre
+        Begründung nur einmal in `merged_reasoning` landet.
         """
         if not proposals:
             return []
         
-        # Einfache Clustering-Logik basierend auf Schlüsselwörtern
-        clusters = {}
+        proposals = self.deduplicate_proposals(proposals)
+        texts = [proposal["proposal"] + " " + proposal["reasoning"] for proposal in proposals]
+        vectors = self._proposal_vectors(proposals)
+        labels = agglomerative_clusters(vectors, distance_threshold)
+        similarity = cosine_similarity(vectors)
         
-        for proposal in proposals:
-            text = (proposal["proposal"] + " " + proposal["reasoning"]).lower()
-            agent = proposal["agent_name"]
-            
-            # Bestimme primäres Thema
-            primary_theme = "general"
+        clusters = []
+        for label in range(labels.max() + 1):
+            members = np.flatnonzero(labels == label)
             
-            if any(word in text for word in ["react", "jsx", "typescript"]):
-                primary_theme = "react"
-            elif any(word in text for word in ["vue", "composition"]):
-                primary_theme = "vue"
-            elif any(word in text for word in ["vanilla", "plain", "native"]):
-                primary_theme = "vanilla"
-            elif any(word in text for word in ["performance", "speed", "optimize"]):
-                primary_theme = "performance"
+            # Repräsentativ ist der Vorschlag mit der größten Ähnlichkeit zum Rest des Clusters
+            representative = members[similarity[np.ix_(members, members)].sum(axis=1).argmax()]
+            ordered = [representative] + [m for m in members if m != representative]
             
-            if primary_theme not in clusters:
-                clusters[primary_theme] = ProposalCluster(
-                    theme=primary_theme,
-                    description="",
-                    contributing_agents=[],
-                    merged_reasoning="",
-                    representative_proposal=""
-                )
-            
-            cluster = clusters[primary_theme]
-            cluster.contributing_agents.append(agent)
-            
-            # Verwende den ersten Vorschlag als repräsentativen
-            if not cluster.representative_proposal:
-                cluster.representative_proposal = proposal["proposal"]
-                cluster.merged_reasoning = proposal["reasoning"]
-            else:
-                # Merge reasoning
-                cluster.merged_reasoning += f" | {agent}: {proposal['reasoning']}"
-        
-        return list(clusters.values())
+            cluster = ProposalCluster(
+                theme=self._cluster_theme(vectors, members, texts),
+                description="",
+                contributing_agents=[agent for m in members for agent in proposals[m]["merged_agents"]],
+                merged_reasoning=proposals[representative]["reasoning"],
+                representative_proposal=proposals[representative]["proposal"]
+            )
+            for m in ordered[1:]:
+                cluster.merged_reasoning += f" | {', '.join(proposals[m]['merged_agents'])}: {proposals[m]['reasoning']}"
+            clusters.append(cluster)
+        
+        return clusters
+    
+    def _proposal_vectors(self, proposals: List[Dict[str, Any]]):
+        """TF-IDF-Vektoren; der Vorschlag selbst zählt stärker als seine Begründung."""
+        return weighted_combination(
+            [self._vectorizer.transform([p["proposal"] for p in proposals]),
+             self._vectorizer.transform([p["reasoning"] for p in proposals])],
+            PROPOSAL_FIELD_WEIGHTS
+        )
+    
+    def _cluster_theme(self, vectors, members: np.ndarray, texts: List[str]) -> str:
+        """Bekanntes Taxonomie-Thema der Mehrheit des Clusters, sonst die stärksten Begriffe."""
+        themes = Counter(
+            _keyword_matcher.scan(texts[m]).first_theme("cluster_themes") for m in members
+        )
+        theme, count = themes.most_common(1)[0]
+        if theme and count * 2 > len(members):
+            return theme
+        return " ".join(top_terms(vectors, members, texts)) or "general"
     
     def generate_voting_options(self, clusters: List[ProposalCluster], max_options: int = 4) -> List[Dict[str, Any]]:
         """
@@ -170,6 +226,19 @@ class ProposalSynthesisLogic:
 # Globale Instanz der Synthesis-Logik
 _synthesis_logic = ProposalSynthesisLogic()
 
+# Analyse-Cache pro Entscheidung, invalidiert durch neue Vorschläge
+_analysis_cache = ProposalAnalysisCache(_democracy_engine)
+
+# Clustert Vorschläge bereits beim Eintreffen (PROPOSAL_ADDED)
+_online_clusterer = OnlineProposalClusterer(_democracy_engine)
+
+
+def cluster_decision_proposals(decision_id: str, proposals: List[Dict[str, Any]]) -> List[ProposalCluster]:
+    """Online-Cluster, wenn sie alle Vorschläge enthalten, sonst Batch-Clustering."""
+    if _online_clusterer.is_current(decision_id, len(proposals)):
+        return _online_clusterer.clusters(decision_id)
+    return _synthesis_logic.cluster_similar_proposals(proposals)
+
 # === CREWAI TOOLS ===
 
 class AnalyzeProposalsInput(BaseModel):
@@ -184,19 +253,21 @@ class AnalyzeProposalsTool(BaseTool):
     """
     args_schema: Type[BaseModel] = AnalyzeProposalsInput
     
+    @_engine_tool
     def _run(self, decision_id: str) -> str:
         if not _democracy_engine:
             return "TOOL_ERROR: Democracy engine not available"
         
-        status = _democracy_engine.get_decision_status(decision_id)
-        if not status:
+        view = load_decision_view(_democracy_engine, decision_id)
+        if not view:
             return f"TOOL_ERROR: Decision {decision_id} not found"
         
-        proposals = status.get("proposals", [])
-        if not proposals:
+        if not view.proposals:
             return f"TOOL_INFO: No proposals yet for decision {decision_id}"
         
-        analysis = _synthesis_logic.analyze_proposals(proposals)
+        analysis = _analysis_cache.get_or_compute(
+            view, "analysis", lambda: _synthesis_logic.analyze_proposals(view.proposal_dicts())
+        )
         
         return json.dumps({
             "decision_id": decision_id,
@@ -218,35 +289,43 @@ class SynthesizeOptionsTool(BaseTool):
     """
     args_schema: Type[BaseModel] = SynthesizeOptionsInput
     
+    @_engine_tool
     def _run(self, decision_id: str, max_options: int = 4) -> str:
         if not _democracy_engine:
             return "TOOL_ERROR: Democracy engine not available"
         
-        status = _democracy_engine.get_decision_status(decision_id)
-        if not status:
+        view = load_decision_view(_democracy_engine, decision_id)
+        if not view:
             return f"TOOL_ERROR: Decision {decision_id} not found"
         
-        if status.get("current_phase") != "idea_collection":
+        if view.current_phase != "idea_collection":
             return f"TOOL_ERROR: Decision {decision_id} is not in idea_collection phase"
         
-        proposals = status.get("proposals", [])
+        proposals = view.proposals
         if not proposals:
             return f"TOOL_ERROR: No proposals to synthesize for decision {decision_id}"
         
-        # Cluster proposals
-        clusters = _synthesis_logic.cluster_similar_proposals(proposals)
+        # Cluster proposals (online vorberechnet bzw. gecacht, solange sich die Vorschläge nicht ändern)
+        clusters = _analysis_cache.get_or_compute(
+            view, "clusters", lambda: cluster_decision_proposals(decision_id, view.proposal_dicts())
+        )
         
         # Generate voting options
         voting_options = _synthesis_logic.generate_voting_options(clusters, max_options)
         
+        # Bugfix: synthesize_options akzeptiert Optionen nur in der SYNTHESIS-Phase; der
+        # Wechsel stand früher erst danach, sodass das Tool immer fehlschlug. Compare-and-Set,
+        # damit ein gleichzeitiger Wechsel (z.B. durch den Phasen-Scheduler) nicht überschrieben wird
+        if not _democracy_engine.advance_phase(decision_id, VotingPhase.SYNTHESIS, from_phase=VotingPhase.IDEA_COLLECTION):
+            return f"TOOL_ERROR: Decision {decision_id} left the idea_collection phase during synthesis"
+        
         # Update the decision with synthesized options
         success = _democracy_engine.synthesize_options(decision_id, voting_options)
         
         if not success:
             return f"TOOL_ERROR: Could not update decision {decision_id} with synthesized options"
         
-        # Advance to synthesis phase, then to voting phase
-        _democracy_engine.advance_phase(decision_id, VotingPhase.SYNTHESIS)
+        # Advance to voting phase
         _democracy_engine.advance_phase(decision_id, VotingPhase.RANKED_VOTING)
         
         result = {
@@ -273,26 +352,36 @@ class FacilitateReflectionTool(BaseTool):
     """
     args_schema: Type[BaseModel] = FacilitateReflectionInput
     
+    @_engine_tool
     def _run(self, decision_id: str, reflection_prompt: str) -> str:
         if not _democracy_engine:
             return "TOOL_ERROR: Democracy engine not available"
         
-        status = _democracy_engine.get_decision_status(decision_id)
-        if not status:
+        view = load_decision_view(_democracy_engine, decision_id)
+        if not view:
             return f"TOOL_ERROR: Decision {decision_id} not found"
         
-        # Generiere kontextuelle Reflexionsfragen
-        context = status.get("context", "")
-        proposals = status.get("proposals", [])
-        current_phase = status.get("current_phase", "")
+        # Generiere kontextuelle Reflexionsfragen; die Phase gehört zum Cache-Schlüssel,
+        # weil Beobachtungen und Empfehlungen von ihr abhängen
+        current_phase = view.current_phase
+        
+        def reflect() -> Dict[str, Any]:
+            proposals = view.proposal_dicts()
+            # Kennzahlen hängen nur von den Vorschlägen ab, nicht von der Phase
+            metrics = _analysis_cache.get_or_compute(view, "metrics", lambda: compute_proposal_metrics(proposals))
+            return {
+                "meta_questions": self._generate_meta_questions(view.context, proposals),
+                "process_observations": self._analyze_process(proposals, metrics, current_phase),
+                "recommendations": self._generate_recommendations(proposals, metrics, current_phase)
+            }
         
+        reflection = _analysis_cache.get_or_compute(view, ("reflection", current_phase), reflect)
         reflection_analysis = {
             "decision_id": decision_id,
             "current_phase": current_phase,
             "reflection_prompt": reflection_prompt,
-            "meta_questions": self._generate_meta_questions(context, proposals),
-            "process_observations": self._analyze_process(proposals, current_phase),
-            "recommendations": self._generate_recommendations(proposals, current_phase)
+            **reflection,
+            "related_proposals": _synthesis_logic.related_proposals(reflection_prompt, view.proposal_dicts())
         }
         
         return json.dumps(reflection_analysis, indent=2, ensure_ascii=False)
@@ -305,10 +394,12 @@ class FacilitateReflectionTool(BaseTool):
             "Wie können die verschiedenen Perspektiven sich gegenseitig stärken?"
         ]
         
-        if "performance" in context.lower():
+        context_matches = _keyword_matcher.scan(context)
+        
+        if context_matches.has("reflection_topics", "performance"):
             questions.append("Balancieren wir Performance und Wartbarkeit angemessen?")
         
-        if "framework" in context.lower():
+        if context_matches.has("reflection_topics", "framework"):
             questions.append("Berücksichtigen wir die Lernkurve des Teams ausreichend?")
         
         if len(proposals) > 3:
@@ -316,13 +407,14 @@ class FacilitateReflectionTool(BaseTool):
         
         return questions
     
-    def _analyze_process(self, proposals: List[Dict], current_phase: str) -> Dict[str, Any]:
+    def _analyze_process(self, proposals: List[Dict], metrics: ProposalMetrics, current_phase: str) -> Dict[str, Any]:
         """Analysiert die Qualität des bisherigen Prozesses."""
         return {
             "participation_balance": self._assess_participation(proposals),
-            "reasoning_depth": self._assess_reasoning_quality(proposals),
-            "diversity_of_approaches": self._assess_diversity(proposals),
-            "phase_readiness": f"Process is in {current_phase} phase"
+            "reasoning_depth": self._assess_reasoning_quality(metrics),
+            "diversity_of_approaches": self._assess_diversity(metrics),
+            "phase_readiness": f"Process is in {current_phase} phase",
+            "metrics": metrics.to_dict()
         }
     
     def _assess_participation(self, proposals: List[Dict]) -> str:
@@ -340,39 +432,39 @@ class FacilitateReflectionTool(BaseTool):
         else:
             return "Limited participation - encourage more agents to contribute"
     
-    def _assess_reasoning_quality(self, proposals: List[Dict]) -> str:
-        """Bewertet die Qualität der Begründungen."""
-        if not proposals:
+    def _assess_reasoning_quality(self, metrics: ProposalMetrics) -> str:
+        """Bewertet die Qualität der Begründungen über verschiedene Begriffe statt Zeichenlänge."""
+        if not len(metrics.labels):
             return "No reasoning to assess yet"
         
-        avg_reasoning_length = sum(len(p.get("reasoning", "")) for p in proposals) / len(proposals)
+        # Begründungen, die nur den Vorschlag wiederholen, zählen nicht als Tiefe
+        median_terms = float(np.median(metrics.reasoning_terms))
+        restating = float((metrics.restatement >= RESTATEMENT_SIMILARITY).mean())
         
-        if avg_reasoning_length > 100:
+        if restating > 0.5:
+            return "Reasoning mostly restates the proposals"
+        elif median_terms >= 12:
             return "Rich, detailed reasoning provided"
-        elif avg_reasoning_length > 50:
+        elif median_terms >= 6:
             return "Adequate reasoning depth"
         else:
             return "Could benefit from more detailed reasoning"
     
-    def _assess_diversity(self, proposals: List[Dict]) -> str:
-        """Bewertet die Vielfalt der Ansätze."""
-        if len(proposals) < 2:
+    def _assess_diversity(self, metrics: ProposalMetrics) -> str:
+        """Bewertet die Vielfalt der Ansätze über Cluster-Entropie und mittlere Distanz."""
+        if len(metrics.labels) < 2:
             return "Need more proposals to assess diversity"
         
-        # Einfache Bewertung basierend auf unterschiedlichen Schlüsselwörtern
-        all_text = " ".join([p["proposal"] + " " + p.get("reasoning", "") for p in proposals]).lower()
-        
-        diversity_indicators = ["alternative", "different", "another approach", "however", "instead"]
-        diversity_score = sum(1 for indicator in diversity_indicators if indicator in all_text)
+        effective_clusters = metrics.effective_clusters
         
-        if diversity_score >= 3:
+        if effective_clusters >= 3 and metrics.mean_distance >= 0.6:
             return "High diversity of approaches"
-        elif diversity_score >= 1:
+        elif effective_clusters >= 2:
             return "Moderate diversity - good range of options"
         else:
             return "Similar approaches - could benefit from more diverse thinking"
     
-    def _generate_recommendations(self, proposals: List[Dict], current_phase: str) -> List[str]:
+    def _generate_recommendations(self, proposals: List[Dict], metrics: ProposalMetrics, current_phase: str) -> List[str]:
         """Generiert Empfehlungen für den weiteren Prozess."""
         recommendations = []
         
@@ -384,9 +476,11 @@ class FacilitateReflectionTool(BaseTool):
             recommendations.append("Look for opportunities to combine complementary approaches")
         
         if proposals:
-            reasoning_lengths = [len(p.get("reasoning", "")) for p in proposals]
-            if min(reasoning_lengths) < 30:
+            if metrics.reasoning_terms.min() < 4:
                 recommendations.append("Encourage more detailed reasoning for all proposals")
+            
+            if len(proposals) > 3 and metrics.effective_clusters < 2:
+                recommendations.append("Proposals converge on one approach - ask for a deliberate alternative")
         
         return recommendations
 
@@ -417,6 +511,12 @@ if __name__ == '__main__':
         }
     ]
     
+    test_proposals.append({
+        "agent_name": "Debugger",
+        "proposal": "React with TypeScript",
+        "reasoning": "Better tooling, type safety and our team already knows React well."
+    })
+    
     print("1. Testing proposal analysis...")
     analysis = _synthesis_logic.analyze_proposals(test_proposals)
     print(f"Analysis: {json.dumps(analysis, indent=2)}")
@@ -432,4 +532,55 @@ if __name__ == '__main__':
         print(f"Option {i+1}: {option['title']}")
         print(f"  Description: {option['description'][:100]}...")
     
+    print("\n4. Testing clustering beyond JS frameworks at scale...")
+    import random
+    import time
+    
+    rng = random.Random(7)
+    topics = [
+        ("Add an accessibility audit with screen reader checks", "Keyboard navigation and contrast matter for all users"),
+        ("Cache API responses in Redis", "Repeated queries slow down the backend"),
+        ("Use PostgreSQL with a normalized schema", "Relational data and transactions fit our domain"),
+        ("Write end-to-end tests with Playwright", "Catch regressions in user flows before release"),
+        ("React with TypeScript", "Type safety and a large ecosystem"),
+    ]
+    for count in (20, 200, 500):
+        synthetic = []
+        for i in range(count):
+            proposal, reasoning = topics[i % len(topics)]
+            extra = rng.choice(["quickly", "carefully", "soon", "first", "incrementally"])
+            synthetic.append({"agent_name": f"Agent_{i}", "proposal": f"{proposal} {extra}", "reasoning": reasoning})
+        start = time.perf_counter()
+        clusters = _synthesis_logic.cluster_similar_proposals(synthetic)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  {count:>4} proposals -> {len(clusters)} clusters in {elapsed:.1f} ms: "
+              f"{[c.theme for c in clusters]}")
+    
+    print("\n5. Testing the analysis cache with the live engine...")
+    from tools.team_voting_tool import ConflictType
+    
+    _democracy_engine.verbose = False
+    agents = [f"Agent_{i}" for i in range(200)]
+    decision_id = _democracy_engine.trigger_democratic_decision(
+        ConflictType.MANUAL_TRIGGER, "Cache test", "Framework performance", agents
+    )
+    _democracy_engine.advance_phase(decision_id, VotingPhase.IDEA_COLLECTION)
+    for i, agent in enumerate(agents[:-1]):
+        proposal, reasoning = topics[i % len(topics)]
+        _democracy_engine.add_agent_proposal(decision_id, agent, f"{proposal} ({i})", reasoning)
+    
+    for label in ("cold", "warm"):
+        start = time.perf_counter()
+        analyze_proposals_tool._run(decision_id)
+        facilitate_reflection_tool._run(decision_id, "What are we missing?")
+        print(f"  {label}: analysis + reflection in {(time.perf_counter() - start) * 1000:.1f} ms, "
+              f"cache {_analysis_cache.stats}")
+    
+    _democracy_engine.add_agent_proposal(decision_id, agents[-1], "Use Svelte instead", "Smaller bundles")
+    analysis = json.loads(analyze_proposals_tool._run(decision_id))["analysis"]
+    print(f"  after add_agent_proposal: {analysis['total_proposals']} proposals analyzed, cache {_analysis_cache.stats}")
+    
+    print(f"  online clusters current: {_online_clusterer.is_current(decision_id, len(agents))}")
+    print(f"  synthesize: {json.loads(synthesize_voting_options_tool._run(decision_id))['message']}")
+    
     print("\n=== Synthesis Tools Testing Complete ===")
\ No newline at end of file
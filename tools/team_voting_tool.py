@@ -1,12 +1,25 @@
 import json
+import os
+import sys
 import time
-from typing import Dict, List, Optional, Any, Type  # <-- FIXED: Added missing comma after Type
+import functools
+import itertools
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Any, Set, Tuple, Type  # <-- FIXED: Added missing comma after Type
 from enum import Enum
 from dataclasses import dataclass, asdict
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+from tools.decision_ids import new_ulid
+from tools.decision_event_log import DecisionEventLog, create_event_log_from_env
+from tools.decision_store import DecisionStore, create_decision_store_from_env
+from tools.decision_events import DECISION_FINALIZED, PHASE_CHANGED, DecisionEventBus, DecisionNotification
+from tools.engine_client import RemoteEngineError
+from tools.ranked_choice_tally import TALLY_METHODS, RunningTally, tally
+
 class VotingPhase(Enum):
     """Die 5 Phasen der demokratischen Entscheidungsfindung."""
     CONTEXT_LOADING = "context_loading"
@@ -23,7 +36,7 @@ class ConflictType(Enum):
     PERFORMANCE_TRADEOFF = "performance_tradeoff"
     MANUAL_TRIGGER = "manual_trigger"
 
-@dataclass
+@dataclass(slots=True)
 class AgentProposal:
     """Vorschlag eines Agents in der Ideensammlung."""
     agent_name: str
@@ -39,7 +52,16 @@ class AgentProposal:
             "timestamp": self.timestamp.isoformat()
         }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgentProposal":
+        return cls(
+            agent_name=sys.intern(data["agent_name"]),
+            proposal=data["proposal"],
+            reasoning=data["reasoning"],
+            timestamp=datetime.fromisoformat(data["timestamp"])
+        )
+
+@dataclass(slots=True)
 class VotingOption:
     """Eine synthetisierte Wahlmöglichkeit."""
     option_id: str
@@ -50,7 +72,16 @@ class VotingOption:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VotingOption":
+        return cls(
+            option_id=data["option_id"],
+            title=data["title"],
+            description=data["description"],
+            source_proposals=[sys.intern(name) for name in data.get("source_proposals", [])]
+        )
+
+@dataclass(slots=True)
 class AgentVote:
     """Stimmabgabe eines Agents."""
     agent_name: str
@@ -66,7 +97,16 @@ class AgentVote:
             "timestamp": self.timestamp.isoformat()
         }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgentVote":
+        return cls(
+            agent_name=sys.intern(data["agent_name"]),
+            ranked_options=[sys.intern(option_id) for option_id in data["ranked_options"]],
+            reasoning_for_top_choice=data["reasoning_for_top_choice"],
+            timestamp=datetime.fromisoformat(data["timestamp"])
+        )
+
+@dataclass(slots=True)
 class DemocraticDecision:
     """Vollständige demokratische Entscheidung mit allen Phasen."""
     decision_id: str
@@ -90,6 +130,19 @@ class DemocraticDecision:
     current_phase: VotingPhase
     participating_agents: List[str]
     
+    # Runden-Aufschlüsselung der letzten Auszählung
+    tally_result: Optional[Dict[str, Any]] = None
+    
+    # Gesetzt, sobald ausstehende Stimmen den Sieger nicht mehr ändern können; gilt für das
+    # Verfahren der letzten Auszählung (tally_result["method"]), vorher für das der Engine
+    locked_option_id: str = ""
+    
+    # Projekt, in dessen Kontext die Entscheidung ausgelöst wurde
+    project_id: str = ""
+    
+    # Wird bei jedem Event auf dieser Entscheidung erhöht (Basis für Delta-Abfragen)
+    version: int = 0
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "decision_id": self.decision_id,
@@ -105,25 +158,170 @@ class DemocraticDecision:
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "current_phase": self.current_phase.value,
-            "participating_agents": self.participating_agents
+            "participating_agents": self.participating_agents,
+            "tally_result": self.tally_result,
+            "outcome_locked": bool(self.locked_option_id),
+            "locked_option_id": self.locked_option_id,
+            "project_id": self.project_id,
+            "version": self.version
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DemocraticDecision":
+        return cls(
+            decision_id=data["decision_id"],
+            conflict_type=ConflictType(data["conflict_type"]),
+            trigger_reason=data["trigger_reason"],
+            context=data["context"],
+            proposals=[AgentProposal.from_dict(p) for p in data.get("proposals", [])],
+            voting_options=[VotingOption.from_dict(vo) for vo in data.get("voting_options", [])],
+            votes=[AgentVote.from_dict(v) for v in data.get("votes", [])],
+            winning_option_id=data.get("winning_option_id", ""),
+            winning_option=VotingOption.from_dict(data["winning_option"]) if data.get("winning_option") else None,
+            final_decision=data.get("final_decision", ""),
+            start_time=datetime.fromisoformat(data["start_time"]),
+            end_time=datetime.fromisoformat(data["end_time"]) if data.get("end_time") else None,
+            current_phase=VotingPhase(data["current_phase"]),
+            participating_agents=[sys.intern(name) for name in data.get("participating_agents", [])],
+            tally_result=data.get("tally_result"),
+            locked_option_id=data.get("locked_option_id", ""),
+            project_id=data.get("project_id", ""),
+            version=data.get("version", 0)
+        )
+
+# Reihenfolge der Phasen, um "erreicht oder überschritten" zu prüfen
+_PHASE_ORDER = {phase.value: index for index, phase in enumerate(VotingPhase)}
+
+# Höchstens so viele Änderungen je aktiver Entscheidung für Deltas vorhalten; wer weiter
+# zurückliegt, bekommt den vollen Status
+CHANGE_LOG_LENGTH = int(os.getenv("DEMOCRACY_CHANGE_LOG_LENGTH", "256"))
+
+# Abgekürzte Schlüssel für das kompakte Ausgabeformat des Get Decision Status Tools
+COMPACT_KEYS = {
+    "decision_id": "id",
+    "conflict_type": "ct",
+    "trigger_reason": "tr",
+    "context": "cx",
+    "proposals": "p",
+    "voting_options": "o",
+    "votes": "v",
+    "winning_option_id": "w",
+    "winning_option": "wo",
+    "final_decision": "fd",
+    "start_time": "st",
+    "end_time": "et",
+    "current_phase": "ph",
+    "participating_agents": "pa",
+    "tally_result": "tl",
+    "outcome_locked": "lk",
+    "locked_option_id": "lo",
+    "project_id": "pj",
+    "version": "ver",
+    "since_version": "since",
+    "changes": "ch",
+    "event": "e",
+    "agent_name": "a",
+    "proposal": "pr",
+    "reasoning": "r",
+    "reasoning_for_top_choice": "r",
+    "timestamp": "ts",
+    "option_id": "oid",
+    "title": "t",
+    "description": "d",
+    "source_proposals": "sp",
+    "ranked_options": "ro",
+    "live_standings": "ls",
+    "first_preferences": "fp",
+    "borda_scores": "bs",
+    "copeland_scores": "cs",
+    "condorcet_winner": "cw",
+    "margins": "m",
+}
+
+def _abbreviate_keys(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {COMPACT_KEYS.get(key, key): _abbreviate_keys(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_abbreviate_keys(item) for item in value]
+    return value
+
+def encode_decision_status(data: Dict[str, Any], compact: bool = False) -> str:
+    """Serialisiert Status oder Delta; kompakt = ohne Einrückung und mit abgekürzten Schlüsseln."""
+    if compact:
+        return json.dumps(_abbreviate_keys(data), separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+def _with_decision_lock(method):
+    """
+    Führt eine Engine-Methode unter dem Lock der betroffenen Entscheidung aus,
+    sodass Prüfung und Mutation atomar sind.
+    """
+    @functools.wraps(method)
+    def wrapper(self, decision_id: str, *args, **kwargs):
+        while True:
+            lock = self._decision_locks.get(decision_id)
+            if lock is None:
+                # Unbekannte oder bereits abgeschlossene Entscheidung: unter dem State-Lock
+                # ausführen, damit sie nicht zwischen Prüfung und Aufruf erscheinen kann
+                with self._state_lock:
+                    if decision_id not in self._decision_locks:
+                        return method(self, decision_id, *args, **kwargs)
+                continue
+            with lock:
+                return method(self, decision_id, *args, **kwargs)
+    return wrapper
+
 class DemocraticVotingLogic:
     """Core-Logik für demokratische Entscheidungsfindung."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        event_log: Optional[DecisionEventLog] = None,
+        store: Optional[DecisionStore] = None,
+        verbose: bool = True,
+        tally_method: Optional[str] = None
+    ):
         self.active_decisions: Dict[str, DemocraticDecision] = {}
-        self.completed_decisions: List[DemocraticDecision] = []
+        self.verbose = verbose
+        
+        # Standard-Auszählverfahren (gewichtete Rangliste = Borda, siehe todo.txt)
+        self.tally_method = tally_method or os.getenv("DEMOCRACY_TALLY_METHOD", "borda")
+        if self.tally_method not in TALLY_METHODS:
+            raise ValueError(f"Unknown tally method '{self.tally_method}'. Valid methods: {list(TALLY_METHODS)}")
+        
+        # Ein Lock pro aktiver Entscheidung; der State-Lock schützt nur die kurze
+        # Anwendung eines Events auf Dicts, Store und Event-Log
+        self._decision_locks: Dict[str, threading.RLock] = {}
+        self._state_lock = threading.RLock()
+        
+        # Laufende paarweise Auszählung pro Entscheidung, aktualisiert bei jeder Stimme
+        self._running_tallies: Dict[str, RunningTally] = {}
+        
+        # Die letzten CHANGE_LOG_LENGTH Änderungen pro aktiver Entscheidung: (version, event_type, data)
+        self._change_logs: Dict[str, Deque[Tuple[int, str, Dict[str, Any]]]] = {}
+        
+        # Austauschbares Speicher-Backend für Phasen-Index und abgeschlossene Entscheidungen
+        self.store = store if store is not None else create_decision_store_from_env()
+        
+        # Pub/Sub für Phasenwechsel und andere Events, damit Orchestratoren nicht pollen müssen
+        self.events = DecisionEventBus()
+        
+        # Optionales append-only Event-Log für Crash-Recovery
+        self.event_log = event_log
+        if self.event_log is not None:
+            self._restore_from_event_log()
         
     def trigger_democratic_decision(
         self, 
         conflict_type: ConflictType,
         trigger_reason: str,
         context: str,
-        participating_agents: List[str]
+        participating_agents: List[str],
+        project_id: str = ""
     ) -> str:
         """Startet eine neue demokratische Entscheidung."""
-        decision_id = f"decision_{int(time.time())}_{conflict_type.value}"
+        # ULID: zeitlich sortierbar und auch bei mehreren Auslösungen pro Millisekunde eindeutig
+        decision_id = f"decision_{new_ulid()}_{conflict_type.value}"
         
         decision = DemocraticDecision(
             decision_id=decision_id,
@@ -139,13 +337,16 @@ class DemocraticVotingLogic:
             start_time=datetime.now(),
             end_time=None,
             current_phase=VotingPhase.CONTEXT_LOADING,
-            participating_agents=participating_agents
+            participating_agents=participating_agents,
+            project_id=project_id,
+            version=1
         )
         
-        self.active_decisions[decision_id] = decision
-        print(f"--- Democracy Engine: New decision triggered - {decision_id} ---")
+        self._apply_event("decision_triggered", {"decision": decision.to_dict()})
+        self._log(f"--- Democracy Engine: New decision triggered - {decision_id} ---")
         return decision_id
     
+    @_with_decision_lock
     def add_agent_proposal(
         self, 
         decision_id: str, 
@@ -161,14 +362,45 @@ class DemocraticVotingLogic:
         if decision.current_phase != VotingPhase.IDEA_COLLECTION:
             return False
             
-        if agent_name not in decision.participating_agents:
+        # Nur ein Vorschlag pro Agent
+        proposed_agents = {p.agent_name for p in decision.proposals}
+        if self._proposal_rejection(decision, agent_name, proposed_agents):
             return False
             
-        # Prüfe, ob Agent bereits einen Vorschlag gemacht hat
-        existing_proposal = next((p for p in decision.proposals if p.agent_name == agent_name), None)
-        if existing_proposal:
-            return False  # Nur ein Vorschlag pro Agent
-            
+        self._record_proposal(decision_id, agent_name, proposal, reasoning)
+        return True
+    
+    @_with_decision_lock
+    def add_agent_proposals_bulk(self, decision_id: str, proposals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fügt mehrere Vorschläge in einem Durchlauf hinzu.
+        Jeder Eintrag braucht 'agent_name', 'proposal' und 'reasoning'; pro Eintrag wird
+        {"agent_name", "success", "error"} zurückgegeben.
+        """
+        decision = self.active_decisions.get(decision_id)
+        batch_error = self._batch_rejection(decision, decision_id, VotingPhase.IDEA_COLLECTION)
+        proposed_agents = {p.agent_name for p in decision.proposals} if not batch_error else set()
+        
+        results = []
+        for item in proposals:
+            agent_name = item.get("agent_name", "")
+            error = batch_error or self._missing_fields(item, ("agent_name", "proposal", "reasoning"))
+            error = error or self._proposal_rejection(decision, agent_name, proposed_agents)
+            if not error:
+                self._record_proposal(decision_id, agent_name, item["proposal"], item["reasoning"])
+                proposed_agents.add(agent_name)
+            results.append({"agent_name": agent_name, "success": not error, "error": error or None})
+        return results
+    
+    @staticmethod
+    def _proposal_rejection(decision: DemocraticDecision, agent_name: str, proposed_agents: Set[str]) -> str:
+        if agent_name not in decision.participating_agents:
+            return f"Agent {agent_name} is not participating in decision {decision.decision_id}"
+        if agent_name in proposed_agents:
+            return f"Agent {agent_name} has already submitted a proposal for decision {decision.decision_id}"
+        return ""
+    
+    def _record_proposal(self, decision_id: str, agent_name: str, proposal: str, reasoning: str) -> None:
         agent_proposal = AgentProposal(
             agent_name=agent_name,
             proposal=proposal,
@@ -176,10 +408,10 @@ class DemocraticVotingLogic:
             timestamp=datetime.now()
         )
         
-        decision.proposals.append(agent_proposal)
-        print(f"--- Democracy Engine: Proposal added by {agent_name} for {decision_id} ---")
-        return True
+        self._apply_event("proposal_added", {"decision_id": decision_id, "proposal": agent_proposal.to_dict()})
+        self._log(f"--- Democracy Engine: Proposal added by {agent_name} for {decision_id} ---")
     
+    @_with_decision_lock
     def synthesize_options(self, decision_id: str, synthesized_options: List[Dict[str, Any]]) -> bool:
         """Synthetisiert Vorschläge zu konkreten Wahlmöglichkeiten."""
         if decision_id not in self.active_decisions:
@@ -189,7 +421,7 @@ class DemocraticVotingLogic:
         if decision.current_phase != VotingPhase.SYNTHESIS:
             return False
             
-        decision.voting_options = []
+        voting_options = []
         for i, option_data in enumerate(synthesized_options):
             option = VotingOption(
                 option_id=f"option_{i+1}",
@@ -197,11 +429,16 @@ class DemocraticVotingLogic:
                 description=option_data.get("description", ""),
                 source_proposals=option_data.get("source_proposals", [])
             )
-            decision.voting_options.append(option)
+            voting_options.append(option)
             
-        print(f"--- Democracy Engine: {len(decision.voting_options)} options synthesized for {decision_id} ---")
+        self._apply_event("options_synthesized", {
+            "decision_id": decision_id,
+            "voting_options": [option.to_dict() for option in voting_options]
+        })
+        self._log(f"--- Democracy Engine: {len(decision.voting_options)} options synthesized for {decision_id} ---")
         return True
     
+    @_with_decision_lock
     def submit_agent_vote(
         self, 
         decision_id: str, 
@@ -217,19 +454,65 @@ class DemocraticVotingLogic:
         if decision.current_phase != VotingPhase.RANKED_VOTING:
             return False
             
-        if agent_name not in decision.participating_agents:
-            return False
-            
-        # Prüfe, ob Agent bereits abgestimmt hat
-        existing_vote = next((v for v in decision.votes if v.agent_name == agent_name), None)
-        if existing_vote:
-            return False
-            
-        # Validiere, dass alle Option-IDs existieren
-        valid_option_ids = [opt.option_id for opt in decision.voting_options]
-        if not all(opt_id in valid_option_ids for opt_id in ranked_option_ids):
+        voted_agents = {v.agent_name for v in decision.votes}
+        valid_option_ids = {opt.option_id for opt in decision.voting_options}
+        if self._vote_rejection(decision, agent_name, ranked_option_ids, voted_agents, valid_option_ids):
             return False
             
+        self._record_vote(decision, agent_name, ranked_option_ids, reasoning)
+        return True
+    
+    @_with_decision_lock
+    def submit_agent_votes_bulk(self, decision_id: str, ballots: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Gibt mehrere Stimmzettel in einem Durchlauf ab.
+        Jeder Eintrag braucht 'agent_name', 'ranked_option_ids' und 'reasoning'; pro Eintrag
+        wird {"agent_name", "success", "error"} zurückgegeben.
+        """
+        decision = self.active_decisions.get(decision_id)
+        batch_error = self._batch_rejection(decision, decision_id, VotingPhase.RANKED_VOTING)
+        voted_agents: Set[str] = set()
+        valid_option_ids: Set[str] = set()
+        if not batch_error:
+            voted_agents = {v.agent_name for v in decision.votes}
+            valid_option_ids = {opt.option_id for opt in decision.voting_options}
+        
+        results = []
+        for item in ballots:
+            agent_name = item.get("agent_name", "")
+            error = batch_error or self._missing_fields(item, ("agent_name", "ranked_option_ids", "reasoning"))
+            error = error or self._vote_rejection(
+                decision, agent_name, item["ranked_option_ids"], voted_agents, valid_option_ids
+            )
+            if not error:
+                self._record_vote(decision, agent_name, list(item["ranked_option_ids"]), item["reasoning"])
+                voted_agents.add(agent_name)
+            results.append({"agent_name": agent_name, "success": not error, "error": error or None})
+        return results
+    
+    @staticmethod
+    def _vote_rejection(
+        decision: DemocraticDecision,
+        agent_name: str,
+        ranked_option_ids: List[str],
+        voted_agents: Set[str],
+        valid_option_ids: Set[str]
+    ) -> str:
+        if agent_name not in decision.participating_agents:
+            return f"Agent {agent_name} is not participating in decision {decision.decision_id}"
+        if agent_name in voted_agents:
+            return f"Agent {agent_name} has already voted in decision {decision.decision_id}"
+        if not ranked_option_ids:
+            return "Ranking must contain at least one option ID"
+        if len(set(ranked_option_ids)) != len(ranked_option_ids):
+            return f"Ranking contains duplicate option IDs: {list(ranked_option_ids)}"
+        unknown_option_ids = set(ranked_option_ids) - valid_option_ids
+        if unknown_option_ids:
+            return f"Unknown option IDs {sorted(unknown_option_ids)}. Valid IDs: {sorted(valid_option_ids)}"
+        return ""
+    
+    def _record_vote(self, decision: DemocraticDecision, agent_name: str, ranked_option_ids: List[str], reasoning: str) -> None:
+        decision_id = decision.decision_id
         vote = AgentVote(
             agent_name=agent_name,
             ranked_options=ranked_option_ids,
@@ -237,12 +520,56 @@ class DemocraticVotingLogic:
             timestamp=datetime.now()
         )
         
-        decision.votes.append(vote)
-        print(f"--- Democracy Engine: Vote submitted by {agent_name} for {decision_id} ---")
-        return True
+        self._apply_event("vote_submitted", {"decision_id": decision_id, "vote": vote.to_dict()})
+        self._log(f"--- Democracy Engine: Vote submitted by {agent_name} for {decision_id} ---")
+        if decision.locked_option_id and len(decision.votes) < len(set(decision.participating_agents)):
+            self._log(f"--- Democracy Engine: {decision_id} is mathematically decided for "
+                      f"{decision.locked_option_id}; remaining votes can be skipped ---")
+    
+    @staticmethod
+    def _batch_rejection(decision: Optional[DemocraticDecision], decision_id: str, expected_phase: VotingPhase) -> str:
+        """Fehler, der für alle Einträge eines Batches gilt (oder leerer String)."""
+        if decision is None:
+            return f"Decision {decision_id} not found"
+        if decision.current_phase != expected_phase:
+            return f"Decision {decision_id} is in phase '{decision.current_phase.value}', expected '{expected_phase.value}'"
+        return ""
+    
+    @staticmethod
+    def _missing_fields(item: Dict[str, Any], required: Tuple[str, ...]) -> str:
+        missing = [field for field in required if field not in item]
+        return f"Missing fields: {', '.join(missing)}" if missing else ""
     
-    def calculate_ranked_choice_winner(self, decision_id: str) -> Optional[str]:
-        """Berechnet Gewinner mit Ranked Choice Voting."""
+    @_with_decision_lock
+    def is_outcome_locked(self, decision_id: str, method: Optional[str] = None) -> bool:
+        """
+        True, wenn keine Kombination ausstehender Stimmen den Sieger nach `method`
+        (Standard: das Verfahren, für das `locked_option_id` gilt) noch ändern kann.
+        """
+        decision = self.active_decisions.get(decision_id)
+        if not decision:
+            return False
+        if method is None or method == self._lock_method(decision):
+            return bool(decision.locked_option_id)
+        running_tally = self._running_tallies.get(decision_id)
+        remaining_ballots = len(set(decision.participating_agents)) - len(decision.votes)
+        return bool(running_tally and running_tally.locked_winner(remaining_ballots, method))
+    
+    @_with_decision_lock
+    def get_pending_voters(self, decision_id: str) -> List[str]:
+        """Teilnehmende Agents, die noch nicht abgestimmt haben."""
+        decision = self.active_decisions.get(decision_id)
+        if not decision:
+            return []
+        voted = {vote.agent_name for vote in decision.votes}
+        return [agent for agent in decision.participating_agents if agent not in voted]
+    
+    @_with_decision_lock
+    def calculate_ranked_choice_winner(self, decision_id: str, method: Optional[str] = None) -> Optional[str]:
+        """
+        Berechnet Gewinner mit Ranked Choice Voting.
+        Unterstützt 'irv', 'schulze', 'borda' und 'copeland' (Standard: self.tally_method).
+        """
         if decision_id not in self.active_decisions:
             return None
             
@@ -250,64 +577,394 @@ class DemocraticVotingLogic:
         if not decision.votes or not decision.voting_options:
             return None
             
-        # Einfache Implementierung: Erste Wahl zählt am meisten
-        option_scores = {opt.option_id: 0 for opt in decision.voting_options}
-        
-        for vote in decision.votes:
-            if vote.ranked_options:
-                # Erste Wahl: 3 Punkte, Zweite: 2 Punkte, Dritte: 1 Punkt
-                for i, option_id in enumerate(vote.ranked_options[:3]):
-                    points = 3 - i
-                    option_scores[option_id] += points
-                    
-        # Finde Option mit höchster Punktzahl
-        winning_option_id = max(option_scores.items(), key=lambda x: x[1])[0]
-        decision.winning_option_id = winning_option_id
-        decision.winning_option = next(opt for opt in decision.voting_options if opt.option_id == winning_option_id)
-        
-        print(f"--- Democracy Engine: Winner calculated for {decision_id}: {winning_option_id} ---")
+        result = tally(
+            [vote.ranked_options for vote in decision.votes],
+            [opt.option_id for opt in decision.voting_options],
+            method or self.tally_method
+        )
+        winning_option_id = result.winner
+        self._apply_event("winner_calculated", {
+            "decision_id": decision_id,
+            "winning_option_id": winning_option_id,
+            "tally_result": result.to_dict()
+        })
+        
+        self._log(f"--- Democracy Engine: Winner calculated for {decision_id} ({result.method}): {winning_option_id} ---")
         return winning_option_id
     
+    @_with_decision_lock
     def finalize_decision(self, decision_id: str, final_decision_text: str) -> bool:
         """Finalisiert die Entscheidung und verschiebt sie zu completed."""
         if decision_id not in self.active_decisions:
             return False
             
-        decision = self.active_decisions[decision_id]
-        decision.final_decision = final_decision_text
-        decision.end_time = datetime.now()
-        decision.current_phase = VotingPhase.COMMITMENT
-        
-        # Verschiebe zu completed decisions
-        self.completed_decisions.append(decision)
-        del self.active_decisions[decision_id]
+        self._apply_event("decision_finalized", {
+            "decision_id": decision_id,
+            "final_decision": final_decision_text,
+            "end_time": datetime.now().isoformat()
+        })
         
-        print(f"--- Democracy Engine: Decision {decision_id} finalized and committed ---")
+        self._log(f"--- Democracy Engine: Decision {decision_id} finalized and committed ---")
         return True
     
+    @property
+    def completed_decisions(self) -> List[DemocraticDecision]:
+        """Alle abgeschlossenen Entscheidungen aus dem Store (in Abschluss-Reihenfolge)."""
+        with self._state_lock:
+            return [DemocraticDecision.from_dict(data) for data in self.store.iter_completed()]
+    
+    @_with_decision_lock
+    def get_live_standings(self, decision_id: str) -> Optional[Dict[str, Any]]:
+        """Aktuelle Standings einer laufenden Abstimmung ohne Neuauszählung."""
+        running_tally = self._running_tallies.get(decision_id)
+        return running_tally.standings if running_tally else None
+    
+    def _active_status(self, decision_id: str) -> Dict[str, Any]:
+        status = self.active_decisions[decision_id].to_dict()
+        running_tally = self._running_tallies.get(decision_id)
+        if running_tally is not None:
+            status["live_standings"] = running_tally.standings
+        return status
+    
+    @_with_decision_lock
+    def get_active_decision(self, decision_id: str) -> Optional[DemocraticDecision]:
+        """
+        Live-Objekt einer laufenden Entscheidung ohne `to_dict()`, z.B. für Analysen im
+        selben Prozess. Nur lesen: Änderungen laufen ausschließlich über die Engine-Methoden.
+        """
+        return self.active_decisions.get(decision_id)
+    
+    @_with_decision_lock
     def get_decision_status(self, decision_id: str) -> Optional[Dict[str, Any]]:
         """Gibt Status einer Entscheidung zurück."""
         if decision_id in self.active_decisions:
-            return self.active_decisions[decision_id].to_dict()
+            return self._active_status(decision_id)
+        
+        # Abgeschlossene Entscheidungen per Index-Lookup aus dem Store
+        return self.store.get(decision_id)
+    
+    @_with_decision_lock
+    def get_decision_status_json(self, decision_id: str) -> Optional[str]:
+        """Gibt den Status als JSON zurück; für abgeschlossene Entscheidungen ohne Neu-Serialisierung."""
+        if decision_id in self.active_decisions:
+            return json.dumps(self._active_status(decision_id), indent=2, ensure_ascii=False)
         
-        completed = next((d for d in self.completed_decisions if d.decision_id == decision_id), None)
-        if completed:
-            return completed.to_dict()
+        return self.store.get_json(decision_id)
+    
+    @_with_decision_lock
+    def get_decision_delta(self, decision_id: str, since_version: int) -> Optional[Dict[str, Any]]:
+        """
+        Gibt nur die Änderungen seit `since_version` zurück. Ist die Historie dafür nicht
+        (mehr) verfügbar, z.B. bei abgeschlossenen Entscheidungen, wird der volle Status
+        mit "full": true geliefert.
+        """
+        if decision_id in self.active_decisions:
+            decision = self.active_decisions[decision_id]
+            changes = self._change_logs.get(decision_id, [])
             
-        return None
+            if since_version >= decision.version:
+                return {"decision_id": decision_id, "version": decision.version, "since_version": since_version, "changes": []}
+            
+            if changes and changes[0][0] <= since_version + 1:
+                # Versionen sind lückenlos aufsteigend, daher direkter Slice statt Suche
+                first_index = max(0, since_version + 1 - changes[0][0])
+                delta = {
+                    "decision_id": decision_id,
+                    "version": decision.version,
+                    "since_version": since_version,
+                    "current_phase": decision.current_phase.value,
+                    "changes": [
+                        {"version": version, "event": event_type,
+                         **{key: value for key, value in data.items() if key != "decision_id"}}
+                        for version, event_type, data in itertools.islice(changes, first_index, None)
+                    ]
+                }
+                running_tally = self._running_tallies.get(decision_id)
+                if running_tally is not None:
+                    delta["live_standings"] = running_tally.standings
+                return delta
+            
+            return {"full": True, **self._active_status(decision_id)}
+        
+        status = self.store.get(decision_id)
+        if status is None:
+            return None
+        if since_version >= status.get("version", 0):
+            return {"decision_id": decision_id, "version": status.get("version", 0), "since_version": since_version, "changes": []}
+        return {"full": True, **status}
+    
+    def find_decisions_by_project(self, project_id: str, conflict_type: Optional[ConflictType] = None) -> List[str]:
+        """Alle Entscheidungen eines Projekts (optional eines Konflikttyps) in Auslöse-Reihenfolge."""
+        # Der Store indiziert das Projekt; ULID-IDs sortieren in Auslöse-Reihenfolge. Wie bei
+        # find_decisions unter dem State-Lock, da der In-Memory-Store selbst nicht sperrt
+        with self._state_lock:
+            return self.store.find(
+                conflict_type=conflict_type.value if conflict_type is not None else None,
+                project_id=project_id
+            )
+    
+    def find_decisions(
+        self,
+        phase: Optional[VotingPhase] = None,
+        conflict_type: Optional[ConflictType] = None,
+        participant: Optional[str] = None
+    ) -> List[str]:
+        """Sucht Entscheidungs-IDs über die Indizes des Stores."""
+        with self._state_lock:
+            return self.store.find(
+                phase=phase.value if phase else None,
+                conflict_type=conflict_type.value if conflict_type else None,
+                participant=participant
+            )
+    
+    def has_reached_phase(self, decision_id: str, phase: VotingPhase) -> bool:
+        """True, wenn die Entscheidung `phase` erreicht oder überschritten hat (abgeschlossen zählt immer)."""
+        decision = self.active_decisions.get(decision_id)
+        if decision is None:
+            return self.store.get(decision_id) is not None
+        return _PHASE_ORDER[decision.current_phase.value] >= _PHASE_ORDER[phase.value]
+    
+    def wait_for_phase(self, decision_id: str, phase: VotingPhase, timeout: Optional[float] = None) -> bool:
+        """
+        Blockiert ohne Polling, bis die Entscheidung `phase` erreicht hat.
+        Gibt False zurück, wenn `timeout` abläuft oder die Entscheidung unbekannt ist.
+        """
+        reached = threading.Event()
+        
+        def on_notification(notification: DecisionNotification) -> None:
+            if notification.topic == DECISION_FINALIZED or _PHASE_ORDER[notification.phase] >= _PHASE_ORDER[phase.value]:
+                reached.set()
+        
+        # Erst abonnieren, dann prüfen - sonst ginge ein Wechsel dazwischen verloren
+        subscription_id = self.events.subscribe(
+            on_notification, topics=(PHASE_CHANGED, DECISION_FINALIZED), decision_id=decision_id
+        )
+        try:
+            return self.has_reached_phase(decision_id, phase) or reached.wait(timeout)
+        finally:
+            self.events.unsubscribe(subscription_id)
     
-    def advance_phase(self, decision_id: str, new_phase: VotingPhase) -> bool:
-        """Wechselt zur nächsten Phase."""
+    @_with_decision_lock
+    def advance_phase(self, decision_id: str, new_phase: VotingPhase, from_phase: Optional[VotingPhase] = None) -> bool:
+        """
+        Wechselt zur nächsten Phase. Mit `from_phase` nur, wenn die Entscheidung noch in
+        dieser Phase ist (Compare-and-Set unter dem Entscheidungs-Lock), damit ein
+        gleichzeitiger Wechsel durch ein anderes Tool nicht überschrieben wird.
+        """
         if decision_id not in self.active_decisions:
             return False
+        if from_phase is not None and self.active_decisions[decision_id].current_phase != from_phase:
+            return False
             
-        decision = self.active_decisions[decision_id]
-        decision.current_phase = new_phase
-        print(f"--- Democracy Engine: {decision_id} advanced to phase {new_phase.value} ---")
+        self._apply_event("phase_advanced", {"decision_id": decision_id, "phase": new_phase.value})
+        self._log(f"--- Democracy Engine: {decision_id} advanced to phase {new_phase.value} ---")
         return True
+    
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(message)
+    
+    # === EVENT SOURCING ===
+    
+    def _apply_event(self, event_type: str, data: Dict[str, Any]) -> None:
+        """
+        Wendet ein Event auf den Zustand an und schreibt es ins Event-Log.
+        Alle Mutationen der Engine laufen über diese Methode, damit ein Replay
+        des Logs exakt denselben Zustand rekonstruiert.
+        """
+        # Anwendung und Log-Eintrag unter einem Lock, damit Snapshots konsistent
+        # zur Sequenznummer sind
+        with self._state_lock:
+            decision_id = data["decision"]["decision_id"] if event_type == "decision_triggered" else data["decision_id"]
+            # Referenz behalten: nach der Finalisierung ist die Entscheidung nicht mehr aktiv
+            decision = self.active_decisions.get(decision_id)
+            self._dispatch_event(event_type, data)
+            
+            if self.event_log is not None:
+                self.event_log.append(event_type, data)
+                if self.event_log.should_snapshot():
+                    self.event_log.write_snapshot(self._snapshot_state())
+            
+            notification = None
+            if self.events.has_subscribers:
+                notification = self._notification(event_type, self.active_decisions.get(decision_id, decision), data)
+        
+        # Außerhalb des State-Locks veröffentlichen, aber noch unter dem Entscheidungs-Lock,
+        # damit Abonnenten die Events einer Entscheidung in Reihenfolge erhalten
+        if notification is not None:
+            self.events.publish(notification)
+    
+    @staticmethod
+    def _notification(event_type: str, decision: DemocraticDecision, data: Dict[str, Any]) -> DecisionNotification:
+        return DecisionNotification(
+            topic=PHASE_CHANGED if event_type == "phase_advanced" else event_type,
+            decision_id=decision.decision_id,
+            project_id=decision.project_id,
+            phase=decision.current_phase.value,
+            version=decision.version,
+            data={key: value for key, value in data.items() if key != "decision_id"}
+        )
+    
+    def _dispatch_event(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Führt den Handler aus und pflegt Version und Änderungshistorie der Entscheidung."""
+        if event_type == "decision_triggered":
+            self._EVENT_HANDLERS[event_type](self, data)
+            decision_id = data["decision"]["decision_id"]
+            self._change_logs[decision_id] = deque([(self.active_decisions[decision_id].version, event_type, data)],
+                                                   maxlen=CHANGE_LOG_LENGTH)
+            return
+        
+        decision = self.active_decisions[data["decision_id"]]
+        decision.version += 1
+        self._change_logs[decision.decision_id].append((decision.version, event_type, data))
+        self._EVENT_HANDLERS[event_type](self, data)
+    
+    def _on_decision_triggered(self, data: Dict[str, Any]) -> None:
+        decision = DemocraticDecision.from_dict(data["decision"])
+        self._decision_locks[decision.decision_id] = threading.RLock()
+        self.active_decisions[decision.decision_id] = decision
+        self.store.save(data["decision"])
+    
+    def _on_proposal_added(self, data: Dict[str, Any]) -> None:
+        decision = self.active_decisions[data["decision_id"]]
+        decision.proposals.append(AgentProposal.from_dict(data["proposal"]))
+    
+    def _on_options_synthesized(self, data: Dict[str, Any]) -> None:
+        decision = self.active_decisions[data["decision_id"]]
+        decision.voting_options = [VotingOption.from_dict(vo) for vo in data["voting_options"]]
+        self._running_tallies[decision.decision_id] = RunningTally(
+            [opt.option_id for opt in decision.voting_options], self.tally_method
+        )
+    
+    def _on_vote_submitted(self, data: Dict[str, Any]) -> None:
+        decision = self.active_decisions[data["decision_id"]]
+        vote = AgentVote.from_dict(data["vote"])
+        decision.votes.append(vote)
+        running_tally = self._running_tally(decision)
+        running_tally.add_ballot(vote.ranked_options)
+        
+        if not decision.locked_option_id:
+            remaining_ballots = len(set(decision.participating_agents)) - len(decision.votes)
+            decision.locked_option_id = running_tally.locked_winner(remaining_ballots, self._lock_method(decision)) or ""
+    
+    def _lock_method(self, decision: DemocraticDecision) -> str:
+        """Verfahren, für das `locked_option_id` gilt: das der letzten Auszählung, sonst das der Engine."""
+        return (decision.tally_result or {}).get("method") or self.tally_method
+    
+    def _running_tally(self, decision: DemocraticDecision) -> RunningTally:
+        """Laufende Auszählung der Entscheidung; wird angelegt, falls ohne Synthese abgestimmt wird."""
+        running_tally = self._running_tallies.get(decision.decision_id)
+        if running_tally is None:
+            running_tally = self._running_tallies[decision.decision_id] = RunningTally(
+                [opt.option_id for opt in decision.voting_options], self.tally_method
+            )
+        return running_tally
+    
+    def _on_winner_calculated(self, data: Dict[str, Any]) -> None:
+        decision = self.active_decisions[data["decision_id"]]
+        decision.winning_option_id = data["winning_option_id"]
+        decision.winning_option = next(
+            opt for opt in decision.voting_options if opt.option_id == decision.winning_option_id
+        )
+        decision.tally_result = data.get("tally_result")
+        # Die Sperre muss zum gerade verwendeten Verfahren passen
+        remaining_ballots = len(set(decision.participating_agents)) - len(decision.votes)
+        decision.locked_option_id = self._running_tally(decision).locked_winner(
+            remaining_ballots, self._lock_method(decision)
+        ) or ""
+    
+    def _on_phase_advanced(self, data: Dict[str, Any]) -> None:
+        decision = self.active_decisions[data["decision_id"]]
+        decision.current_phase = VotingPhase(data["phase"])
+        self.store.save(decision.to_dict())
+    
+    def _on_decision_finalized(self, data: Dict[str, Any]) -> None:
+        decision = self.active_decisions[data["decision_id"]]
+        decision.final_decision = data["final_decision"]
+        decision.end_time = datetime.fromisoformat(data["end_time"])
+        decision.current_phase = VotingPhase.COMMITMENT
+        
+        # Verschiebe zu completed decisions
+        self.store.save(decision.to_dict())
+        del self.active_decisions[decision.decision_id]
+        del self._decision_locks[decision.decision_id]
+        self._running_tallies.pop(decision.decision_id, None)
+        self._change_logs.pop(decision.decision_id, None)
+    
+    _EVENT_HANDLERS = {
+        "decision_triggered": _on_decision_triggered,
+        "proposal_added": _on_proposal_added,
+        "options_synthesized": _on_options_synthesized,
+        "vote_submitted": _on_vote_submitted,
+        "winner_calculated": _on_winner_calculated,
+        "phase_advanced": _on_phase_advanced,
+        "decision_finalized": _on_decision_finalized,
+    }
+    
+    def _snapshot_state(self) -> Dict[str, Any]:
+        # Persistente Stores halten abgeschlossene Entscheidungen selbst vor
+        return {
+            "active_decisions": [d.to_dict() for d in self.active_decisions.values()],
+            "completed_decisions": [] if self.store.persistent else list(self.store.iter_completed())
+        }
+    
+    def _restore_from_event_log(self) -> None:
+        """Stellt den Zustand aus letztem Snapshot plus nachfolgenden Events wieder her."""
+        snapshot_state, events = self.event_log.load()
+        
+        if snapshot_state:
+            for data in snapshot_state.get("active_decisions", []):
+                decision = DemocraticDecision.from_dict(data)
+                self._decision_locks[decision.decision_id] = threading.RLock()
+                self.active_decisions[decision.decision_id] = decision
+                self._change_logs[decision.decision_id] = deque(maxlen=CHANGE_LOG_LENGTH)
+                self.store.save(data)
+                if decision.voting_options:
+                    running_tally = RunningTally([opt.option_id for opt in decision.voting_options], self.tally_method)
+                    for vote in decision.votes:
+                        running_tally.add_ballot(vote.ranked_options)
+                    self._running_tallies[decision.decision_id] = running_tally
+            for data in snapshot_state.get("completed_decisions", []):
+                self.store.save(data)
+        
+        replayed = 0
+        for event in events:
+            self._dispatch_event(event["type"], event["data"])
+            replayed += 1
+        
+        if snapshot_state or replayed:
+            self._log(f"--- Democracy Engine: Restored {len(self.active_decisions)} active and "
+                  f"{self.store.count_completed()} completed decisions "
+                  f"(snapshot seq {self.event_log.snapshot_seq}, {replayed} events replayed) ---")
+
+def create_engine_from_env():
+    """
+    Ist `DEMOCRACY_ENGINE_SOCKET` gesetzt, sprechen die Tools über einen Unix Socket mit
+    einer gemeinsamen Engine (siehe tools/engine_server.py), sonst mit einer lokalen.
+    """
+    socket_path = os.getenv("DEMOCRACY_ENGINE_SOCKET")
+    if socket_path:
+        from tools.engine_client import RemoteDemocraticVotingLogic
+        return RemoteDemocraticVotingLogic(socket_path)
+    return DemocraticVotingLogic(event_log=create_event_log_from_env())
 
 # Globale Instanz der Demokratie-Engine
-_democracy_engine = DemocraticVotingLogic()
+_democracy_engine = create_engine_from_env()
+
+def _engine_tool(run):
+    """
+    Meldet Fehler der Socket-Engine (Server nicht erreichbar, Neustart, abgelehnte
+    Anfrage) als TOOL_ERROR-Text an den Agent statt als Traceback.
+    """
+    @functools.wraps(run)
+    def wrapper(*args, **kwargs):
+        try:
+            return run(*args, **kwargs)
+        except RemoteEngineError as e:
+            return f"TOOL_ERROR: Democracy engine server rejected the request: {e}"
+        except OSError as e:
+            return f"TOOL_ERROR: Democracy engine server unavailable ({type(e).__name__}: {e})"
+    return wrapper
 
 # === CREWAI TOOLS ===
 
@@ -316,6 +973,7 @@ class TriggerDemocraticDecisionInput(BaseModel):
     trigger_reason: str = Field(..., description="Grund für die Auslösung der demokratischen Entscheidung")
     context: str = Field(..., description="Vollständiger Kontext der zu treffenden Entscheidung")
     participating_agents: List[str] = Field(..., description="Liste der Namen der teilnehmenden Agents")
+    project_id: str = Field("", description="Optional: ID des Projekts, zu dem die Entscheidung gehört")
 
 class TriggerDemocraticDecisionTool(BaseTool):
     name: str = "Trigger Democratic Decision Tool"
@@ -326,7 +984,15 @@ class TriggerDemocraticDecisionTool(BaseTool):
     """
     args_schema: Type[BaseModel] = TriggerDemocraticDecisionInput  # <-- FIXED: Added Type annotation
     
-    def _run(self, conflict_type: str, trigger_reason: str, context: str, participating_agents: List[str]) -> str:
+    @_engine_tool
+    def _run(
+        self,
+        conflict_type: str,
+        trigger_reason: str,
+        context: str,
+        participating_agents: List[str],
+        project_id: str = ""
+    ) -> str:
         try:
             conflict_enum = ConflictType(conflict_type)
         except ValueError:
@@ -336,7 +1002,7 @@ class TriggerDemocraticDecisionTool(BaseTool):
             return "TOOL_ERROR: participating_agents cannot be empty"
             
         decision_id = _democracy_engine.trigger_democratic_decision(
-            conflict_enum, trigger_reason, context, participating_agents
+            conflict_enum, trigger_reason, context, participating_agents, project_id
         )
         
         # Automatisch zur Ideensammlung wechseln
@@ -358,6 +1024,7 @@ class SubmitProposalTool(BaseTool):
     """
     args_schema: Type[BaseModel] = SubmitProposalInput  # <-- FIXED: Added Type annotation
     
+    @_engine_tool
     def _run(self, decision_id: str, agent_name: str, proposal: str, reasoning: str) -> str:
         success = _democracy_engine.add_agent_proposal(decision_id, agent_name, proposal, reasoning)
         
@@ -384,26 +1051,132 @@ class SubmitProposalTool(BaseTool):
 
 class GetDecisionStatusInput(BaseModel):
     decision_id: str = Field(..., description="ID der demokratischen Entscheidung")
+    since_version: Optional[int] = Field(
+        None,
+        description="Optional: zuletzt gesehene 'version'. Dann werden nur die Änderungen seitdem geliefert."
+    )
+    compact: bool = Field(
+        False,
+        description="Optional: kompaktes JSON ohne Einrückung mit abgekürzten Schlüsseln "
+                    "(id, ph=current_phase, p=proposals, o=voting_options, v=votes, ch=changes, e=event, "
+                    "ver=version, a=agent_name, pr=proposal, r=reasoning, ro=ranked_options, t=title, d=description)"
+    )
 
 class GetDecisionStatusTool(BaseTool):
     name: str = "Get Decision Status Tool"
     description: str = """
     Ruft den aktuellen Status einer demokratischen Entscheidung ab.
     Zeigt Phase, Vorschläge, Stimmen und andere relevante Informationen.
+    Mit 'since_version' werden bei wiederholten Abfragen nur Änderungen geliefert.
     """
     args_schema: Type[BaseModel] = GetDecisionStatusInput  # <-- FIXED: Added Type annotation
     
-    def _run(self, decision_id: str) -> str:
-        status = _democracy_engine.get_decision_status(decision_id)
+    @_engine_tool
+    def _run(self, decision_id: str, since_version: Optional[int] = None, compact: bool = False) -> str:
+        if since_version is None and not compact:
+            status_json = _democracy_engine.get_decision_status_json(decision_id)
+            if not status_json:
+                return f"TOOL_ERROR: Decision {decision_id} not found"
+            return status_json
+        
+        if since_version is None:
+            status = _democracy_engine.get_decision_status(decision_id)
+        else:
+            status = _democracy_engine.get_decision_delta(decision_id, since_version)
         if not status:
             return f"TOOL_ERROR: Decision {decision_id} not found"
             
-        return json.dumps(status, indent=2, ensure_ascii=False)
+        return encode_decision_status(status, compact)
+
+class SubmitVoteInput(BaseModel):
+    decision_id: str = Field(..., description="ID der laufenden demokratischen Entscheidung")
+    agent_name: str = Field(..., description="Name des abstimmenden Agents")
+    ranked_option_ids: List[str] = Field(..., description="Option-IDs in Präferenz-Reihenfolge, z.B. ['option_2', 'option_1']")
+    reasoning: str = Field(..., description="Begründung für die erste Wahl")
+
+class SubmitVoteTool(BaseTool):
+    name: str = "Submit Vote Tool"
+    description: str = """
+    Gibt die Rangfolge-Stimme eines Agents für eine Entscheidung in der Phase RANKED_VOTING ab.
+    Jeder Agent kann genau einmal pro Entscheidung abstimmen.
+    """
+    args_schema: Type[BaseModel] = SubmitVoteInput
+    
+    @_engine_tool
+    def _run(self, decision_id: str, agent_name: str, ranked_option_ids: List[str], reasoning: str) -> str:
+        result = _democracy_engine.submit_agent_votes_bulk(decision_id, [{
+            "agent_name": agent_name, "ranked_option_ids": ranked_option_ids, "reasoning": reasoning
+        }])[0]
+        if not result["success"]:
+            return f"TOOL_ERROR: {result['error']}"
+        return f"Vote successfully submitted by {agent_name} for decision {decision_id}"
+
+class ProposalItem(BaseModel):
+    agent_name: str = Field(..., description="Name des vorschlagenden Agents")
+    proposal: str = Field(..., description="Konkreter Vorschlag für die Lösung")
+    reasoning: str = Field(..., description="Begründung für den Vorschlag")
+
+class BallotItem(BaseModel):
+    agent_name: str = Field(..., description="Name des abstimmenden Agents")
+    ranked_option_ids: List[str] = Field(..., description="Option-IDs in Präferenz-Reihenfolge")
+    reasoning: str = Field(..., description="Begründung für die erste Wahl")
+
+class BulkSubmitProposalsInput(BaseModel):
+    decision_id: str = Field(..., description="ID der laufenden demokratischen Entscheidung")
+    proposals: List[ProposalItem] = Field(..., description="Liste von Vorschlägen (agent_name, proposal, reasoning)")
+
+class BulkSubmitVotesInput(BaseModel):
+    decision_id: str = Field(..., description="ID der laufenden demokratischen Entscheidung")
+    ballots: List[BallotItem] = Field(..., description="Liste von Stimmzetteln (agent_name, ranked_option_ids, reasoning)")
+
+def _as_dicts(items: List[Any]) -> List[Dict[str, Any]]:
+    return [item.model_dump() if isinstance(item, BaseModel) else dict(item) for item in items]
+
+def _format_bulk_results(kind: str, decision_id: str, results: List[Dict[str, Any]]) -> str:
+    accepted = sum(1 for result in results if result["success"])
+    lines = [f"{accepted}/{len(results)} {kind} accepted for decision {decision_id}"]
+    for result in results:
+        outcome = "accepted" if result["success"] else f"rejected ({result['error']})"
+        lines.append(f"- {result['agent_name'] or '<missing agent_name>'}: {outcome}")
+    return "\n".join(lines)
+
+class BulkSubmitProposalsTool(BaseTool):
+    name: str = "Bulk Submit Proposals Tool"
+    description: str = """
+    Reicht mehrere Vorschläge für eine Entscheidung in einem einzigen Aufruf ein
+    (z.B. vorab gesammelte Vorschläge aller Agents). Liefert ein Ergebnis pro Vorschlag.
+    """
+    args_schema: Type[BaseModel] = BulkSubmitProposalsInput
+    
+    @_engine_tool
+    def _run(self, decision_id: str, proposals: List[Any]) -> str:
+        if not proposals:
+            return "TOOL_ERROR: proposals cannot be empty"
+        results = _democracy_engine.add_agent_proposals_bulk(decision_id, _as_dicts(proposals))
+        return _format_bulk_results("proposals", decision_id, results)
+
+class BulkSubmitVotesTool(BaseTool):
+    name: str = "Bulk Submit Votes Tool"
+    description: str = """
+    Gibt mehrere Rangfolge-Stimmzettel für eine Entscheidung in einem einzigen Aufruf ab
+    (z.B. vorab erzeugte Stimmzettel aller Agents). Liefert ein Ergebnis pro Stimmzettel.
+    """
+    args_schema: Type[BaseModel] = BulkSubmitVotesInput
+    
+    @_engine_tool
+    def _run(self, decision_id: str, ballots: List[Any]) -> str:
+        if not ballots:
+            return "TOOL_ERROR: ballots cannot be empty"
+        results = _democracy_engine.submit_agent_votes_bulk(decision_id, _as_dicts(ballots))
+        return _format_bulk_results("ballots", decision_id, results)
 
 # Export der Tools
 trigger_democratic_decision_tool = TriggerDemocraticDecisionTool()
 submit_proposal_tool = SubmitProposalTool() 
 get_decision_status_tool = GetDecisionStatusTool()
+submit_vote_tool = SubmitVoteTool()
+bulk_submit_proposals_tool = BulkSubmitProposalsTool()
+bulk_submit_votes_tool = BulkSubmitVotesTool()
 
 if __name__ == '__main__':
     print("=== Testing Democratic Voting System ===")
@@ -444,4 +1217,183 @@ if __name__ == '__main__':
     status = get_decision_status_tool._run(decision_id=decision_id)
     print(f"Status:\n{status}")
     
+    # Test 4: Crash-Recovery über das Event-Log
+    print("\n4. Restoring engine state from event log...")
+    import tempfile
+    with tempfile.TemporaryDirectory() as log_dir:
+        engine = DemocraticVotingLogic(event_log=DecisionEventLog(log_dir, snapshot_interval=3))
+        recovery_id = engine.trigger_democratic_decision(
+            ConflictType.MANUAL_TRIGGER, "Recovery test", "Event log replay", ["Developer", "Tester"]
+        )
+        engine.advance_phase(recovery_id, VotingPhase.IDEA_COLLECTION)
+        for agent, proposal, reasoning in proposals[:2]:
+            engine.add_agent_proposal(recovery_id, agent, proposal, reasoning)
+        engine.event_log.close()
+        
+        restored = DemocraticVotingLogic(event_log=DecisionEventLog(log_dir, snapshot_interval=3))
+        matches = restored.get_decision_status(recovery_id) == engine.get_decision_status(recovery_id)
+        print(f"  Restored state matches original: {matches}")
+        restored.event_log.close()
+    
+    # Test 5: Nebenläufige Vorschläge und Stimmen (Stresstest gegen Lost Updates)
+    print("\n5. Stress-testing concurrent proposals and votes...")
+    from concurrent.futures import ThreadPoolExecutor
+    
+    stress_engine = DemocraticVotingLogic(verbose=False)
+    stress_agents = [f"Agent_{i}" for i in range(400)]
+    stress_id = stress_engine.trigger_democratic_decision(
+        ConflictType.MANUAL_TRIGGER, "Stress test", "Concurrent submissions", stress_agents
+    )
+    stress_engine.advance_phase(stress_id, VotingPhase.IDEA_COLLECTION)
+    
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        # Jeder Agent versucht dreimal gleichzeitig einzureichen
+        accepted = sum(pool.map(
+            lambda args: stress_engine.add_agent_proposal(stress_id, args[0], f"Proposal {args[1]}", "Reasoning"),
+            [(agent, attempt) for agent in stress_agents for attempt in range(3)]
+        ))
+    proposal_count = len(stress_engine.get_decision_status(stress_id)["proposals"])
+    print(f"  Proposals accepted: {accepted}, stored: {proposal_count}, expected: {len(stress_agents)}")
+    
+    stress_engine.advance_phase(stress_id, VotingPhase.SYNTHESIS)
+    stress_engine.synthesize_options(stress_id, [{"title": "A"}, {"title": "B"}, {"title": "C"}])
+    stress_engine.advance_phase(stress_id, VotingPhase.RANKED_VOTING)
+    
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        accepted = sum(pool.map(
+            lambda agent: stress_engine.submit_agent_vote(stress_id, agent, ["option_2", "option_1"], "Vote"),
+            stress_agents * 3
+        ))
+    vote_count = len(stress_engine.get_decision_status(stress_id)["votes"])
+    print(f"  Votes accepted: {accepted}, stored: {vote_count}, expected: {len(stress_agents)}")
+    
+    # Test 6: Trigger-Durchsatz und Kollisionsfreiheit der IDs
+    print("\n6. Measuring trigger throughput...")
+    throughput_engine = DemocraticVotingLogic(verbose=False)
+    trigger_count = 50_000
+    start = time.perf_counter()
+    for n in range(trigger_count):
+        throughput_engine.trigger_democratic_decision(
+            ConflictType.ARCHITECTURE_DECISION, "Throughput", "Load", ["Developer"], f"project_{n % 10}"
+        )
+    elapsed = time.perf_counter() - start
+    print(f"  Single thread: {trigger_count} triggers in {elapsed:.2f}s ({trigger_count / elapsed:,.0f}/s)")
+    
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        triggered_ids = list(pool.map(
+            lambda n: throughput_engine.trigger_democratic_decision(
+                ConflictType.UX_UI_DIRECTION, "Throughput", "Load", ["Developer"], f"project_{n % 10}"
+            ),
+            range(trigger_count)
+        ))
+    print(f"  16 threads: unique IDs {len(set(triggered_ids))}, "
+          f"active decisions {len(throughput_engine.active_decisions)} (expected {2 * trigger_count})")
+    project_ids = throughput_engine.find_decisions_by_project("project_3", ConflictType.UX_UI_DIRECTION)
+    print(f"  Decisions indexed for project_3: {len(project_ids)} (expected {trigger_count // 10})")
+    
+    # Test 7: Bytes pro Status-Abfrage - voller Status vs. Delta im kompakten Format
+    print("\n7. Comparing full status polls with versioned compact deltas...")
+    poll_agents = ["Project Manager", "Developer", "Researcher", "Tester"]
+    poll_id = trigger_democratic_decision_tool._run(
+        conflict_type="architecture_decision",
+        trigger_reason="Frontend framework selection for data dashboard project",
+        context="Need to choose frontend framework considering real-time data, responsive design, "
+                "maintainability, and SEO. " * 4,
+        participating_agents=poll_agents
+    ).split("ID: ")[1].split(".")[0]
+    
+    full_bytes = delta_bytes = polls = 0
+    last_version = {agent: 0 for agent in poll_agents}
+    
+    def poll_all() -> None:
+        global full_bytes, delta_bytes, polls
+        for agent in poll_agents:
+            full_bytes += len(get_decision_status_tool._run(decision_id=poll_id).encode("utf-8"))
+            delta = get_decision_status_tool._run(
+                decision_id=poll_id, since_version=last_version[agent], compact=True
+            )
+            delta_bytes += len(delta.encode("utf-8"))
+            last_version[agent] = json.loads(delta)["ver"]
+            polls += 1
+    
+    _democracy_engine.verbose = False
+    for agent in poll_agents:
+        _democracy_engine.add_agent_proposal(
+            poll_id, agent, f"{agent} proposes React with TypeScript and a component library",
+            "Strong ecosystem, good tooling, typed props make refactoring safe and reviews faster. " * 3
+        )
+        poll_all()
+    _democracy_engine.advance_phase(poll_id, VotingPhase.SYNTHESIS)
+    _democracy_engine.synthesize_options(poll_id, [
+        {"title": "React", "description": "React with TypeScript", "source_proposals": poll_agents[:2]},
+        {"title": "Vue", "description": "Vue 3 with Composition API", "source_proposals": poll_agents[2:]}
+    ])
+    _democracy_engine.advance_phase(poll_id, VotingPhase.RANKED_VOTING)
+    poll_all()
+    for agent in poll_agents:
+        _democracy_engine.submit_agent_vote(poll_id, agent, ["option_1", "option_2"], "Best long-term fit")
+        poll_all()
+    
+    # Grobe Schätzung: ~4 Bytes pro Token
+    print(f"  {polls} polls: full {full_bytes / polls:,.0f} B/poll, delta+compact {delta_bytes / polls:,.0f} B/poll")
+    print(f"  Saved per poll: {(full_bytes - delta_bytes) / polls:,.0f} B (~{(full_bytes - delta_bytes) / polls / 4:,.0f} tokens, "
+          f"{100 * (1 - delta_bytes / full_bytes):.0f}%)")
+    
+    # Test 8: Vorab erzeugte Vorschläge und Stimmzettel in einem Schritt einspielen
+    print("\n8. Bulk-submitting proposals and ballots...")
+    bulk_engine = DemocraticVotingLogic(verbose=False)
+    bulk_agents = [f"Agent_{i}" for i in range(1000)]
+    bulk_id = bulk_engine.trigger_democratic_decision(
+        ConflictType.MANUAL_TRIGGER, "Bulk test", "Pre-generated ballots", bulk_agents
+    )
+    bulk_engine.advance_phase(bulk_id, VotingPhase.IDEA_COLLECTION)
+    proposal_results = bulk_engine.add_agent_proposals_bulk(bulk_id, [
+        {"agent_name": agent, "proposal": f"Proposal of {agent}", "reasoning": "Bulk"}
+        for agent in bulk_agents + ["Agent_0", "Outsider"]
+    ])
+    print(f"  Proposals accepted: {sum(r['success'] for r in proposal_results)}/{len(proposal_results)}, "
+          f"rejections: {[r['error'] for r in proposal_results if not r['success']]}")
+    
+    bulk_engine.advance_phase(bulk_id, VotingPhase.SYNTHESIS)
+    bulk_engine.synthesize_options(bulk_id, [{"title": "A"}, {"title": "B"}, {"title": "C"}])
+    bulk_engine.advance_phase(bulk_id, VotingPhase.RANKED_VOTING)
+    rankings = [["option_1", "option_2", "option_3"], ["option_3", "option_1"], ["option_2", "option_3", "option_1"]]
+    ballots = [
+        {"agent_name": agent, "ranked_option_ids": rankings[n % 3], "reasoning": "Bulk"}
+        for n, agent in enumerate(bulk_agents)
+    ]
+    start = time.perf_counter()
+    ballot_results = bulk_engine.submit_agent_votes_bulk(bulk_id, ballots + [
+        {"agent_name": "Agent_1", "ranked_option_ids": ["option_1"], "reasoning": "Duplicate"},
+        {"agent_name": "Agent_X", "ranked_option_ids": ["option_9"], "reasoning": "Unknown"}
+    ])
+    elapsed = time.perf_counter() - start
+    print(f"  Ballots accepted: {sum(r['success'] for r in ballot_results)}/{len(ballot_results)} "
+          f"in {elapsed * 1000:.0f} ms ({len(ballots) / elapsed:,.0f} ballots/s)")
+    print(f"  Winner: {bulk_engine.calculate_ranked_choice_winner(bulk_id)}")
+    
+    # Test 9: Phasenwechsel werden gepusht statt gepollt
+    print("\n9. Subscribing to phase changes instead of polling...")
+    push_engine = DemocraticVotingLogic(verbose=False)
+    received = []
+    push_engine.events.subscribe(lambda n: received.append((n.topic, n.phase)), project_id="push_project")
+    push_id = push_engine.trigger_democratic_decision(
+        ConflictType.MANUAL_TRIGGER, "Push test", "Notifications", ["Developer", "Tester"], "push_project"
+    )
+    
+    waiter_result = []
+    waiter = threading.Thread(target=lambda: waiter_result.append(
+        push_engine.wait_for_phase(push_id, VotingPhase.RANKED_VOTING, timeout=5)
+    ))
+    waiter.start()
+    for phase in (VotingPhase.IDEA_COLLECTION, VotingPhase.SYNTHESIS):
+        push_engine.advance_phase(push_id, phase)
+    push_engine.synthesize_options(push_id, [{"title": "A"}, {"title": "B"}])
+    push_engine.advance_phase(push_id, VotingPhase.RANKED_VOTING)
+    waiter.join()
+    push_engine.finalize_decision(push_id, "Done")
+    
+    print(f"  Waiting thread woke up on RANKED_VOTING: {waiter_result == [True]}")
+    print(f"  Notifications: {received}")
+    
     print("\n=== Democracy Engine Testing Complete ===")
\ No newline at end of file
@@ -0,0 +1,340 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+_WHITESPACE = re.compile(r"\s+")
+_DIGEST_SIZE = 16
+
+
+class HashedNgramEmbedder:
+    """
+    Offline-Embeddings ohne Modell-Download: Byte-N-Gramme (Standard 3-5) des
+    normalisierten Texts werden per Multiply-Shift-Hashing auf `n_features` Spalten
+    gezählt (sublinear) und mit einer festen Gauß-Zufallsmatrix auf `dim` Dimensionen
+    projiziert. Cosinus-Ähnlichkeiten bleiben dabei näherungsweise erhalten
+    (Johnson-Lindenstrauss); gleicher Seed = gleiche Vektoren in jedem Prozess.
+    """
+
+    def __init__(self, dim: int = 256, n_features: int = 1 << 14, ngram_range: Sequence[int] = (3, 5), seed: int = 17):
+        if n_features & (n_features - 1):
+            raise ValueError("n_features must be a power of two")
+        if not 1 <= ngram_range[0] <= ngram_range[1] <= 8:
+            raise ValueError("ngram_range must lie within 1..8 bytes")
+        self.dim = dim
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.seed = seed
+        self._shift = np.uint64(64 - n_features.bit_length() + 1)
+        rng = np.random.default_rng(seed)
+        # Ein ungerader Multiplikator je N-Gramm-Länge, damit "abc" und "abc\0" verschieden landen
+        self._multipliers = rng.integers(0, 1 << 63, size=8, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._projection: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    @property
+    def signature(self) -> str:
+        """Kennung der Parameter; ein Vektor-Cache ist nur für dieselbe Signatur gültig."""
+        return f"hashed-ngrams-v1:{self.ngram_range[0]}-{self.ngram_range[1]}:{self.n_features}:{self.dim}:{self.seed}"
+
+    @property
+    def projection(self) -> np.ndarray:
+        # Erst beim ersten Einsatz erzeugen (n_features x dim float32, Standard 16 MB)
+        if self._projection is None:
+            with self._lock:
+                if self._projection is None:
+                    rng = np.random.default_rng(self.seed + 1)
+                    matrix = rng.standard_normal((self.n_features, self.dim), dtype=np.float32)
+                    matrix /= np.float32(np.sqrt(self.dim))
+                    self._projection = matrix
+        return self._projection
+
+    def _counts(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """Sublineare N-Gramm-Zählungen (Texte x n_features), für alle Texte in einem NumPy-Durchlauf."""
+        encoded = [(" " + _WHITESPACE.sub(" ", text.lower()).strip() + " ").encode("utf-8") for text in texts]
+        lengths = [len(value) for value in encoded]
+        ends = np.cumsum(lengths)
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+        # Index des Texts und Ende seines Bereichs je Byte-Position
+        owners = np.repeat(np.arange(len(texts)), lengths)
+        limits = np.repeat(ends, lengths)
+
+        keys = []
+        for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+            if len(data) < n:
+                break
+            # N Bytes kollisionsfrei in einem uint64, dann Multiply-Shift auf log2(n_features) Bit;
+            # Fenster über eine Textgrenze hinweg werden verworfen
+            windows = np.lib.stride_tricks.sliding_window_view(data, n)
+            packed = (windows << (np.arange(n - 1, -1, -1, dtype=np.uint64) * np.uint64(8))).sum(axis=1)
+            valid = np.arange(n, len(packed) + n) <= limits[:len(packed)]
+            with np.errstate(over="ignore"):
+                columns = ((packed[valid] * self._multipliers[n - 1]) >> self._shift).astype(np.int64)
+            keys.append(owners[:len(packed)][valid] * self.n_features + columns)
+
+        # Ein Sortierlauf über (Zeile, Spalte) liefert Zählungen bereits in CSR-Reihenfolge
+        unique, frequencies = np.unique(np.concatenate(keys) if keys else np.empty(0, dtype=np.int64), return_counts=True)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(unique // self.n_features, minlength=len(texts)))))
+        return sparse.csr_matrix(
+            (np.log1p(frequencies.astype(np.float32)), (unique % self.n_features).astype(np.int32), indptr),
+            shape=(len(texts), self.n_features)
+        )
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """L2-normierte Embeddings (Texte x dim, float32); leere Texte ergeben Nullvektoren."""
+        vectors = np.asarray(self._counts(texts) @ self.projection, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors /= norms
+        return vectors
+
+
+class EmbeddingCache:
+    """
+    Vektor-Cache, adressiert über den Inhalts-Hash (BLAKE2b) des Texts.
+
+    Mit `directory` liegen die Vektoren in `vectors.f32`, einem per np.memmap
+    eingeblendeten float32-Array (Zeilen x dim), das bei Bedarf verdoppelt wird; die
+    Schlüssel werden in `keys.bin` (16 Bytes je Zeile, gleiche Reihenfolge)
+    angehängt. Ein Schlüssel wird erst nach seinem Vektor geschrieben, sodass ein
+    Absturz höchstens die letzten Einträge kostet. `meta.json` hält die Signatur des
+    Embedders; passt sie nicht, wird der Cache verworfen. Ohne `directory` liegt
+    dasselbe Array nur im Speicher und ist auf `max_rows` Zeilen begrenzt; danach
+    werden die ältesten Zeilen reihum überschrieben.
+    """
+
+    def __init__(self, dim: int, signature: str, directory: Optional[str] = None, initial_capacity: int = 1024,
+                 max_rows: int = 50_000):
+        self.dim = dim
+        self.signature = signature
+        self.directory = Path(directory) if directory else None
+        self._lock = threading.Lock()
+        self._rows: Dict[bytes, int] = {}
+        self._keys_file = None
+
+        if self.directory is None:
+            self.max_rows = max(1, max_rows)
+            # Schlüssel je Zeile und nächste zu überschreibende Zeile, sobald `max_rows` erreicht ist
+            self._row_keys: List[bytes] = []
+            self._evict_row = 0
+            self._vectors = np.empty((min(initial_capacity, self.max_rows), dim), dtype=np.float32)
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        meta_path = self.directory / "meta.json"
+        vectors_path, keys_path = self.directory / "vectors.f32", self.directory / "keys.bin"
+        meta = {"signature": signature, "dim": dim}
+        if not meta_path.exists() or json.loads(meta_path.read_text(encoding="utf-8")) != meta:
+            for path in (vectors_path, keys_path):
+                path.unlink(missing_ok=True)
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+        keys = keys_path.read_bytes() if keys_path.exists() else b""
+        count = len(keys) // _DIGEST_SIZE
+        # Nur Schlüssel, deren Vektor vollständig im Array liegt
+        stored_rows = vectors_path.stat().st_size // (dim * 4) if vectors_path.exists() else 0
+        count = min(count, stored_rows)
+        self._rows = {keys[i * _DIGEST_SIZE:(i + 1) * _DIGEST_SIZE]: i for i in range(count)}
+
+        self._vectors_path = vectors_path
+        self._vectors = self._map(max(stored_rows, initial_capacity))
+        self._keys_file = open(keys_path, "ab")
+        self._keys_file.truncate(count * _DIGEST_SIZE)
+
+    def _map(self, capacity: int) -> np.ndarray:
+        with open(self._vectors_path, "ab") as f:
+            if f.tell() < capacity * self.dim * 4:
+                f.truncate(capacity * self.dim * 4)
+        return np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def _reserve(self, rows: int) -> None:
+        capacity = len(self._vectors)
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        if self.directory is None:
+            capacity = min(capacity, self.max_rows)
+            grown = np.empty((capacity, self.dim), dtype=np.float32)
+            grown[:len(self._rows)] = self._vectors[:len(self._rows)]
+            self._vectors = grown
+        else:
+            self._vectors.flush()
+            self._vectors = self._map(capacity)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def fetch(self, keys: Sequence[bytes]) -> Tuple[np.ndarray, List[int]]:
+        """Vektoren zu `keys` (fehlende als Nullzeilen) und die Positionen der fehlenden Schlüssel."""
+        result = np.zeros((len(keys), self.dim), dtype=np.float32)
+        with self._lock:
+            rows = [self._rows.get(key) for key in keys]
+            found = [i for i, row in enumerate(rows) if row is not None]
+            if found:
+                result[found] = self._vectors[[rows[i] for i in found]]
+        return result, [i for i, row in enumerate(rows) if row is None]
+
+    def store(self, keys: Sequence[bytes], vectors: np.ndarray) -> None:
+        with self._lock:
+            new = [(key, vector) for key, vector in zip(keys, vectors) if key not in self._rows]
+            if not new:
+                return
+            if self.directory is None:
+                self._store_bounded(new)
+                return
+            start = len(self._rows)
+            self._reserve(start + len(new))
+            self._vectors[start:start + len(new)] = np.stack([vector for _, vector in new])
+            if self._keys_file is not None:
+                self._vectors.flush()
+                self._keys_file.write(b"".join(key for key, _ in new))
+                self._keys_file.flush()
+            for offset, (key, _) in enumerate(new):
+                self._rows[key] = start + offset
+
+    def _store_bounded(self, new: List[Tuple[bytes, np.ndarray]]) -> None:
+        # Mehr neue Vektoren als Platz: nur die letzten behalten
+        new = new[-self.max_rows:]
+        free = self.max_rows - len(self._row_keys)
+        appended, replacing = new[:free], new[free:]
+        if appended:
+            start = len(self._row_keys)
+            self._reserve(start + len(appended))
+            self._vectors[start:start + len(appended)] = np.stack([vector for _, vector in appended])
+            for offset, (key, _) in enumerate(appended):
+                self._rows[key] = start + offset
+                self._row_keys.append(key)
+        for key, vector in replacing:
+            row = self._evict_row
+            del self._rows[self._row_keys[row]]
+            self._vectors[row] = vector
+            self._rows[key] = row
+            self._row_keys[row] = key
+            self._evict_row = (row + 1) % self.max_rows
+
+    def close(self) -> None:
+        with self._lock:
+            if self._keys_file is not None:
+                self._vectors.flush()
+                self._keys_file.close()
+                self._keys_file = None
+
+
+class EmbeddingEngine:
+    """
+    Gemeinsamer Einstieg für Textähnlichkeit (Synthese, Zusammenfassung, Artefakt-Suche):
+    `embed` liefert bereits berechnete Vektoren aus dem Cache und rechnet nur die
+    fehlenden in einem Batch nach.
+    """
+
+    def __init__(self, embedder: Optional[HashedNgramEmbedder] = None, cache_dir: Optional[str] = None,
+                 max_cached_rows: int = 50_000):
+        self.embedder = embedder or HashedNgramEmbedder()
+        self.cache = EmbeddingCache(self.embedder.dim, self.embedder.signature, cache_dir, max_rows=max_cached_rows)
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def content_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=_DIGEST_SIZE).digest()
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """L2-normierte Embeddings (Texte x dim, float32)."""
+        if not texts:
+            return np.empty((0, self.embedder.dim), dtype=np.float32)
+
+        keys = [self.content_key(text) for text in texts]
+        # Fehlende Vektoren direkt einsetzen statt erneut nachzuschlagen - der begrenzte
+        # Cache kann sie beim Speichern bereits wieder verdrängt haben
+        vectors, missing_positions = self.cache.fetch(keys)
+        missing: Dict[bytes, str] = {}
+        for position in missing_positions:
+            missing.setdefault(keys[position], texts[position])
+
+        with self._stats_lock:
+            self.hits += len(texts) - len(missing_positions)
+            self.misses += len(missing_positions)
+
+        if missing:
+            computed = self.embedder.embed(list(missing.values()))
+            self.cache.store(list(missing), computed)
+            row_of = {key: row for row, key in enumerate(missing)}
+            vectors[missing_positions] = computed[[row_of[keys[position]] for position in missing_positions]]
+        return vectors
+
+    def most_similar(self, query: str, texts: Sequence[str], top_k: int = 5) -> List[Tuple[int, float]]:
+        """(Index, Cosinus-Ähnlichkeit) der `top_k` zu `query` ähnlichsten Texte, absteigend."""
+        if not texts:
+            return []
+        vectors = self.embed([query, *texts])
+        scores = vectors[1:] @ vectors[0]
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        return [(int(index), round(float(scores[index]), 4)) for index in order]
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        with self._stats_lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                    "cached_vectors": len(self.cache)}
+
+    def close(self) -> None:
+        self.cache.close()
+
+
+def load_embedding_engine() -> EmbeddingEngine:
+    """
+    Embedding-Engine aus der Umgebung; ohne DEMOCRACY_EMBEDDING_CACHE_DIR nur mit einem
+    Speicher-Cache von höchstens DEMOCRACY_EMBEDDING_CACHE_ROWS Vektoren.
+    """
+    return EmbeddingEngine(
+        HashedNgramEmbedder(dim=int(os.getenv("DEMOCRACY_EMBEDDING_DIM", "256"))),
+        os.getenv("DEMOCRACY_EMBEDDING_CACHE_DIR"),
+        max_cached_rows=int(os.getenv("DEMOCRACY_EMBEDDING_CACHE_ROWS", "50000"))
+    )
+
+
+# Globale Instanz, die Synthese, Zusammenfassung und Datei-Tools teilen
+_embedding_engine = load_embedding_engine()
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    print("=== Testing Text Embeddings ===")
+    engine = EmbeddingEngine()
+    texts = [
+        "Use React with TypeScript for the frontend",
+        "React + TypeScript frontend",
+        "Cache API responses in Redis",
+    ]
+    vectors = engine.embed(texts)
+    print(f"\n1. Similarity React/React {vectors[0] @ vectors[1]:.2f}, React/Redis {vectors[0] @ vectors[2]:.2f}")
+    print(f"2. most_similar('typescript react'): {engine.most_similar('typescript react', texts, top_k=2)}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        persistent = EmbeddingEngine(cache_dir=directory)
+        persistent.embed(texts)
+        persistent.close()
+        reopened = EmbeddingEngine(cache_dir=directory)
+        same = np.allclose(reopened.embed(texts), vectors)
+        print(f"3. Reopened cache: {reopened.stats}, identical vectors: {same}")
+        reopened.close()
+
+    bounded = EmbeddingEngine(max_cached_rows=100)
+    sentences = [f"Proposal {n}: cache the embeddings of agent proposals" for n in range(250)]
+    embedded = bounded.embed(sentences)
+    again = bounded.embed(sentences[-50:] + sentences[:3])
+    same = np.allclose(again, np.vstack([embedded[-50:], embedded[:3]]))
+    print(f"4. Bounded cache: {bounded.stats['cached_vectors']} vectors (max 100), identical vectors: {same}, "
+          f"hits {bounded.stats['hits']} (expected 50)")
+
+    print("\n=== Text Embeddings Testing Complete ===")
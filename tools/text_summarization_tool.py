@@ -4,6 +4,10 @@ from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 from crewai import Agent, Task, LLM  # Wird benötigt, um dynamisch einen Summarizer-Agenten zu erstellen
 
+from tools.chunked_summarization import DEFAULT_CHUNK_TOKENS, MapReduceSummarizer, estimate_tokens
+from tools.extractive_compression import create_extractive_compressor_from_env
+from tools.summary_cache import create_summary_cache_from_env, summary_key
+
 # Umgebungsvariablen für den Fall laden, dass wir ein eigenes LLM erstellen müssen
 from dotenv import load_dotenv
 load_dotenv()
@@ -37,6 +41,12 @@ except Exception as e:
 # Globale Variable für den Summarizer Agenten, um ihn nicht bei jedem Aufruf neu zu erstellen
 _summarizer_agent: Optional[Agent] = None
 
+# Persistenter Cache für Zusammenfassungen (None, wenn per SUMMARIZER_CACHE=false abgeschaltet)
+_summary_cache = create_summary_cache_from_env()
+
+# Lokale extraktive Vorverdichtung vor dem LLM (None, solange SUMMARIZER_EXTRACTIVE nicht gesetzt ist)
+_extractive_compressor = create_extractive_compressor_from_env()
+
 def get_summarizer_agent() -> Optional[Agent]:
     """
     Erstellt oder gibt den globalen Summarizer-Agenten zurück.
@@ -160,6 +170,8 @@ class TextSummarizationTool(BaseTool):
     Summarizes a given text using an AI model by delegating to a specialized Summarizer Agent. 
     Useful for condensing long documents, articles, or scraped web content into a shorter, digestible format.
     You can optionally specify a maximum length for the summary and a specific focus.
+    Very long texts are split into sections that are summarized in parallel and then combined.
+    Optionally, low-salience sentences (navigation, boilerplate) are dropped locally before the AI model sees the text.
     """
     args_schema: Type[BaseModel] = TextSummarizationToolInput  # <-- FIXED: Added Type annotation
 
@@ -178,6 +190,77 @@ class TextSummarizationTool(BaseTool):
         if not summarizer_agent:
             return "TOOL_ERROR (TextSummarizationTool): Summarizer agent could not be initialized. Check LLM configuration and 'agents.py' import."
 
+        try:
+            # Der Cache-Schlüssel bezieht sich auf den Originaltext, sodass Treffer auch die Vorverdichtung sparen
+            cache_key = summary_key(text_to_summarize, max_length, summary_focus, self._cache_model(summarizer_agent))
+            cached = _summary_cache.get(cache_key) if _summary_cache else None
+            if cached is not None:
+                print(f"--- Debug (TextSummarizationTool): Summary cache hit, {_summary_cache.stats} ---")
+                return cached
+
+            text = text_to_summarize
+            if _extractive_compressor is not None:
+                # Lokal wenig aussagekräftige Sätze (Navigation, Footer, Cookie-Hinweise) vorab entfernen
+                text = _extractive_compressor.compress(text_to_summarize, summary_focus)
+                if text is not text_to_summarize:
+                    print(f"--- Debug (TextSummarizationTool): Extractive pre-compression {estimate_tokens(text_to_summarize)} -> {estimate_tokens(text)} tokens ---")
+
+            # Kurze Texte in einem Aufruf; lange Texte per Map-Reduce, damit weder das
+            # Kontextfenster gesprengt wird noch ein einzelner langer Aufruf alles blockiert
+            if estimate_tokens(text) <= DEFAULT_CHUNK_TOKENS:
+                summary = self._summarize_with_agent(summarizer_agent, text, max_length, summary_focus)
+            else:
+                # Jeder Abschnitt mit eigener Agent-Kopie, da ein Agent während einer Task Zustand hält;
+                # Abschnitte werden einzeln gecacht, sodass bei geänderten Texten nur neue Abschnitte laufen
+                map_reduce = MapReduceSummarizer(
+                    lambda chunk, length, focus: self._summarize_cached(summarizer_agent, chunk, length, focus, copy_agent=True)
+                )
+                print(f"--- Debug (TextSummarizationTool): Text exceeds {DEFAULT_CHUNK_TOKENS} tokens, using map-reduce with up to {map_reduce.max_workers} parallel calls ---")
+                summary = map_reduce.summarize(text, max_length, summary_focus)
+                print(f"--- Debug (TextSummarizationTool): Map-reduce summarization finished after {map_reduce.calls} calls ---")
+
+            # Nur erfolgreiche Zusammenfassungen landen im Cache; Fehler werfen vorher eine Exception
+            if _summary_cache:
+                _summary_cache.put(cache_key, summary)
+            return summary
+        except Exception as e:
+            error_msg = f"TOOL_ERROR (TextSummarizationTool): An error occurred during text summarization task execution: {e}"
+            print(f"--- Debug (TextSummarizationTool): {error_msg} ---")
+            # Versuche, spezifischere Fehler von LiteLLM oder dem LLM-Aufruf zu bekommen, falls möglich
+            if hasattr(e, 'message'):  # Typisch für manche Exception-Objekte
+                error_msg += f" Details: {e.message}"
+            elif hasattr(e, 'args') and e.args:  # Generische Exceptions haben oft Details in args
+                error_msg += f" Details: {e.args[0] if e.args else ''}"
+            return error_msg
+
+    @staticmethod
+    def _model_name(summarizer_agent: Agent) -> str:
+        llm = getattr(summarizer_agent, "llm", None)
+        return str(getattr(llm, "model", None) or llm or "")
+
+    def _cache_model(self, summarizer_agent: Agent) -> str:
+        """Modellkennung für Cache-Schlüssel des Gesamttexts, inkl. Einstellungen der Vorverdichtung."""
+        model = self._model_name(summarizer_agent)
+        return f"{model}|{_extractive_compressor.signature}" if _extractive_compressor else model
+
+    def _summarize_cached(self, summarizer_agent: Agent, text_to_summarize: str, max_length: Optional[int], summary_focus: Optional[str], copy_agent: bool = False) -> str:
+        """Wie `_summarize_with_agent`, aber zuerst im Summary-Cache nachschlagen (Schlüssel: Text, Länge, Fokus, Modell)."""
+        if _summary_cache is None:
+            return self._summarize_with_agent(summarizer_agent.copy() if copy_agent else summarizer_agent, text_to_summarize, max_length, summary_focus)
+
+        key = summary_key(text_to_summarize, max_length, summary_focus, self._model_name(summarizer_agent))
+        summary = _summary_cache.get(key)
+        if summary is not None:
+            print(f"--- Debug (TextSummarizationTool): Summary cache hit, {_summary_cache.stats} ---")
+            return summary
+
+        summary = self._summarize_with_agent(summarizer_agent.copy() if copy_agent else summarizer_agent, text_to_summarize, max_length, summary_focus)
+        # Nur erfolgreiche Zusammenfassungen landen im Cache; Fehler werfen vorher eine Exception
+        _summary_cache.put(key, summary)
+        return summary
+
+    def _summarize_with_agent(self, summarizer_agent: Agent, text_to_summarize: str, max_length: Optional[int], summary_focus: Optional[str]) -> str:
+        """Fasst einen Text (oder Abschnitt) in einer Task des Summarizer Agenten zusammen."""
         # Erstelle den Prompt für den Summarizer Agenten
         task_description = f"Please summarize the following text:\n\n---\n{text_to_summarize}\n---\n\n"
         if summary_focus:
@@ -194,41 +277,31 @@ class TextSummarizationTool(BaseTool):
             agent=summarizer_agent
         )
 
-        try:
-            print(f"--- Debug (TextSummarizationTool): Starting summarization task for Summarizer Agent. Task description preview: '{task_description[:250]}...' ---")
-            # Führe die Task aus. Die execute_sync Methode wird hier verwendet, da _run synchron ist.
-            task_output = summarization_task.execute_sync() 
-            
-            # Verarbeitung des TaskOutput-Objekts
-            # In neueren Versionen von CrewAI gibt task.execute_sync() ein TaskOutput-Objekt zurück
-            # Wir müssen prüfen, welches Attribut wir verwenden sollen
-            if hasattr(task_output, 'raw'):
-                # Neuere CrewAI-Versionen verwenden das 'raw'-Attribut
-                summary = task_output.raw
-            elif hasattr(task_output, 'result'):
-                # Einige Versionen verwenden das 'result'-Attribut
-                summary = task_output.result
-            elif hasattr(task_output, 'output'):
-                # Andere Versionen könnten das 'output'-Attribut verwenden
-                summary = task_output.output
-            elif isinstance(task_output, str):
-                # Fallback für den Fall, dass ein String zurückgegeben wird
-                summary = task_output
-            else:
-                # Wenn wir nicht wissen, wie wir das Objekt verarbeiten sollen, versuchen wir, es als String zu konvertieren
-                summary = str(task_output)
-            
-            print(f"--- Debug (TextSummarizationTool): Summarization successful. Summary type: {type(summary)}, content: '{summary[:100]}...' ---")
-            return summary.strip() if isinstance(summary, str) else str(summary).strip()
-        except Exception as e:
-            error_msg = f"TOOL_ERROR (TextSummarizationTool): An error occurred during text summarization task execution: {e}"
-            print(f"--- Debug (TextSummarizationTool): {error_msg} ---")
-            # Versuche, spezifischere Fehler von LiteLLM oder dem LLM-Aufruf zu bekommen, falls möglich
-            if hasattr(e, 'message'):  # Typisch für manche Exception-Objekte
-                error_msg += f" Details: {e.message}"
-            elif hasattr(e, 'args') and e.args:  # Generische Exceptions haben oft Details in args
-                error_msg += f" Details: {e.args[0] if e.args else ''}"
-            return error_msg
+        print(f"--- Debug (TextSummarizationTool): Starting summarization task for Summarizer Agent. Task description preview: '{task_description[:250]}...' ---")
+        # Führe die Task aus. Die execute_sync Methode wird hier verwendet, da _run synchron ist.
+        task_output = summarization_task.execute_sync() 
+        
+        # Verarbeitung des TaskOutput-Objekts
+        # In neueren Versionen von CrewAI gibt task.execute_sync() ein TaskOutput-Objekt zurück
+        # Wir müssen prüfen, welches Attribut wir verwenden sollen
+        if hasattr(task_output, 'raw'):
+            # Neuere CrewAI-Versionen verwenden das 'raw'-Attribut
+            summary = task_output.raw
+        elif hasattr(task_output, 'result'):
+            # Einige Versionen verwenden das 'result'-Attribut
+            summary = task_output.result
+        elif hasattr(task_output, 'output'):
+            # Andere Versionen könnten das 'output'-Attribut verwenden
+            summary = task_output.output
+        elif isinstance(task_output, str):
+            # Fallback für den Fall, dass ein String zurückgegeben wird
+            summary = task_output
+        else:
+            # Wenn wir nicht wissen, wie wir das Objekt verarbeiten sollen, versuchen wir, es als String zu konvertieren
+            summary = str(task_output)
+        
+        print(f"--- Debug (TextSummarizationTool): Summarization successful. Summary type: {type(summary)}, content: '{summary[:100]}...' ---")
+        return summary.strip() if isinstance(summary, str) else str(summary).strip()
 
 # Instanz des Tools erstellen, damit es von Agenten importiert und verwendet werden kann
 text_summarization_tool = TextSummarizationTool()
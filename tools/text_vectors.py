@@ -0,0 +1,176 @@
+import math
+import os
+import re
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Sequence
+
+import numpy as np
+from scipy import sparse
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.spatial.distance import squareform
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Füllwörter ohne Aussagekraft für die Ähnlichkeit kurzer Vorschläge (Englisch und Deutsch)
+STOP_WORDS = frozenset("""
+a an and are as at be because but by can could for from has have i in into is it its of on or our should so
+than that the their them then there these this to us we will with would you your
+aber als auch auf aus bei das dass dem den der die ein eine einen für hat ist mit nicht oder sich sind und von
+wir wird zu zum zur
+""".split())
+
+# Standard-Schwelle für die Cosinus-Distanz (0 = identisch, 1 = nichts gemeinsam)
+DEFAULT_CLUSTER_DISTANCE = float(os.getenv("DEMOCRACY_CLUSTER_DISTANCE", "0.8"))
+
+# Gewicht von Vorschlagstext und Begründung beim Vektorisieren von Vorschlägen
+PROPOSAL_FIELD_WEIGHTS = (0.75, 0.25)
+
+
+@lru_cache(maxsize=1 << 16)
+def _feature_index(term: str, n_features: int) -> int:
+    # crc32 statt hash(): stabil über Prozesse hinweg (PYTHONHASHSEED)
+    return zlib.crc32(term.encode("utf-8")) % n_features
+
+
+def terms(text: str, ngram_range: Sequence[int] = (1, 2)) -> List[str]:
+    """Kleingeschriebene Wörter ohne Füllwörter plus Wort-N-Gramme."""
+    words = [word for word in _WORD_PATTERN.findall(text.lower()) if word not in STOP_WORDS]
+    result = []
+    for n in range(ngram_range[0], ngram_range[1] + 1):
+        result.extend(" ".join(words[i:i + n]) for i in range(len(words) - n + 1))
+    return result
+
+
+def hashed_term_frequencies(
+    text: str,
+    n_features: int = 1 << 18,
+    ngram_range: Sequence[int] = (1, 2),
+    weight: float = 1.0
+) -> Dict[int, float]:
+    """
+    Sublineare, L2-normierte Termfrequenzen eines einzelnen Texts als dünnes Dict
+    (Spalte -> Gewicht) für Online-Verfahren ohne Batch-IDF; skaliert mit `weight`.
+    """
+    counts: Dict[int, float] = defaultdict(float)
+    for term in terms(text, ngram_range):
+        counts[_feature_index(term, n_features)] += 1.0
+    if not counts:
+        return {}
+    values = {index: math.log1p(count) for index, count in counts.items()}
+    norm = math.sqrt(sum(value * value for value in values.values()))
+    return {index: weight * value / norm for index, value in values.items()}
+
+
+class HashingTfidfVectorizer:
+    """
+    TF-IDF ohne Vokabular: Terme werden per Hash auf `n_features` Spalten einer
+    SciPy-CSR-Matrix abgebildet. Die IDF wird pro Aufruf aus den übergebenen Texten
+    berechnet, es ist also kein Training und kein Modell-Download nötig.
+    """
+
+    def __init__(self, n_features: int = 1 << 18, ngram_range: Sequence[int] = (1, 2), sublinear_tf: bool = True):
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.sublinear_tf = sublinear_tf
+
+    def transform(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """Zeilenweise L2-normierte TF-IDF-Matrix (Texte x n_features)."""
+        indices: List[int] = []
+        indptr = [0]
+        for text in texts:
+            indices.extend(_feature_index(term, self.n_features) for term in terms(text, self.ngram_range))
+            indptr.append(len(indices))
+
+        counts = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr)),
+            shape=(len(texts), self.n_features)
+        )
+        counts.sum_duplicates()
+        if self.sublinear_tf:
+            np.log1p(counts.data, out=counts.data)
+
+        # Geglättete IDF wie üblich: ln((1 + n) / (1 + df)) + 1
+        document_frequency = np.bincount(counts.indices, minlength=self.n_features)
+        idf = np.log((1.0 + len(texts)) / (1.0 + document_frequency[counts.indices])) + 1.0
+        counts.data *= idf.astype(np.float32)
+        return l2_normalize(counts)
+
+
+def l2_normalize(matrix: sparse.spmatrix) -> sparse.csr_matrix:
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.csr_matrix(sparse.diags(1.0 / norms.astype(np.float32)) @ matrix)
+
+
+def weighted_combination(matrices: Sequence[sparse.csr_matrix], weights: Sequence[float]) -> sparse.csr_matrix:
+    """Gewichtete Summe mehrerer Vektorisierungen derselben Texte (z.B. Vorschlag und Begründung), neu normiert."""
+    combined = matrices[0] * weights[0]
+    for matrix, weight in zip(matrices[1:], weights[1:]):
+        combined = combined + matrix * weight
+    return l2_normalize(combined)
+
+
+def cosine_similarity(matrix: sparse.csr_matrix) -> np.ndarray:
+    """Paarweise Cosinus-Ähnlichkeit L2-normierter Zeilen als dichte Matrix."""
+    similarity = (matrix @ matrix.T).toarray()
+    np.clip(similarity, 0.0, 1.0, out=similarity)
+    return similarity
+
+
+def cosine_distance(matrix: sparse.csr_matrix) -> np.ndarray:
+    """Paarweise Cosinus-Distanz (0 = identisch, 1 = nichts gemeinsam) mit exakt 0 auf der Diagonalen."""
+    distance = 1.0 - cosine_similarity(matrix)
+    np.fill_diagonal(distance, 0.0)
+    return distance
+
+
+def agglomerative_clusters(
+    matrix: sparse.csr_matrix,
+    distance_threshold: float = DEFAULT_CLUSTER_DISTANCE,
+    method: str = "average"
+) -> np.ndarray:
+    """
+    Hierarchisches Clustering über die Cosinus-Distanz. Gibt pro Zeile eine
+    Cluster-Nummer (0..k-1) in der Reihenfolge des ersten Auftretens zurück.
+    """
+    if matrix.shape[0] < 2:
+        return np.zeros(matrix.shape[0], dtype=np.int64)
+    return distance_clusters(cosine_distance(matrix), distance_threshold, method)
+
+
+def distance_clusters(
+    distance: np.ndarray,
+    distance_threshold: float = DEFAULT_CLUSTER_DISTANCE,
+    method: str = "average"
+) -> np.ndarray:
+    """Wie `agglomerative_clusters`, aber auf einer bereits berechneten Distanzmatrix."""
+    count = distance.shape[0]
+    if count < 2:
+        return np.zeros(count, dtype=np.int64)
+
+    tree = linkage(squareform(distance, checks=False), method=method)
+    labels = fcluster(tree, t=distance_threshold, criterion="distance")
+
+    # fcluster nummeriert beliebig; stabil nach erstem Auftreten umnummerieren
+    _, first_positions, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    order = np.argsort(np.argsort(first_positions))
+    return order[inverse]
+
+
+def top_terms(matrix: sparse.csr_matrix, rows: Sequence[int], texts: Sequence[str], limit: int = 2) -> List[str]:
+    """Die Terme der Texte `rows` mit dem höchsten Gewicht im Schwerpunkt der Gruppe."""
+    centroid = np.asarray(matrix[list(rows)].sum(axis=0)).ravel()
+    n_features = matrix.shape[1]
+    weights = {}
+    coverage: Dict[str, int] = defaultdict(int)
+    for row in rows:
+        for term in set(terms(texts[row], (1, 1))):
+            weights[term] = centroid[_feature_index(term, n_features)]
+            coverage[term] += 1
+    # Zuerst Begriffe, die möglichst viele Texte der Gruppe teilen; bei gleichem
+    # Gewicht sind längere Wörter meist die spezifischeren
+    return sorted(
+        weights, key=lambda term: (-coverage[term], -round(float(weights[term]), 4), -len(term), term)
+    )[:limit]